@@ -0,0 +1,62 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+import copy
+from collections import OrderedDict
+from typing import Any, Tuple
+
+from hydra.core.singleton import Singleton
+from hydra.plugins.config_source import ConfigResult, ConfigSource
+
+
+class ConfigCache(metaclass=Singleton):
+    """
+    Process wide cache of parsed configs.
+    Entries are keyed by the config source and the config path, and are only used as long as
+    the cache token reported by the source (e.g. the file mtime) did not change.
+    Callers are always handed a copy of the cached config.
+    """
+
+    max_size: int
+    hits: int
+    misses: int
+
+    def __init__(self, max_size: int = 1024) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.entries: "OrderedDict[Tuple[str, str, str], Tuple[Any, ConfigResult]]" = (
+            OrderedDict()
+        )
+
+    def load_config(self, source: ConfigSource, config_path: str) -> ConfigResult:
+        token = source.get_cache_token(config_path=config_path)
+        if token is None:
+            return source.load_config(config_path=config_path)
+
+        key = (source.scheme(), source.path, config_path)
+        entry = self.entries.get(key)
+        if entry is not None and entry[0] == token:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            result = entry[1]
+        else:
+            self.misses += 1
+            result = source.load_config(config_path=config_path)
+            self.entries[key] = (token, result)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+        return ConfigResult(
+            provider=result.provider,
+            path=result.path,
+            config=copy.deepcopy(result.config),
+        )
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def instance(*args: Any, **kwargs: Any) -> "ConfigCache":
+        return Singleton.instance(ConfigCache, *args, **kwargs)  # type: ignore
@@ -4,7 +4,9 @@ Configuration loader
 """
 import copy
 import os
-from typing import List, Optional
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
 from omegaconf import DictConfig, ListConfig, OmegaConf, open_dict
 
@@ -12,10 +14,41 @@ from hydra._internal.config_repository import ConfigRepository
 from hydra.core.config_loader import ConfigLoader, LoadTrace
 from hydra.core.config_search_path import ConfigSearchPath
 from hydra.core.object_type import ObjectType
+from hydra.core.phase_timer import PhaseTimer
 from hydra.core.utils import JobRuntime, get_overrides_dirname, split_key_val
 from hydra.errors import MissingConfigException
 from hydra.plugins.config_source import ConfigSource
 
+# A single step in a composition plan: (family, filename, required)
+PlanStep = Tuple[str, str, bool]
+# Key of a memoized config: the steps merged to produce it, with the cache token of their config
+MemoKey = Tuple[Tuple[PlanStep, Any], ...]
+
+
+class CompositionMemo:
+    """
+    Bounded LRU memo of merged configs, keyed by the prefix of composition plan steps
+    merged to produce them. The load traces of the last step are kept with each config.
+    """
+
+    def __init__(self, max_size: int = 256) -> None:
+        self.max_size = max_size
+        self.entries: "OrderedDict[MemoKey, Tuple[DictConfig, List[LoadTrace]]]" = (
+            OrderedDict()
+        )
+
+    def get(self, key: MemoKey) -> Optional[Tuple[DictConfig, List[LoadTrace]]]:
+        ret = self.entries.get(key)
+        if ret is not None:
+            self.entries.move_to_end(key)
+        return ret
+
+    def put(self, key: MemoKey, cfg: DictConfig, traces: List[LoadTrace]) -> None:
+        self.entries[key] = (cfg, traces)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
 
 class ConfigLoaderImpl(ConfigLoader):
     """
@@ -33,6 +66,13 @@ class ConfigLoaderImpl(ConfigLoader):
         self.repository: ConfigRepository = ConfigRepository(
             config_search_path=config_search_path
         )
+        # Set while composing several configs that are sharing the defaults prefix
+        self.composition_memo: Optional[CompositionMemo] = None
+        # Sweep jobs are composed against a fixed master config, memoize across them
+        self.sweep_memo = CompositionMemo()
+        # sweep configs composed by the sweeper, see keep_sweep_configs()
+        self.kept_master_config: Optional[DictConfig] = None
+        self.kept_sweep_configs: Dict[Tuple[str, ...], DictConfig] = {}
 
     def load_configuration(
         self,
@@ -49,6 +89,8 @@ class ConfigLoaderImpl(ConfigLoader):
         assert overrides is None or isinstance(overrides, list)
         overrides = copy.deepcopy(overrides) or []
 
+        # the index of the search path is checked for changes once per composition
+        self.repository.revalidate()
         if config_file is not None and not self.exists_in_search_path(config_file):
             raise MissingConfigException(
                 missing_cfg_file=config_file,
@@ -115,15 +157,20 @@ class ConfigLoaderImpl(ConfigLoader):
     def load_sweep_config(
         self, master_config: DictConfig, sweep_overrides: List[str]
     ) -> DictConfig:
+        if master_config is self.kept_master_config:
+            kept = self.kept_sweep_configs.pop(tuple(sweep_overrides), None)
+            if kept is not None:
+                return kept
         # Recreate the config for this sweep instance with the appropriate overrides
         overrides = OmegaConf.to_container(master_config.hydra.overrides.hydra)
         assert isinstance(overrides, list)
         overrides = overrides + sweep_overrides
-        sweep_config = self.load_configuration(
-            config_file=master_config.hydra.job.config_file,
-            strict=self.default_strict,
-            overrides=overrides,
-        )
+        with self._memoized(self.sweep_memo):
+            sweep_config = self.load_configuration(
+                config_file=master_config.hydra.job.config_file,
+                strict=self.default_strict,
+                overrides=overrides,
+            )
 
         with open_dict(sweep_config):
             sweep_config.hydra.runtime.merge_with(master_config.hydra.runtime)
@@ -133,6 +180,37 @@ class ConfigLoaderImpl(ConfigLoader):
 
         return sweep_config
 
+    def keep_sweep_configs(
+        self,
+        master_config: DictConfig,
+        sweep_configs: Dict[Tuple[str, ...], DictConfig],
+    ) -> None:
+        self.kept_master_config = master_config if len(sweep_configs) > 0 else None
+        self.kept_sweep_configs = dict(sweep_configs)
+
+    def compose_many(
+        self,
+        config_file: Optional[str],
+        overrides_list: Sequence[List[str]],
+        strict: Optional[bool] = None,
+    ) -> List[DictConfig]:
+        with self._memoized(CompositionMemo()):
+            return [
+                self.load_configuration(
+                    config_file=config_file, overrides=list(overrides), strict=strict
+                )
+                for overrides in overrides_list
+            ]
+
+    @contextmanager
+    def _memoized(self, memo: CompositionMemo) -> Iterator[None]:
+        prev = self.composition_memo
+        self.composition_memo = memo
+        try:
+            yield
+        finally:
+            self.composition_memo = prev
+
     def exists_in_search_path(self, filepath: str) -> bool:
         return self.repository.exists(filepath)
 
@@ -229,7 +307,8 @@ class ConfigLoaderImpl(ConfigLoader):
         :return: the loaded config or None if it was not found
         """
 
-        ret = self.repository.load_config(config_path=input_file)
+        with PhaseTimer.instance().phase(input_file, kind="config"):
+            ret = self.repository.load_config(config_path=input_file)
         if record_load:
             if ret is None:
                 self.all_config_checked.append(
@@ -261,76 +340,49 @@ class ConfigLoaderImpl(ConfigLoader):
     ) -> List[str]:
         return self.repository.get_group_options(group_name, results_filter)
 
-    def _merge_config(
-        self, cfg: DictConfig, family: str, name: str, required: bool
-    ) -> DictConfig:
+    def _load_default(
+        self, family: str, name: str, required: bool
+    ) -> Optional[DictConfig]:
+        """
+        :return: the loaded config, or None if an optional config was not found
+        """
+        new_cfg = ConfigLoaderImpl._get_default_path(family=family, name=name)
+        loaded_cfg = self._load_config_impl(new_cfg)
+        if loaded_cfg is None and required:
+            if family == "":
+                msg = "Could not load {}".format(new_cfg)
+                raise MissingConfigException(msg, new_cfg)
+            else:
+                options = self.get_group_options(family)
+                if options:
+                    msg = "Could not load {}, available options:\n{}:\n\t{}".format(
+                        new_cfg, family, "\n\t".join(options)
+                    )
+                else:
+                    msg = "Could not load {}".format(new_cfg)
+                raise MissingConfigException(msg, new_cfg, options)
+        return loaded_cfg
 
+    @staticmethod
+    def _get_default_path(family: str, name: str) -> str:
         if family != "":
-            new_cfg = "{}/{}".format(family, name)
+            return "{}/{}".format(family, name)
         else:
-            new_cfg = name
+            return name
 
-        loaded_cfg = self._load_config_impl(new_cfg)
+    def _merge_config(
+        self, cfg: DictConfig, family: str, name: str, required: bool
+    ) -> DictConfig:
+        loaded_cfg = self._load_default(family=family, name=name, required=required)
         if loaded_cfg is None:
-            if required:
-                if family == "":
-                    msg = "Could not load {}".format(new_cfg)
-                    raise MissingConfigException(msg, new_cfg)
-                else:
-                    options = self.get_group_options(family)
-                    if options:
-                        msg = "Could not load {}, available options:\n{}:\n\t{}".format(
-                            new_cfg, family, "\n\t".join(options)
-                        )
-                    else:
-                        msg = "Could not load {}".format(new_cfg)
-                    raise MissingConfigException(msg, new_cfg, options)
-            else:
-                return cfg
-
-        else:
-            ret = OmegaConf.merge(cfg, loaded_cfg)
-            assert isinstance(ret, DictConfig)
-            return ret
+            return cfg
+        ret = OmegaConf.merge(cfg, loaded_cfg)
+        assert isinstance(ret, DictConfig)
+        return ret
 
     def _merge_defaults(
         self, cfg: DictConfig, defaults: ListConfig, split_at: int
     ) -> DictConfig:
-        def get_filename(config_name: str) -> str:
-            filename, ext = os.path.splitext(config_name)
-            if ext not in (".yaml", ".yml"):
-                config_name = "{}{}".format(config_name, ".yaml")
-            return config_name
-
-        def merge_defaults(merged_cfg: DictConfig, def_list: ListConfig) -> DictConfig:
-            cfg_with_list = OmegaConf.create(dict(defaults=def_list))
-            for default1 in cfg_with_list.defaults:
-                if isinstance(default1, DictConfig):
-                    is_optional = False
-                    if default1.optional is not None:
-                        is_optional = default1.optional
-                        del default1["optional"]
-                    family = next(iter(default1.keys()))
-                    name = default1[family]
-                    # Name is none if default value is removed
-                    if name is not None and "_SKIP_" not in name:
-                        merged_cfg = self._merge_config(
-                            cfg=merged_cfg,
-                            family=family,
-                            name=get_filename(name),
-                            required=not is_optional,
-                        )
-                else:
-                    assert isinstance(default1, str)
-                    if "_SKIP_" not in default1:
-                        merged_cfg = self._merge_config(
-                            cfg=merged_cfg,
-                            family="",
-                            name=get_filename(default1),
-                            required=True,
-                        )
-            return merged_cfg
-
         system_list: ListConfig = OmegaConf.create([])
         user_list: ListConfig = OmegaConf.create([])
         for default in defaults:
@@ -338,13 +390,95 @@ class ConfigLoaderImpl(ConfigLoader):
                 system_list.append(default)
             else:
                 user_list.append(default)
-        cfg = merge_defaults(cfg, system_list)
-        cfg = merge_defaults(cfg, user_list)
+        plan = ConfigLoaderImpl._compile_defaults(
+            system_list
+        ) + ConfigLoaderImpl._compile_defaults(user_list)
+        memo = self.composition_memo
+        if memo is None:
+            # Load all the configs first and merge them in a single pass.
+            # Merging one at a time copies the growing config for every default.
+            loaded = []
+            for family, name, required in plan:
+                loaded_cfg = self._load_default(
+                    family=family, name=name, required=required
+                )
+                if loaded_cfg is not None:
+                    loaded.append(loaded_cfg)
+            ret = OmegaConf.merge(cfg, *loaded)
+            assert isinstance(ret, DictConfig)
+            cfg = ret
+        else:
+            # Reuse the merged prefix shared with previously composed configs,
+            # only the remaining suffix of the plan is merged.
+            # The cache tokens in the key invalidate the configs merged from changed files,
+            # starting with hydra.yaml that cfg was loaded from.
+            token = self.repository.get_cache_token("hydra.yaml")
+            key: Optional[MemoKey] = None if token is None else (
+                (("", "hydra.yaml", True), token),
+            )
+            for step in plan:
+                family, name, required = step
+                if key is not None:
+                    token = self.repository.get_cache_token(
+                        ConfigLoaderImpl._get_default_path(family=family, name=name)
+                    )
+                    # configs from sources that do not support caching are not memoized
+                    key = None if token is None else key + ((step, token),)
+                entry = memo.get(key) if key is not None else None
+                if entry is None:
+                    num_checked = len(self.all_config_checked)
+                    cfg = self._merge_config(
+                        cfg=cfg, family=family, name=name, required=required
+                    )
+                    if key is not None:
+                        memo.put(key, cfg, self.all_config_checked[num_checked:])
+                else:
+                    cfg, traces = entry
+                    self.all_config_checked.extend(traces)
+            # memoized nodes are shared, the caller is getting its own copy
+            cfg = copy.deepcopy(cfg)
 
         if "defaults" in cfg:
             del cfg["defaults"]
         return cfg
 
+    @staticmethod
+    def _compile_defaults(def_list: ListConfig) -> List[PlanStep]:
+        """
+        Compiles the defaults list into the list of configs to merge, in order.
+        Each step is a (family, filename, required) tuple.
+        """
+
+        def get_filename(config_name: str) -> str:
+            filename, ext = os.path.splitext(config_name)
+            if ext not in (".yaml", ".yml"):
+                config_name = "{}{}".format(config_name, ".yaml")
+            return config_name
+
+        # interpolations in the defaults list are relative to the list itself
+        cfg_with_list = OmegaConf.create(dict(defaults=def_list))
+        plan: List[PlanStep] = []
+        for default in cfg_with_list.defaults:
+            if isinstance(default, DictConfig):
+                is_optional = False
+                family = None
+                name = None
+                for key, value in default.items():
+                    if key == "optional":
+                        is_optional = value
+                    else:
+                        family = key
+                        name = value
+                assert family is not None
+                # Name is none if default value is removed
+                if name is not None and "_SKIP_" not in name:
+                    plan.append((family, get_filename(name), not is_optional))
+            else:
+                assert isinstance(default, str)
+                if "_SKIP_" not in default:
+                    plan.append(("", get_filename(default), True))
+        return plan
+
     def _create_cfg(
         self, cfg_filename: Optional[str], record_load: bool = True
     ) -> DictConfig:
@@ -1,13 +1,34 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from hydra.core.config_search_path import ConfigSearchPath
 from hydra.core.object_type import ObjectType
 from hydra.plugins.config_source import ConfigResult, ConfigSource
 
+from .config_cache import ConfigCache
 from .sources_registry import SourcesRegistry
 
 
+class GroupIndex:
+    """
+    The entries of a single group in all the sources of the search path.
+    """
+
+    # Cache tokens of the group in each source, used to detect changes
+    tokens: List[Optional[Any]]
+    # Raw entries of the group in each source, None for sources that does not support listing
+    entries: List[Optional[Dict[str, ObjectType]]]
+
+    def __init__(
+        self,
+        tokens: List[Optional[Any]],
+        entries: List[Optional[Dict[str, ObjectType]]],
+    ) -> None:
+        self.tokens = tokens
+        self.entries = entries
+        self.options: Dict[Optional[ObjectType], List[str]] = {}
+
+
 class ConfigRepository:
 
     config_search_path: ConfigSearchPath
@@ -21,33 +42,138 @@ class ConfigRepository:
             scheme = self._get_scheme(search_path.path)
             source_type = SourcesRegistry.instance().resolve(scheme)
             self.sources.append(source_type(search_path.provider, search_path.path))
+        self.index: Dict[str, GroupIndex] = {}
+        # groups whose index was checked against the cache tokens of the sources since the
+        # last call to revalidate()
+        self.validated: Set[str] = set()
 
     def load_config(self, config_path: str) -> Optional[ConfigResult]:
         source = self._find_config(config_path=config_path)
         ret = None
         if source is not None:
-            ret = source.load_config(config_path=config_path)
+            ret = ConfigCache.instance().load_config(
+                source=source, config_path=config_path
+            )
         return ret
 
     def exists(self, config_path: str) -> bool:
         return self._find_config(config_path) is not None
 
+    def get_cache_token(self, config_path: str) -> Optional[Any]:
+        """
+        :param config_path: path of a config in the search path
+        :return: a token that changes whenever the config changes, including when it is added
+                 to another source of the search path. None if the source of the config does
+                 not support caching.
+        """
+        source = self._find_config(config_path=config_path)
+        if source is None:
+            # adding the config changes the index of its group
+            return ()
+        token = source.get_cache_token(config_path=config_path)
+        if token is None:
+            return None
+        return source.scheme(), source.path, token
+
     def get_group_options(
         self, group_name: str, results_filter: Optional[ObjectType] = ObjectType.CONFIG
     ) -> List[str]:
-        options: List[str] = []
-        for source in self.sources:
-            object_type = source.get_type(config_path=group_name)
-            if object_type == ObjectType.GROUP:
-                options.extend(
-                    source.list(config_path=group_name, results_filter=results_filter)
-                )
-        return sorted(list(set(options)))
+        group_index = self._get_group_index(group_name.rstrip("/"))
+        options = group_index.options.get(results_filter)
+        if options is None:
+            options = self._compute_group_options(
+                group_name, group_index, results_filter
+            )
+            group_index.options[results_filter] = options
+        return list(options)
 
     def get_sources(self) -> List[ConfigSource]:
         return self.sources
 
+    def invalidate(self) -> None:
+        """
+        Drops the index of the search path and the caches of the sources, they are rebuilt on demand
+        """
+        self.index.clear()
+        self.validated.clear()
+        for source in self.sources:
+            source.invalidate()
+
+    def revalidate(self) -> None:
+        """
+        The next lookup in each group checks the cache tokens of the sources again.
+        Called once per composition: the sources are not probed for every lookup, and changes
+        made while a config is composed are only seen by the next composition.
+        """
+        self.validated.clear()
+
+    def _compute_group_options(
+        self,
+        group_name: str,
+        group_index: GroupIndex,
+        results_filter: Optional[ObjectType],
+    ) -> List[str]:
+        filtered = ["__pycache__", "__init__.py"]
+        options: List[str] = []
+        for source, entries in zip(self.sources, group_index.entries):
+            if entries is None:
+                object_type = source.get_type(config_path=group_name)
+                if object_type == ObjectType.GROUP:
+                    options.extend(
+                        source.list(
+                            config_path=group_name, results_filter=results_filter
+                        )
+                    )
+                continue
+            for name, object_type in entries.items():
+                if name in filtered:
+                    continue
+                if object_type == ObjectType.GROUP and results_filter in (
+                    None,
+                    ObjectType.GROUP,
+                ):
+                    options.append(name)
+                if object_type == ObjectType.CONFIG and results_filter in (
+                    None,
+                    ObjectType.CONFIG,
+                ):
+                    last_dot = name.rfind(".")
+                    if last_dot != -1:
+                        name = name[0:last_dot]
+                    options.append(name)
+        return sorted(list(set(options)))
+
+    def _get_group_index(self, group_name: str) -> GroupIndex:
+        group_index = self.index.get(group_name)
+        if group_index is not None and group_name in self.validated:
+            return group_index
+        tokens = [
+            source.get_cache_token(config_path=group_name) for source in self.sources
+        ]
+        self.validated.add(group_name)
+        if group_index is None or group_index.tokens != tokens:
+            entries = [
+                source.list_entries(config_path=group_name) for source in self.sources
+            ]
+            group_index = GroupIndex(tokens=tokens, entries=entries)
+            self.index[group_name] = group_index
+        return group_index
+
     def _find_config(self, config_path: str) -> Optional[ConfigSource]:
+        group_name, name = self._split_group_and_name(config_path)
+        if name is None:
+            return self._probe_config(config_path)
+
+        group_index = self._get_group_index(group_name)
+        for source, entries in zip(self.sources, group_index.entries):
+            if entries is None:
+                if source.exists(config_path):
+                    return source
+            elif name in entries:
+                return source
+        return None
+
+    def _probe_config(self, config_path: str) -> Optional[ConfigSource]:
         found_source = None
         for source in self.sources:
             if source.exists(config_path):
@@ -55,6 +181,20 @@ class ConfigRepository:
                 break
         return found_source
 
+    @staticmethod
+    def _split_group_and_name(config_path: str) -> Tuple[str, Optional[str]]:
+        """
+        :return: the group and the name of the object in it, name is None for paths the
+                 index cannot handle (the root and relative or absolute paths).
+        """
+        path = config_path.rstrip("/")
+        if path == "" or path.startswith("/") or ".." in path.split("/"):
+            return "", None
+        idx = path.rfind("/")
+        if idx == -1:
+            return "", path
+        return path[0:idx], path[idx + 1 :]
+
     @staticmethod
     def _get_scheme(path: str) -> str:
         idx = path.find("://")
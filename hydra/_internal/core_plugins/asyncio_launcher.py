@@ -0,0 +1,150 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+"""
+Launcher running the jobs of a batch concurrently in an asyncio event loop.
+The task function can be an async function (async def).
+"""
+import asyncio
+import contextvars
+import inspect
+import logging
+import traceback
+from pathlib import Path
+from typing import Any, List, Optional, Sequence, Tuple
+
+from omegaconf import DictConfig, open_dict
+
+from hydra.core.config_loader import ConfigLoader
+from hydra.core.utils import (
+    JobReturn,
+    JobStatus,
+    configure_log,
+    failed_job_return,
+    filter_overrides,
+    run_job,
+    run_job_async,
+    setup_globals,
+)
+from hydra.plugins.launcher import Launcher
+from hydra.types import TaskFunction
+
+log = logging.getLogger(__name__)
+
+
+class AsyncioLauncher(Launcher):
+    def __init__(self, max_concurrency: Optional[int] = None) -> None:
+        """
+        :param max_concurrency: maximum number of jobs running concurrently, None for no limit.
+        Jobs with a regular task function run in the default executor of the event loop,
+        which also limits their concurrency.
+        """
+        super().__init__()
+        if max_concurrency is not None and max_concurrency <= 0:
+            raise ValueError(
+                f"max_concurrency must be a positive number, got {max_concurrency}"
+            )
+        self.max_concurrency = max_concurrency
+        self.config: Optional[DictConfig] = None
+        self.config_loader: Optional[ConfigLoader] = None
+        self.task_function: Optional[TaskFunction] = None
+
+    def setup(
+        self,
+        config: DictConfig,
+        config_loader: ConfigLoader,
+        task_function: TaskFunction,
+    ) -> None:
+        self.config = config
+        self.config_loader = config_loader
+        self.task_function = task_function
+
+    @staticmethod
+    def _is_async(task_function: Any) -> bool:
+        if inspect.iscoroutinefunction(task_function):
+            return True
+        # an object with an async __call__
+        return inspect.iscoroutinefunction(getattr(task_function, "__call__", None))
+
+    async def _run_job(
+        self, sweep_config: DictConfig, semaphore: Optional[asyncio.Semaphore]
+    ) -> JobReturn:
+        assert self.task_function is not None
+        if semaphore is not None:
+            async with semaphore:
+                return await self._run_job(sweep_config, None)
+        try:
+            if self._is_async(self.task_function):
+                return await run_job_async(
+                    config=sweep_config,
+                    task_function=self.task_function,
+                    job_dir_key="hydra.sweep.dir",
+                    job_subdir_key="hydra.sweep.subdir",
+                )
+            task_function = self.task_function
+
+            def run() -> JobReturn:
+                return run_job(
+                    config=sweep_config,
+                    task_function=task_function,
+                    job_dir_key="hydra.sweep.dir",
+                    job_subdir_key="hydra.sweep.subdir",
+                    configure_logging=False,
+                )
+
+            # run the job in a copy of the context of this task
+            loop = asyncio.get_event_loop()
+            context = contextvars.copy_context()
+            return await loop.run_in_executor(None, context.run, run)
+        except Exception:
+            return failed_job_return(sweep_config, traceback.format_exc())
+
+    async def _run_jobs(self, sweep_configs: List[DictConfig]) -> List[JobReturn]:
+        semaphore = None
+        if self.max_concurrency is not None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+        # each task runs in a copy of the context
+        runs = await asyncio.gather(
+            *[self._run_job(sweep_config, semaphore) for sweep_config in sweep_configs]
+        )
+        return list(runs)
+
+    def launch(
+        self, job_overrides: Sequence[Sequence[str]], initial_job_idx: int
+    ) -> Sequence[JobReturn]:
+        setup_globals()
+        assert self.config is not None
+        assert self.task_function is not None
+        assert self.config_loader is not None
+
+        configure_log(self.config.hydra.hydra_logging, self.config.hydra.verbose)
+        sweep_dir = self.config.hydra.sweep.dir
+        Path(str(sweep_dir)).mkdir(parents=True, exist_ok=True)
+        log.info(
+            "Launching {} jobs in an asyncio event loop".format(len(job_overrides))
+        )
+
+        sweep_configs: List[Tuple[int, DictConfig]] = []
+        for idx, overrides in enumerate(job_overrides):
+            idx = initial_job_idx + idx
+            log.info("\t#{} : {}".format(idx, " ".join(filter_overrides(overrides))))
+            sweep_config = self.config_loader.load_sweep_config(
+                self.config, list(overrides)
+            )
+            with open_dict(sweep_config):
+                sweep_config.hydra.job.id = idx
+                sweep_config.hydra.job.num = idx
+                # the working directory is shared by all the jobs
+                sweep_config.hydra.job.chdir = False
+            sweep_configs.append((idx, sweep_config))
+
+        loop = asyncio.new_event_loop()
+        try:
+            runs = loop.run_until_complete(
+                self._run_jobs([sweep_config for _, sweep_config in sweep_configs])
+            )
+        finally:
+            loop.close()
+
+        for (idx, _), ret in zip(sweep_configs, runs):
+            if ret.status == JobStatus.FAILED:
+                log.error("Job #{} failed:\n{}".format(idx, ret.error))
+        return runs
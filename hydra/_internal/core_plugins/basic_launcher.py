@@ -6,13 +6,16 @@ from typing import List, Optional, Sequence
 from omegaconf import DictConfig, open_dict
 
 from hydra.core.config_loader import ConfigLoader
-from hydra.core.hydra_config import HydraConfig
 from hydra.core.utils import (
     JobReturn,
+    close_sweep_logging,
     configure_log,
     filter_overrides,
-    run_job,
+    get_jobs_per_task,
+    open_sweep_log,
+    run_job_pack,
     setup_globals,
+    split_into_packs,
 )
 from hydra.plugins.launcher import Launcher
 from hydra.types import TaskFunction
@@ -37,7 +40,9 @@ class BasicLauncher(Launcher):
         self.config_loader = config_loader
         self.task_function = task_function
 
-    def launch(self, job_overrides: Sequence[Sequence[str]]) -> Sequence[JobReturn]:
+    def launch(
+        self, job_overrides: Sequence[Sequence[str]], initial_job_idx: int
+    ) -> Sequence[JobReturn]:
         setup_globals()
         assert self.config is not None
         assert self.task_function is not None
@@ -46,24 +51,37 @@ class BasicLauncher(Launcher):
         configure_log(self.config.hydra.hydra_logging, self.config.hydra.verbose)
         sweep_dir = self.config.hydra.sweep.dir
         Path(str(sweep_dir)).mkdir(parents=True, exist_ok=True)
+        jobs_per_task = get_jobs_per_task(self.config)
         log.info("Launching {} jobs locally".format(len(job_overrides)))
         runs: List[JobReturn] = []
 
-        for idx, overrides in enumerate(job_overrides):
-            log.info("\t#{} : {}".format(idx, " ".join(filter_overrides(overrides))))
-            sweep_config = self.config_loader.load_sweep_config(
-                self.config, list(overrides)
-            )
-            with open_dict(sweep_config):
-                sweep_config.hydra.job.id = idx
-                sweep_config.hydra.job.num = idx
-            HydraConfig.instance().set_config(sweep_config)
-            ret = run_job(
-                config=sweep_config,
-                task_function=self.task_function,
-                job_dir_key="hydra.sweep.dir",
-                job_subdir_key="hydra.sweep.subdir",
-            )
-            runs.append(ret)
-            configure_log(self.config.hydra.hydra_logging, self.config.hydra.verbose)
+        indexed_overrides = list(enumerate(job_overrides, initial_job_idx))
+        sweep_log = open_sweep_log(self.config)
+        try:
+            for pack in split_into_packs(indexed_overrides, jobs_per_task):
+                sweep_configs = []
+                for idx, overrides in pack:
+                    log.info(
+                        "\t#{} : {}".format(idx, " ".join(filter_overrides(overrides)))
+                    )
+                    sweep_config = self.config_loader.load_sweep_config(
+                        self.config, list(overrides)
+                    )
+                    with open_dict(sweep_config):
+                        sweep_config.hydra.job.id = idx
+                        sweep_config.hydra.job.num = idx
+                    sweep_configs.append(sweep_config)
+                runs.extend(
+                    run_job_pack(
+                        configs=sweep_configs,
+                        task_function=self.task_function,
+                        job_dir_key="hydra.sweep.dir",
+                        job_subdir_key="hydra.sweep.subdir",
+                    )
+                )
+                configure_log(
+                    self.config.hydra.hydra_logging, self.config.hydra.verbose
+                )
+        finally:
+            close_sweep_logging(self.config, sweep_log)
         return runs
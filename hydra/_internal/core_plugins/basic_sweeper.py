@@ -12,44 +12,404 @@ Basic Sweeper would generate 6 jobs:
 2,20
 3,10
 3,20
+
+A range of values can be specified with range(start,stop[,step]), for example:
+python foo.py lr=range(0,1,0.25)
+would sweep lr over 0, 0.25, 0.5 and 0.75.
+
+Combinations are generated lazily and are launched in batches of up to max_batch_size jobs.
+With a reducer, the batches have up to REDUCER_BATCH_SIZE jobs by default.
+
+A sweep can be split into num_shards disjoint shards, e.g. to run it on multiple machines.
+Each shard runs a contiguous block of the jobs and keeps the job numbers of the full sweep.
+
+With hydra.memo.enabled=true, jobs in a batch with the same task config are only launched once.
+
+With resume=true, jobs that already completed in the sweep dir are not launched again,
+their results are loaded from their output dir.
 """
 import copy
-import itertools
-from typing import Optional, Sequence
+import logging
+import re
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union, overload
+
+from omegaconf import DictConfig, OmegaConf
 
-from hydra.core.utils import JobReturn
+from hydra.core.job_memo import config_hash
+from hydra.core.utils import (
+    JobReturn,
+    JobStatus,
+    find_job_dirs,
+    load_job_return,
+    load_job_status,
+)
 from hydra.plugins.step_sweeper import StepSweeper
 
+log = logging.getLogger(__name__)
+
+_RANGE_RE = re.compile(r"^range\((.*)\)$")
+
+# max_batch_size when a reducer is set and max_batch_size is not, the reducer only
+# receives the results of the jobs once their batch is complete
+REDUCER_BATCH_SIZE = 100
+
+
+class RangeSequence(Sequence[str]):
+    """
+    Lazy sequence of the values of range(start, stop, step).
+    Supports decimal numbers, values are computed as needed.
+    """
+
+    def __init__(self, start: Decimal, stop: Decimal, step: Decimal) -> None:
+        if step == 0:
+            raise ValueError("range() step must not be zero")
+        self.start = start
+        self.stop = stop
+        self.step = step
+        # integer ranges produce integers, other ranges produce floats
+        self.is_int = all(
+            isinstance(n.as_tuple().exponent, int) and n.as_tuple().exponent >= 0
+            for n in (start, stop, step)
+        )
+        length = (stop - start) / step
+        integral = length.to_integral_value(rounding="ROUND_CEILING")
+        self.length = max(0, int(integral))
+
+    def __len__(self) -> int:
+        return self.length
+
+    @overload
+    def __getitem__(self, idx: int) -> str:
+        ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> Sequence[str]:
+        ...
+
+    def __getitem__(self, idx: Union[int, slice]) -> Union[str, Sequence[str]]:
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(self.length))]
+        if idx < 0:
+            idx += self.length
+        if idx < 0 or idx >= self.length:
+            raise IndexError("range index out of range")
+        value = self.start + self.step * idx
+        if self.is_int:
+            return str(int(value))
+        ret = format(value, "f")
+        if "." in ret:
+            ret = ret.rstrip("0")
+        if ret.endswith("."):
+            ret = ret + "0"
+        elif "." not in ret:
+            ret = ret + ".0"
+        return ret
+
+    def __repr__(self) -> str:
+        return f"range({self.start},{self.stop},{self.step})"
+
+
+def parse_range(value: str) -> Optional[RangeSequence]:
+    """
+    :param value: an override value
+    :return: a RangeSequence if the value is in the form range(start,stop[,step]), None otherwise
+    """
+    match = _RANGE_RE.match(value.strip())
+    if match is None:
+        return None
+    args = [a.strip() for a in match.group(1).split(",")]
+    try:
+        numbers = [Decimal(a) for a in args]
+    except InvalidOperation:
+        raise ValueError(f"Invalid range '{value}', arguments must be numbers")
+    if not all(n.is_finite() for n in numbers):
+        raise ValueError(f"Invalid range '{value}', arguments must be finite numbers")
+    if len(numbers) == 1:
+        return RangeSequence(Decimal(0), numbers[0], Decimal(1))
+    elif len(numbers) == 2:
+        return RangeSequence(numbers[0], numbers[1], Decimal(1))
+    elif len(numbers) == 3:
+        return RangeSequence(numbers[0], numbers[1], numbers[2])
+    else:
+        raise ValueError(f"Invalid range '{value}', expected range(start,stop[,step])")
+
+
+def parse_sweep_values(value: str) -> Sequence[str]:
+    """
+    :param value: an override value, e.g. 1,2,3 or range(0,10)
+    :return: the values to sweep over
+    """
+    range_values = parse_range(value)
+    if range_values is not None:
+        return range_values
+    return value.split(",")
+
+
+class SweepGrid(Sequence[List[str]]):
+    """
+    The cartesian product of the values of all the sweep arguments, in the same order as
+    itertools.product.
+    Combinations are not stored, the combination of any index is computed directly.
+    """
+
+    def __init__(self, arguments: Sequence[str]) -> None:
+        self.keys: List[str] = []
+        self.values: List[Sequence[str]] = []
+        for s in arguments:
+            key, value = s.split("=", 1)
+            self.keys.append(key)
+            self.values.append(parse_sweep_values(value))
+        self.length = 1
+        for values in self.values:
+            self.length *= len(values)
+
+    def __len__(self) -> int:
+        return self.length
+
+    @overload
+    def __getitem__(self, idx: int) -> List[str]:
+        ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> Sequence[List[str]]:
+        ...
+
+    def __getitem__(
+        self, idx: Union[int, slice]
+    ) -> Union[List[str], Sequence[List[str]]]:
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(self.length))]
+        if idx < 0:
+            idx += self.length
+        if idx < 0 or idx >= self.length:
+            raise IndexError("sweep index out of range")
+        # mixed radix decomposition, the last argument changes the fastest
+        ret: List[str] = [""] * len(self.keys)
+        for pos in reversed(range(len(self.keys))):
+            values = self.values[pos]
+            idx, value_idx = divmod(idx, len(values))
+            ret[pos] = "{}={}".format(self.keys[pos], values[value_idx])
+        return ret
+
 
 class BasicSweeper(StepSweeper):
     """
     Basic sweeper
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        max_batch_size: Optional[int] = None,
+        shard_index: int = 0,
+        num_shards: int = 1,
+        resume: bool = False,
+    ) -> None:
         """
         Instantiates
+        :param max_batch_size: maximum number of jobs to launch in a single batch, None for all
+               (REDUCER_BATCH_SIZE with a reducer)
+        :param shard_index: index of the shard of the sweep to run, in [0, num_shards)
+        :param num_shards: number of shards the sweep is split into
+        :param resume: True to skip the jobs already completed in the sweep dir
         """
         super(BasicSweeper, self).__init__()
+        if max_batch_size is not None and max_batch_size <= 0:
+            raise ValueError(
+                f"max_batch_size must be a positive number, got {max_batch_size}"
+            )
+        if num_shards <= 0:
+            raise ValueError(f"num_shards must be a positive number, got {num_shards}")
+        if shard_index < 0 or shard_index >= num_shards:
+            raise ValueError(
+                f"shard_index must be in [0, {num_shards}), got {shard_index}"
+            )
+        self.max_batch_size = max_batch_size
+        self.shard_index = shard_index
+        self.num_shards = num_shards
+        self.resume = resume
+        # sorted overrides -> working dir of the jobs completed in the sweep dir
+        self.completed_jobs: Dict[Tuple[str, ...], Path] = {}
+        self.grid: Optional[SweepGrid] = None
+        self.next_job_idx = 0
+        self.end_job_idx = 0
+        self.batch_job_idx = 0
         self.job_results: Optional[Sequence[JobReturn]] = None
 
+    def get_shard_range(self, num_jobs: int) -> Tuple[int, int]:
+        """
+        Shards are contiguous blocks of jobs with sizes that differ by at most one job.
+        :return: the range [start, stop) of the job numbers in this shard
+        """
+        start = num_jobs * self.shard_index // self.num_shards
+        stop = num_jobs * (self.shard_index + 1) // self.num_shards
+        return start, stop
+
+    def sweep(self, arguments: List[str]) -> Any:
+        self.grid = SweepGrid(arguments)
+        if self.resume:
+            self.completed_jobs = self.find_completed_jobs()
+        self.next_job_idx, self.end_job_idx = self.get_shard_range(len(self.grid))
+        if self.num_shards > 1:
+            log.info(
+                "Running shard {} of {} : jobs {} to {} of {}".format(
+                    self.shard_index,
+                    self.num_shards,
+                    self.next_job_idx,
+                    self.end_job_idx - 1,
+                    len(self.grid),
+                )
+            )
+        return super(BasicSweeper, self).sweep(arguments)
+
     def get_job_batch(self) -> Sequence[Sequence[str]]:
         """
         :return: A list of lists of strings, each inner list is the overrides for a single job
         that should be executed.
         """
+        assert self.grid is not None
+        start = self.next_job_idx
+        stop = self.end_job_idx
+        max_batch_size = self.max_batch_size
+        if max_batch_size is None and self.reducer is not None:
+            max_batch_size = REDUCER_BATCH_SIZE
+        if max_batch_size is not None:
+            stop = min(stop, start + max_batch_size)
+        self.batch_job_idx = start
+        self.next_job_idx = stop
+        return self.grid[start:stop]
+
+    def get_initial_job_idx(self) -> int:
+        return self.batch_job_idx
+
+    def find_completed_jobs(self) -> Dict[Tuple[str, ...], Path]:
+        """
+        :return: the working dirs of the jobs completed in the sweep dir, keyed by their sorted overrides
+        """
+        assert self.config is not None
+        ret: Dict[Tuple[str, ...], Path] = {}
+        output_subdir = self.config.hydra.output_subdir
+        sweep_dir = Path(str(self.config.hydra.sweep.dir))
+        if output_subdir is None:
+            log.warning("hydra.output_subdir is not set, can't resume the sweep")
+            return ret
+        for job_dir in find_job_dirs(sweep_dir, output_subdir):
+            marker = load_job_status(job_dir / output_subdir)
+            if marker is None or marker.status != JobStatus.COMPLETED.name:
+                continue
+            overrides_file = job_dir / output_subdir / "overrides.yaml"
+            if not overrides_file.exists():
+                continue
+            overrides = OmegaConf.to_container(OmegaConf.load(str(overrides_file)))
+            assert isinstance(overrides, list)
+            ret[tuple(sorted(overrides))] = job_dir
+        log.info(f"Found {len(ret)} completed jobs in {sweep_dir}")
+        return ret
+
+    def launch_batch(
+        self, batch: Sequence[Sequence[str]], initial_job_idx: int
+    ) -> Sequence[JobReturn]:
+        assert self.config is not None
+        memo_enabled = self.config.hydra.memo.enabled
+        if not self.resume and not memo_enabled:
+            return super(BasicSweeper, self).launch_batch(batch, initial_job_idx)
+
+        # The result of each job, completed jobs are loaded from the sweep dir
+        results: List[Optional[JobReturn]] = [None] * len(batch)
+        if self.resume:
+            for idx, overrides in enumerate(batch):
+                job_dir = self.completed_jobs.get(tuple(sorted(overrides)))
+                if job_dir is not None:
+                    results[idx] = load_job_return(
+                        job_dir,
+                        self.config.hydra.output_subdir,
+                        load_configs=self.config.hydra.get("return_configs", True),
+                    )
+                if results[idx] is not None:
+                    log.info(
+                        "\t#{} : {} (completed, skipping)".format(
+                            initial_job_idx + idx, " ".join(overrides)
+                        )
+                    )
+
+        # jobs with the same task config as a previous job in the batch are only run once
+        duplicate_of: Dict[int, int] = {}
+        # the configs composed to find the duplicates, reused by the launcher
+        composed: Dict[Tuple[str, ...], DictConfig] = {}
+        if memo_enabled:
+            assert self.config_loader is not None
+            first_idx: Dict[str, int] = {}
+            for idx, overrides in enumerate(batch):
+                if results[idx] is not None:
+                    continue
+                sweep_config = self.config_loader.load_sweep_config(
+                    self.config, list(overrides)
+                )
+                try:
+                    cfg_hash = config_hash(sweep_config)
+                except ValueError:
+                    # e.g. interpolations to values set by the launcher, not deduplicated
+                    composed[tuple(overrides)] = sweep_config
+                    continue
+                if cfg_hash in first_idx:
+                    duplicate_of[idx] = first_idx[cfg_hash]
+                else:
+                    first_idx[cfg_hash] = idx
+                    composed[tuple(overrides)] = sweep_config
+
+        # each run of consecutive jobs to launch is launched with its job numbers
+        to_launch = [
+            idx
+            for idx in range(len(batch))
+            if results[idx] is None and idx not in duplicate_of
+        ]
+        if self.config_loader is not None:
+            self.config_loader.keep_sweep_configs(self.config, composed)
+        try:
+            run_start = 0
+            while run_start < len(to_launch):
+                run_end = run_start + 1
+                while (
+                    run_end < len(to_launch)
+                    and to_launch[run_end] == to_launch[run_end - 1] + 1
+                ):
+                    run_end += 1
+                run = to_launch[run_start:run_end]
+                launched = super(BasicSweeper, self).launch_batch(
+                    [batch[idx] for idx in run], initial_job_idx + run[0]
+                )
+                for idx, job_return in zip(run, launched):
+                    results[idx] = job_return
+                run_start = run_end
+        finally:
+            if self.config_loader is not None:
+                self.config_loader.keep_sweep_configs(self.config, {})
 
-        assert self.arguments is not None
-        lists = []
-        for s in self.arguments:
-            key, value = s.split("=")
-            lists.append(["{}={}".format(key, val) for val in value.split(",")])
+        for idx, orig_idx in duplicate_of.items():
+            orig = results[orig_idx]
+            assert orig is not None
+            log.info(
+                "\t#{} : {} (same config as #{}, skipping)".format(
+                    initial_job_idx + idx,
+                    " ".join(batch[idx]),
+                    initial_job_idx + orig_idx,
+                )
+            )
+            duplicate = copy.copy(orig)
+            duplicate.overrides = list(batch[idx])
+            results[idx] = duplicate
 
-        return list(itertools.product(*lists))
+        ret: List[JobReturn] = []
+        for result in results:
+            assert result is not None
+            ret.append(result)
+        return ret
 
     def is_done(self) -> bool:
-        # just one batch
-        return self.job_results is not None
+        assert self.grid is not None
+        # at least one batch is launched, even if it's a single job without overrides
+        return self.job_results is not None and self.next_job_idx >= self.end_job_idx
 
     def update_results(self, job_results: Sequence[JobReturn]) -> None:
-        self.job_results = copy.copy(job_results)
+        self.job_results = job_results
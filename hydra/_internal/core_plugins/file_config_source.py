@@ -1,6 +1,6 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
 import os
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from omegaconf import OmegaConf
 
@@ -32,6 +32,25 @@ class FileConfigSource(ConfigSource):
         full_path = os.path.realpath(os.path.join(self.path, config_path))
         return os.path.exists(full_path)
 
+    def list_entries(self, config_path: str) -> Optional[Dict[str, ObjectType]]:
+        full_path = os.path.realpath(os.path.join(self.path, config_path))
+        if not os.path.isdir(full_path):
+            return {}
+        entries: Dict[str, ObjectType] = {}
+        for entry in os.scandir(full_path):
+            entries[entry.name] = (
+                ObjectType.GROUP if entry.is_dir() else ObjectType.CONFIG
+            )
+        return entries
+
+    def get_cache_token(self, config_path: str) -> Optional[Any]:
+        full_path = os.path.realpath(os.path.join(self.path, config_path))
+        try:
+            stat = os.stat(full_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
     def get_type(self, config_path: str) -> ObjectType:
         full_path = os.path.realpath(os.path.join(self.path, config_path))
         if os.path.exists(full_path):
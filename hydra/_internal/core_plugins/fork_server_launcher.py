@@ -0,0 +1,267 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+"""
+Launcher forking a process per job from a warm template process.
+The template process is forked from the Hydra process once: it has the task module
+imported, the globals set up and the plugins discovered. Each job only receives its
+composed config, it does not pay for the imports and the initialization of the app.
+"""
+import importlib
+import logging
+import multiprocessing
+import os
+import traceback
+from collections import deque
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+from omegaconf import DictConfig, open_dict
+
+from hydra.core.config_loader import ConfigLoader
+from hydra.core.hydra_config import HydraConfig
+from hydra.core.plugins import Plugins
+from hydra.core.singleton import Singleton
+from hydra.core.utils import (
+    JobReturn,
+    JobStatus,
+    configure_log,
+    failed_job_return,
+    filter_overrides,
+    run_job,
+    setup_globals,
+)
+from hydra.plugins.launcher import Launcher
+from hydra.types import TaskFunction
+
+log = logging.getLogger(__name__)
+
+# Messages from the launcher to the template process
+_RUN = "run"
+_STOP = "stop"
+# Messages from the template process and the jobs to the launcher
+_DONE = "done"
+_CRASHED = "crashed"
+
+
+def _run_job_in_child(
+    conn: Connection,
+    lock: Any,
+    task_function: TaskFunction,
+    idx: int,
+    sweep_config: DictConfig,
+) -> None:
+    HydraConfig.instance().set_config(sweep_config)
+    try:
+        ret = run_job(
+            config=sweep_config,
+            task_function=task_function,
+            job_dir_key="hydra.sweep.dir",
+            job_subdir_key="hydra.sweep.subdir",
+        )
+    except Exception:
+        ret = failed_job_return(sweep_config, traceback.format_exc())
+    with lock:
+        try:
+            conn.send((_DONE, idx, ret))
+        except Exception:
+            # e.g. a return value that can't be pickled
+            conn.send(
+                (_DONE, idx, failed_job_return(sweep_config, traceback.format_exc()))
+            )
+
+
+def _reap_children(conn: Connection, lock: Any, running: Dict[int, int]) -> None:
+    for pid in list(running.keys()):
+        wpid, status = os.waitpid(pid, os.WNOHANG)
+        if wpid == 0:
+            continue
+        idx = running.pop(pid)
+        if os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0:
+            continue
+        if os.WIFSIGNALED(status):
+            reason = "killed by signal {}".format(os.WTERMSIG(status))
+        else:
+            reason = "exit code {}".format(os.WEXITSTATUS(status))
+        with lock:
+            conn.send((_CRASHED, idx, "Job process {} {}".format(pid, reason)))
+
+
+def _template_main(
+    conn: Connection,
+    lock: Any,
+    task_function: TaskFunction,
+    singleton_state: Dict[Any, Any],
+    preload: List[str],
+) -> None:
+    Singleton.set_state(singleton_state)
+    setup_globals()
+    for module in preload:
+        importlib.import_module(module)
+    Plugins.descriptors()
+    Plugins.register_config_sources()
+
+    parent_pid = os.getppid()
+    running: Dict[int, int] = {}
+    # stop if the Hydra process is gone
+    while os.getppid() == parent_pid:
+        if conn.poll(0.01):
+            msg = conn.recv()
+            if msg[0] == _STOP:
+                break
+            _, idx, sweep_config = msg
+            pid = os.fork()
+            if pid == 0:
+                exit_code = 1
+                try:
+                    _run_job_in_child(conn, lock, task_function, idx, sweep_config)
+                    exit_code = 0
+                finally:
+                    # never return to the loop of the template
+                    os._exit(exit_code)
+            running[pid] = idx
+        _reap_children(conn, lock, running)
+
+    for pid in running.keys():
+        os.waitpid(pid, 0)
+
+
+class ForkServerLauncher(Launcher):
+    def __init__(
+        self, n_jobs: Optional[int] = None, preload: Optional[List[str]] = None
+    ) -> None:
+        """
+        :param n_jobs: maximum number of jobs running in parallel, None for the number of CPUs
+        :param preload: modules imported by the template process, in addition to the modules
+               already imported by the Hydra process
+        """
+        super().__init__()
+        if n_jobs is not None and n_jobs <= 0:
+            raise ValueError(f"n_jobs must be a positive number, got {n_jobs}")
+        self.n_jobs = n_jobs
+        self.preload = list(preload or [])
+        self.config: Optional[DictConfig] = None
+        self.config_loader: Optional[ConfigLoader] = None
+        self.task_function: Optional[TaskFunction] = None
+        self.template: Optional[Any] = None
+        self.conn: Optional[Connection] = None
+        # the process that started the template
+        self.owner_pid: Optional[int] = None
+
+    def setup(
+        self,
+        config: DictConfig,
+        config_loader: ConfigLoader,
+        task_function: TaskFunction,
+    ) -> None:
+        self.config = config
+        self.config_loader = config_loader
+        self.task_function = task_function
+
+    def _start_template(self) -> None:
+        if self.template is not None and self.template.is_alive():
+            return
+        if not hasattr(os, "fork"):
+            raise RuntimeError("The fork_server launcher requires os.fork()")
+        context = multiprocessing.get_context("fork")
+        conn, template_conn = context.Pipe()
+        # serializes the messages sent to the launcher by the template and the jobs
+        lock = context.Lock()
+        template = context.Process(
+            target=_template_main,
+            args=(
+                template_conn,
+                lock,
+                self.task_function,
+                Singleton.get_state(),
+                self.preload,
+            ),
+            name="hydra-fork-server",
+            daemon=True,
+        )
+        template.start()
+        template_conn.close()
+        self.template = template
+        self.conn = conn
+        self.owner_pid = os.getpid()
+        log.debug("Started fork server process {}".format(template.pid))
+
+    def close(self) -> None:
+        """
+        Stops the template process
+        """
+        super().close()
+        if self.template is None:
+            return
+        assert self.conn is not None
+        try:
+            self.conn.send((_STOP,))
+        except (BrokenPipeError, OSError):
+            pass
+        self.template.join()
+        self.conn.close()
+        self.template = None
+        self.conn = None
+
+    def __del__(self) -> None:
+        if self.template is not None and self.owner_pid == os.getpid():
+            self.close()
+
+    def launch(
+        self, job_overrides: Sequence[Sequence[str]], initial_job_idx: int
+    ) -> Sequence[JobReturn]:
+        setup_globals()
+        assert self.config is not None
+        assert self.task_function is not None
+        assert self.config_loader is not None
+
+        configure_log(self.config.hydra.hydra_logging, self.config.hydra.verbose)
+        sweep_dir = self.config.hydra.sweep.dir
+        Path(str(sweep_dir)).mkdir(parents=True, exist_ok=True)
+        n_jobs = self.n_jobs or os.cpu_count() or 1
+        log.info(
+            "Launching {} jobs locally with up to {} forked processes".format(
+                len(job_overrides), n_jobs
+            )
+        )
+
+        sweep_configs: Dict[int, DictConfig] = {}
+        for idx, overrides in enumerate(job_overrides):
+            idx = initial_job_idx + idx
+            log.info("\t#{} : {}".format(idx, " ".join(filter_overrides(overrides))))
+            sweep_config = self.config_loader.load_sweep_config(
+                self.config, list(overrides)
+            )
+            with open_dict(sweep_config):
+                sweep_config.hydra.job.id = idx
+                sweep_config.hydra.job.num = idx
+            sweep_configs[idx] = sweep_config
+
+        if len(sweep_configs) == 0:
+            return []
+
+        self._start_template()
+        assert self.conn is not None
+        pending: Deque[Tuple[int, DictConfig]] = deque(sweep_configs.items())
+        results: Dict[int, JobReturn] = {}
+        running = 0
+        while len(pending) > 0 or running > 0:
+            while len(pending) > 0 and running < n_jobs:
+                idx, sweep_config = pending.popleft()
+                self.conn.send((_RUN, idx, sweep_config))
+                running += 1
+            try:
+                kind, idx, payload = self.conn.recv()
+            except EOFError:
+                self.template = None
+                raise RuntimeError("The fork server process exited unexpectedly")
+            running -= 1
+            if kind == _DONE:
+                results[idx] = payload
+            else:
+                results[idx] = failed_job_return(sweep_configs[idx], payload)
+
+        runs: List[JobReturn] = [results[idx] for idx in sweep_configs.keys()]
+        for idx, ret in zip(sweep_configs.keys(), runs):
+            if ret.status == JobStatus.FAILED:
+                log.error("Job #{} failed:\n{}".format(idx, ret.error))
+        return runs
@@ -0,0 +1,211 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+"""
+Hyperband sweeper, running successive halving over configurations sampled from the sweep grid.
+The search space uses the syntax of the basic sweeper, for example:
+python foo.py -m hydra/sweeper=hyperband lr=range(0,1,0.01) optimizer=adam,nesterov
+
+Each configuration first runs with a small budget, passed to the job as an override
+(e.g. epochs=1). Only the best 1/eta of the configurations are promoted to the next rung,
+running with eta times the budget, until the last rung runs with max_budget.
+Hyperband runs multiple such brackets, trading the number of configurations for the
+initial budget. The task function returns the metric to optimize, either a number or a dict
+containing it.
+"""
+import logging
+import math
+import random
+from pathlib import Path
+from typing import Any, List, Optional, Sequence, Tuple, Union
+
+from omegaconf import OmegaConf
+
+from hydra.core.utils import JobReturn
+from hydra.plugins.reducer import job_metric
+from hydra.plugins.step_sweeper import StepSweeper
+
+from .basic_sweeper import SweepGrid
+
+log = logging.getLogger(__name__)
+
+
+class HyperbandSweeper(StepSweeper):
+    """
+    Hyperband sweeper, each batch is a rung of a bracket
+    """
+
+    def __init__(
+        self,
+        budget_key: str = "epochs",
+        min_budget: Union[int, float] = 1,
+        max_budget: Union[int, float] = 81,
+        eta: int = 3,
+        num_brackets: Optional[int] = None,
+        metric: Optional[str] = None,
+        mode: str = "min",
+        seed: int = 0,
+    ) -> None:
+        """
+        :param budget_key: key of the budget override passed to each job, e.g. epochs
+        :param min_budget: budget of the configurations in the first rung of the largest bracket
+        :param max_budget: budget of the configurations in the last rung of each bracket
+        :param eta: 1/eta of the configurations are promoted to the next rung, with eta times the budget
+        :param num_brackets: number of brackets to run, starting from the largest one.
+               1 for successive halving, None for all the brackets of Hyperband
+        :param metric: key of the metric in the dict returned by the jobs, None if they return a number
+        :param mode: min or max, whether the metric is minimized or maximized
+        :param seed: seed of the sampling of the configurations
+        """
+        super(HyperbandSweeper, self).__init__()
+        if min_budget <= 0 or max_budget < min_budget:
+            raise ValueError(
+                f"Invalid budgets, expected 0 < min_budget <= max_budget,"
+                f" got {min_budget} and {max_budget}"
+            )
+        if eta < 2:
+            raise ValueError(f"eta must be at least 2, got {eta}")
+        if mode not in ("min", "max"):
+            raise ValueError(f"mode must be min or max, got {mode}")
+        self.budget_key = budget_key
+        self.min_budget = min_budget
+        self.max_budget = max_budget
+        self.eta = eta
+        self.metric = metric
+        self.mode = mode
+        self.seed = seed
+        # the largest bracket has s_max + 1 rungs
+        self.s_max = 0
+        while max_budget / eta ** (self.s_max + 1) >= min_budget * (1 - 1e-9):
+            self.s_max += 1
+        if num_brackets is None:
+            num_brackets = self.s_max + 1
+        if num_brackets <= 0 or num_brackets > self.s_max + 1:
+            raise ValueError(
+                f"num_brackets must be in [1, {self.s_max + 1}], got {num_brackets}"
+            )
+        self.num_brackets = num_brackets
+        self.grid: Optional[SweepGrid] = None
+        self.rng = random.Random(seed)
+        # brackets left to run, from the largest one
+        self.brackets: List[int] = []
+        self.bracket = 0
+        self.rung = 0
+        # grid index of the configurations of the current rung
+        self.candidates: List[int] = []
+        # best metric at max_budget, with its overrides
+        self.best: Optional[Tuple[float, List[str]]] = None
+
+    def get_num_configs(self, bracket: int) -> int:
+        """
+        :return: the number of configurations in the first rung of a bracket
+        """
+        n = -(-(self.s_max + 1) * self.eta ** bracket // (bracket + 1))
+        return int(n)
+
+    def get_budget(self, bracket: int, rung: int) -> Union[int, float]:
+        """
+        :return: the budget of the configurations in a rung of a bracket
+        """
+        budget = self.max_budget / math.pow(self.eta, bracket - rung)
+        if isinstance(self.min_budget, int) and isinstance(self.max_budget, int):
+            return max(1, int(round(budget)))
+        return budget
+
+    def sweep(self, arguments: List[str]) -> Any:
+        self.grid = SweepGrid(arguments)
+        if self.budget_key in self.grid.keys:
+            raise ValueError(
+                f"{self.budget_key} is the budget of the sweep, it can't be overridden"
+            )
+        self.rng = random.Random(self.seed)
+        self.brackets = list(
+            reversed(range(self.s_max + 1 - self.num_brackets, self.s_max + 1))
+        )
+        self.best = None
+        self.start_bracket()
+        returns = super(HyperbandSweeper, self).sweep(arguments)
+        self.save_results()
+        return returns
+
+    def start_bracket(self) -> None:
+        assert self.grid is not None
+        self.bracket = self.brackets.pop(0)
+        self.rung = 0
+        num_configs = min(self.get_num_configs(self.bracket), len(self.grid))
+        self.candidates = self.rng.sample(range(len(self.grid)), num_configs)
+        log.info(
+            "Hyperband bracket {} : {} configurations, budget {} to {}".format(
+                self.bracket,
+                num_configs,
+                self.get_budget(self.bracket, 0),
+                self.get_budget(self.bracket, self.bracket),
+            )
+        )
+
+    def get_job_batch(self) -> Sequence[Sequence[str]]:
+        assert self.grid is not None
+        budget = "{}={}".format(
+            self.budget_key, self.get_budget(self.bracket, self.rung)
+        )
+        return [self.grid[idx] + [budget] for idx in self.candidates]
+
+    def is_done(self) -> bool:
+        return len(self.candidates) == 0 and len(self.brackets) == 0
+
+    def update_results(self, job_results: Sequence[JobReturn]) -> None:
+        assert self.grid is not None
+        scored: List[Tuple[float, int]] = []
+        for idx, ret in zip(self.candidates, job_results):
+            value = job_metric(ret, self.metric)
+            if value is None:
+                log.warning(
+                    "No metric for {}, not promoting it".format(
+                        " ".join(self.grid[idx])
+                    )
+                )
+                continue
+            scored.append((value if self.mode == "min" else -value, idx))
+        # stable: ties are broken by the sampling order
+        scored.sort(key=lambda x: x[0])
+
+        if self.rung == self.bracket:
+            if len(scored) > 0:
+                value, idx = scored[0]
+                if self.best is None or value < self.best[0]:
+                    self.best = (value, self.grid[idx])
+            self.candidates = []
+        else:
+            num_promoted = max(1, len(self.candidates) // self.eta)
+            self.candidates = [idx for _, idx in scored[:num_promoted]]
+            self.rung += 1
+        if len(self.candidates) == 0 and len(self.brackets) > 0:
+            self.start_bracket()
+
+    def get_best(self) -> Optional[Tuple[float, List[str]]]:
+        """
+        :return: the best metric of the configurations evaluated with max_budget,
+                 with the overrides of the configuration
+        """
+        if self.best is None:
+            return None
+        value, overrides = self.best
+        return (value if self.mode == "min" else -value), overrides
+
+    def save_results(self) -> None:
+        assert self.config is not None
+        best = self.get_best()
+        if best is None:
+            log.warning("No configuration completed with the max budget")
+            return
+        value, overrides = best
+        log.info("Best configuration : {}".format(" ".join(overrides)))
+        log.info("Best {} : {}".format(self.metric or "metric", value))
+        results = OmegaConf.create(
+            {
+                "name": "hyperband",
+                "best_evaluated_params": list(overrides),
+                "best_evaluated_result": value,
+            }
+        )
+        sweep_dir = Path(str(self.config.hydra.sweep.dir))
+        sweep_dir.mkdir(parents=True, exist_ok=True)
+        OmegaConf.save(results, str(sweep_dir / "optimization_results.yaml"))
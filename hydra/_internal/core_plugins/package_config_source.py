@@ -1,19 +1,34 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
-from typing import List, Optional, Tuple
+import importlib
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 from omegaconf import OmegaConf
-from pkg_resources import (
-    resource_exists,
-    resource_isdir,
-    resource_listdir,
-    resource_stream,
-)
 
 from hydra.core.object_type import ObjectType
 from hydra.plugins.config_source import ConfigLoadError, ConfigResult, ConfigSource
 
+if sys.version_info >= (3, 9):
+    from importlib.resources import files as resource_files
+else:
+    from importlib_resources import files as resource_files  # type: ignore
+
 
 class PackageConfigSource(ConfigSource):
+    """
+    Config source for configs inside Python packages, including zipped packages.
+    Each directory of a package is listed once, subsequent queries are served from that listing
+    as long as the cache token of the directory did not change.
+    """
+
+    # (module name, resource dir) -> cache token and entries of the directory,
+    # the entries are None if it's not a directory
+    _listings: Dict[
+        Tuple[str, str], Tuple[Optional[Any], Optional[Dict[str, ObjectType]]]
+    ] = {}
+
     def __init__(self, provider: str, path: str) -> None:
         super().__init__(provider=provider, path=path)
 
@@ -27,15 +42,15 @@ class PackageConfigSource(ConfigSource):
             full_path
         )
 
-        try:
-            with resource_stream(module_name, resource_name) as stream:
-                return ConfigResult(
-                    config=OmegaConf.load(stream),
-                    path=f"{self.scheme()}://{self.path}",
-                    provider=self.provider,
-                )
-        except IOError:
+        if self.get_type(config_path=config_path) != ObjectType.CONFIG:
             raise ConfigLoadError(f"PackageConfigSource: Config not found: {full_path}")
+        resource = PackageConfigSource._resource(module_name, resource_name)
+        with resource.open("r") as stream:
+            return ConfigResult(
+                config=OmegaConf.load(stream),
+                path=f"{self.scheme()}://{self.path}",
+                provider=self.provider,
+            )
 
     def exists(self, config_path: str) -> bool:
         return self.get_type(config_path=config_path) != ObjectType.NOT_FOUND
@@ -45,31 +60,27 @@ class PackageConfigSource(ConfigSource):
         module_name, resource_name = PackageConfigSource._split_module_and_resource(
             full_path
         )
+        resource_name = resource_name.strip("/")
+        sep = resource_name.rfind("/")
+        if sep == -1:
+            parent, name = "", resource_name
+        else:
+            parent, name = resource_name[0:sep], resource_name[sep + 1 :]
 
-        try:
-            if resource_exists(module_name, resource_name):
-                if resource_isdir(module_name, resource_name):
-                    return ObjectType.GROUP
-                else:
-                    return ObjectType.CONFIG
-            else:
+        if name == "":
+            # the root of the package
+            if PackageConfigSource._listdir(module_name, "") is None:
                 return ObjectType.NOT_FOUND
-        except NotImplementedError:
-            raise NotImplementedError(
-                "Unable to load {}/{}, are you missing an __init__.py?".format(
-                    module_name, resource_name
-                )
-            )
-        except ImportError:
+            return ObjectType.GROUP
+
+        entries = PackageConfigSource._listdir(module_name, parent)
+        if entries is None:
             return ObjectType.NOT_FOUND
+        return entries.get(name, ObjectType.NOT_FOUND)
 
     def list(self, config_path: str, results_filter: Optional[ObjectType]) -> List[str]:
         files: List[str] = []
-        full_path = self.concat(self.path, config_path)
-        module_name, resource_name = PackageConfigSource._split_module_and_resource(
-            full_path
-        )
-        for file in resource_listdir(module_name, resource_name):
+        for file in self._list_group(config_path):
             file_path = self.concat(config_path, file)
             self._list_add_result(
                 files=files,
@@ -80,6 +91,95 @@ class PackageConfigSource(ConfigSource):
 
         return sorted(files)
 
+    def list_entries(self, config_path: str) -> Optional[Dict[str, ObjectType]]:
+        return dict(self._list_group(config_path))
+
+    def get_cache_token(self, config_path: str) -> Optional[Any]:
+        """
+        Configs inside a versioned package are keyed by the package version.
+        Otherwise the modification time is used if the resource is on the file system.
+        """
+        full_path = self.concat(self.path, config_path)
+        module_name, resource_name = PackageConfigSource._split_module_and_resource(
+            full_path
+        )
+        return PackageConfigSource._get_token(module_name, resource_name)
+
+    def invalidate(self) -> None:
+        PackageConfigSource._listings.clear()
+        # packages installed since the finders cached the content of sys.path
+        importlib.invalidate_caches()
+
+    @staticmethod
+    def _get_token(module_name: str, resource_name: str) -> Optional[Any]:
+        module = sys.modules.get(module_name)
+        if module is None:
+            return None
+        top_level = sys.modules.get(module_name.split(".")[0])
+        version = getattr(top_level, "__version__", None)
+        if version is not None:
+            return module_name, str(version)
+        module_file = getattr(module, "__file__", None)
+        if module_file is None:
+            return None
+        try:
+            stat = os.stat(os.path.join(os.path.dirname(module_file), resource_name))
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _list_group(self, config_path: str) -> Dict[str, ObjectType]:
+        full_path = self.concat(self.path, config_path)
+        module_name, resource_name = PackageConfigSource._split_module_and_resource(
+            full_path
+        )
+        entries = PackageConfigSource._listdir(module_name, resource_name.strip("/"))
+        return entries or {}
+
+    @staticmethod
+    def _resource(module_name: str, resource_name: str) -> Any:
+        try:
+            resource = resource_files(module_name)
+        except TypeError:
+            # a plain module, resources are relative to the directory containing it
+            module_file = getattr(
+                importlib.import_module(module_name), "__file__", None
+            )
+            if module_file is None:
+                raise
+            resource = Path(module_file).parent
+        for part in resource_name.split("/"):
+            if part != "":
+                resource = resource / part
+        return resource
+
+    @staticmethod
+    def _listdir(
+        module_name: str, resource_dir: str
+    ) -> Optional[Dict[str, ObjectType]]:
+        key = (module_name, resource_dir)
+        token = PackageConfigSource._get_token(module_name, resource_dir)
+        listing = PackageConfigSource._listings.get(key)
+        if listing is not None and listing[0] == token:
+            return listing[1]
+
+        entries: Optional[Dict[str, ObjectType]] = None
+        try:
+            resource = PackageConfigSource._resource(module_name, resource_dir)
+            if resource.is_dir():
+                entries = {}
+                for child in resource.iterdir():
+                    entries[child.name] = (
+                        ObjectType.GROUP if child.is_dir() else ObjectType.CONFIG
+                    )
+        except (ImportError, TypeError, ValueError):
+            # not a package (or not importable)
+            entries = None
+        # the module is imported by the listing
+        token = PackageConfigSource._get_token(module_name, resource_dir)
+        PackageConfigSource._listings[key] = (token, entries)
+        return entries
+
     @staticmethod
     def _split_module_and_resource(filename: str) -> Tuple[str, str]:
         sep = filename.find("/")
@@ -0,0 +1,191 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+"""
+Launcher running the jobs of a batch in parallel in a pool of local worker processes.
+"""
+import logging
+import multiprocessing
+import os
+import sys
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from omegaconf import DictConfig, open_dict
+
+from hydra.core.config_loader import ConfigLoader
+from hydra.core.log_queue import set_sweep_log_queue
+from hydra.core.singleton import Singleton
+from hydra.core.utils import (
+    JobReturn,
+    JobStatus,
+    close_sweep_logging,
+    configure_log,
+    failed_job_return,
+    filter_overrides,
+    get_jobs_per_task,
+    open_sweep_log,
+    run_job_pack,
+    setup_globals,
+    split_into_packs,
+)
+from hydra.plugins.launcher import Launcher
+from hydra.types import TaskFunction
+
+log = logging.getLogger(__name__)
+
+# Task function of the jobs run by the worker process, set by the pool initializer
+_worker_task_function: Optional[TaskFunction] = None
+# Arguments of _init_worker inherited by the forked workers on Python 3.6, where the pool
+# has no initializer
+_worker_init_args: Optional[Tuple[Any, ...]] = None
+
+
+def _init_worker(
+    task_function: TaskFunction,
+    singleton_state: Dict[Any, Any],
+    sweep_log_queue: Optional[Any],
+) -> None:
+    global _worker_task_function
+    _worker_task_function = task_function
+    Singleton.set_state(singleton_state)
+    setup_globals()
+    set_sweep_log_queue(sweep_log_queue)
+
+
+def _run_jobs_in_worker(sweep_configs: List[DictConfig]) -> List[JobReturn]:
+    if _worker_task_function is None:
+        assert _worker_init_args is not None
+        _init_worker(*_worker_init_args)
+    assert _worker_task_function is not None
+    return run_job_pack(
+        configs=sweep_configs,
+        task_function=_worker_task_function,
+        job_dir_key="hydra.sweep.dir",
+        job_subdir_key="hydra.sweep.subdir",
+        catch_errors=True,
+    )
+
+
+class ProcessPoolLauncher(Launcher):
+    def __init__(self, n_jobs: Optional[int] = None) -> None:
+        """
+        :param n_jobs: maximum number of jobs running in parallel, None for the number of CPUs
+        """
+        super().__init__()
+        if n_jobs is not None and n_jobs <= 0:
+            raise ValueError(f"n_jobs must be a positive number, got {n_jobs}")
+        self.n_jobs = n_jobs
+        self.config: Optional[DictConfig] = None
+        self.config_loader: Optional[ConfigLoader] = None
+        self.task_function: Optional[TaskFunction] = None
+
+    def setup(
+        self,
+        config: DictConfig,
+        config_loader: ConfigLoader,
+        task_function: TaskFunction,
+    ) -> None:
+        self.config = config
+        self.config_loader = config_loader
+        self.task_function = task_function
+
+    @staticmethod
+    def _get_context() -> Any:
+        # fork does not require the task function to be picklable
+        if "fork" in multiprocessing.get_all_start_methods():
+            return multiprocessing.get_context("fork")
+        return multiprocessing.get_context()
+
+    @staticmethod
+    def _create_executor(
+        n_jobs: int, context: Any, initargs: Tuple[Any, ...]
+    ) -> ProcessPoolExecutor:
+        if sys.version_info >= (3, 7):
+            return ProcessPoolExecutor(
+                max_workers=n_jobs,
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=initargs,
+            )
+        # the workers are forked when the first pack is submitted, and initialize on their first pack
+        global _worker_init_args
+        _worker_init_args = initargs
+        return ProcessPoolExecutor(max_workers=n_jobs)
+
+    @staticmethod
+    def _get_pack_returns(
+        pack: List[DictConfig], future: "Future[List[JobReturn]]"
+    ) -> List[JobReturn]:
+        try:
+            return future.result()
+        except BrokenProcessPool as e:
+            # A job killed its worker process (os._exit(), a signal, the OOM killer...).
+            # The pool is unusable and the packs that did not complete are failed.
+            error = "A worker process died before the job completed: {}".format(e)
+            return [failed_job_return(config, error) for config in pack]
+
+    def launch(
+        self, job_overrides: Sequence[Sequence[str]], initial_job_idx: int
+    ) -> Sequence[JobReturn]:
+        global _worker_init_args
+        setup_globals()
+        assert self.config is not None
+        assert self.task_function is not None
+        assert self.config_loader is not None
+
+        configure_log(self.config.hydra.hydra_logging, self.config.hydra.verbose)
+        sweep_dir = self.config.hydra.sweep.dir
+        Path(str(sweep_dir)).mkdir(parents=True, exist_ok=True)
+        n_jobs = self.n_jobs or os.cpu_count() or 1
+        n_jobs = max(1, min(n_jobs, len(job_overrides)))
+        log.info(
+            "Launching {} jobs locally with {} worker processes".format(
+                len(job_overrides), n_jobs
+            )
+        )
+
+        sweep_configs: List[Tuple[int, DictConfig]] = []
+        for idx, overrides in enumerate(job_overrides):
+            idx = initial_job_idx + idx
+            log.info("\t#{} : {}".format(idx, " ".join(filter_overrides(overrides))))
+            sweep_config = self.config_loader.load_sweep_config(
+                self.config, list(overrides)
+            )
+            with open_dict(sweep_config):
+                sweep_config.hydra.job.id = idx
+                sweep_config.hydra.job.num = idx
+            sweep_configs.append((idx, sweep_config))
+
+        if len(sweep_configs) == 0:
+            return []
+
+        packs = split_into_packs(
+            [sweep_config for _, sweep_config in sweep_configs],
+            get_jobs_per_task(self.config),
+        )
+        context = self._get_context()
+        sweep_log = open_sweep_log(self.config, context)
+        try:
+            with self._create_executor(
+                n_jobs=n_jobs,
+                context=context,
+                initargs=(
+                    self.task_function,
+                    Singleton.get_state(),
+                    sweep_log.queue if sweep_log is not None else None,
+                ),
+            ) as executor:
+                futures = [executor.submit(_run_jobs_in_worker, pack) for pack in packs]
+                runs: List[JobReturn] = []
+                for pack, future in zip(packs, futures):
+                    runs.extend(self._get_pack_returns(pack, future))
+        finally:
+            _worker_init_args = None
+            close_sweep_logging(self.config, sweep_log)
+
+        configure_log(self.config.hydra.hydra_logging, self.config.hydra.verbose)
+        for (idx, _), ret in zip(sweep_configs, runs):
+            if ret.status == JobStatus.FAILED:
+                log.error("Job #{} failed:\n{}".format(idx, ret.error))
+        return runs
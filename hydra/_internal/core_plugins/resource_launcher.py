@@ -0,0 +1,411 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+"""
+Launcher packing jobs into the CPU and memory capacity of the local machine.
+Each job declares the resources it needs in hydra.job.resources, runs in its own process
+and is pinned to a set of CPUs no other running job uses.
+"""
+import logging
+import math
+import multiprocessing
+import os
+import time
+import traceback
+from multiprocessing.connection import Connection, wait
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from omegaconf import DictConfig, open_dict
+
+from hydra.core.config_loader import ConfigLoader
+from hydra.core.hydra_config import HydraConfig
+from hydra.core.utils import (
+    JobReturn,
+    JobStatus,
+    configure_log,
+    failed_job_return,
+    filter_overrides,
+    run_job,
+    setup_globals,
+)
+from hydra.plugins.launcher import Launcher
+from hydra.types import TaskFunction
+
+log = logging.getLogger(__name__)
+
+# period in seconds of the load average used to detect external load, the last minute
+LOAD_AVERAGE_PERIOD = 60.0
+
+# Environment variables limiting the threads of common numerical libraries
+_NUM_THREADS_VARS = [
+    "OMP_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+]
+
+
+def available_cpus() -> List[int]:
+    """
+    :return: the ids of the CPUs this process can run on
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def available_memory_gb() -> Optional[float]:
+    """
+    :return: the memory available for new processes in GB (MemAvailable in /proc/meminfo),
+             None if unknown
+    """
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    # in kB
+                    return int(line.split()[1]) / (1024 ** 2)
+    except OSError:
+        pass
+    return None
+
+
+def load_average() -> Optional[float]:
+    """
+    :return: the load average of the last minute, None if unknown
+    """
+    try:
+        with open("/proc/loadavg") as f:
+            return float(f.read().split()[0])
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        return os.getloadavg()[0]
+    except (AttributeError, OSError):
+        return None
+
+
+class ResourcePool:
+    """
+    The CPUs and memory of the machine, allocated to the running jobs.
+    """
+
+    def __init__(self, cpus: List[int], mem_gb: Optional[float]) -> None:
+        """
+        :param cpus: ids of the CPUs
+        :param mem_gb: memory in GB, None for no limit
+        """
+        self.cpus = list(cpus)
+        self.mem_gb = mem_gb
+        self.free_cpus = list(cpus)
+        self.free_mem_gb = mem_gb
+
+    @property
+    def used_cpus(self) -> int:
+        return len(self.cpus) - len(self.free_cpus)
+
+    def fits(self, cpus: int, mem_gb: Optional[float], reserved_cpus: int = 0) -> bool:
+        """
+        :param reserved_cpus: free CPUs that can't be allocated, e.g. used by other processes
+        """
+        if cpus > len(self.free_cpus) - reserved_cpus:
+            return False
+        if mem_gb is not None and self.free_mem_gb is not None:
+            return mem_gb <= self.free_mem_gb
+        return True
+
+    def can_ever_fit(self, cpus: int, mem_gb: Optional[float]) -> bool:
+        if cpus > len(self.cpus):
+            return False
+        if mem_gb is not None and self.mem_gb is not None:
+            return mem_gb <= self.mem_gb
+        return True
+
+    def allocate(self, cpus: int, mem_gb: Optional[float]) -> List[int]:
+        """
+        :return: the ids of the CPUs allocated to the job, the lowest free ids
+        """
+        assert self.fits(cpus, mem_gb)
+        allocated = self.free_cpus[:cpus]
+        self.free_cpus = self.free_cpus[cpus:]
+        if mem_gb is not None and self.free_mem_gb is not None:
+            self.free_mem_gb -= mem_gb
+        return allocated
+
+    def release(self, cpus: List[int], mem_gb: Optional[float]) -> None:
+        self.free_cpus = sorted(self.free_cpus + cpus)
+        if mem_gb is not None and self.free_mem_gb is not None:
+            self.free_mem_gb += mem_gb
+
+
+def get_job_resources(config: DictConfig) -> Tuple[int, Optional[float]]:
+    """
+    :return: the number of CPUs and the memory in GB (None if not specified) of a job
+    """
+    resources = config.hydra.job.get("resources", None)
+    if resources is None:
+        return 1, None
+    cpus = int(resources.get("cpus", 1) or 1)
+    mem_gb = resources.get("mem_gb", None)
+    if cpus <= 0:
+        raise ValueError(f"hydra.job.resources.cpus must be positive, got {cpus}")
+    return cpus, float(mem_gb) if mem_gb is not None else None
+
+
+def _run_job_in_process(
+    conn: Connection,
+    task_function: TaskFunction,
+    sweep_config: DictConfig,
+    cpus: List[int],
+    mem_gb: Optional[float],
+    pin_cpus: bool,
+    enforce_memory: bool,
+) -> None:
+    try:
+        if pin_cpus and hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(0, cpus)
+        for var in _NUM_THREADS_VARS:
+            os.environ.setdefault(var, str(len(cpus)))
+        if enforce_memory and mem_gb is not None:
+            import resource
+
+            limit = int(mem_gb * 1024 ** 3)
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        HydraConfig.instance().set_config(sweep_config)
+        ret = run_job(
+            config=sweep_config,
+            task_function=task_function,
+            job_dir_key="hydra.sweep.dir",
+            job_subdir_key="hydra.sweep.subdir",
+        )
+    except Exception:
+        ret = failed_job_return(sweep_config, traceback.format_exc())
+    try:
+        conn.send(ret)
+    except Exception:
+        # e.g. a return value that can't be pickled
+        conn.send(failed_job_return(sweep_config, traceback.format_exc()))
+
+
+class _RunningJob:
+    def __init__(
+        self,
+        idx: int,
+        process: Any,
+        conn: Connection,
+        cpus: List[int],
+        mem_gb: Optional[float],
+    ) -> None:
+        self.idx = idx
+        self.process = process
+        self.conn = conn
+        self.cpus = cpus
+        self.mem_gb = mem_gb
+
+
+class ResourceLauncher(Launcher):
+    def __init__(
+        self,
+        max_cpus: Optional[int] = None,
+        max_mem_gb: Optional[float] = None,
+        pin_cpus: bool = True,
+        enforce_memory: bool = False,
+        respect_load: bool = True,
+        max_backfill: int = 16,
+    ) -> None:
+        """
+        :param max_cpus: number of CPUs used by the jobs, None for all the CPUs of the process
+        :param max_mem_gb: memory used by the jobs, None for the available memory of the machine
+        :param pin_cpus: pin each job to the CPUs allocated to it
+        :param enforce_memory: limit the address space of each job to its mem_gb
+        :param respect_load: do not start jobs on CPUs busy with processes outside of the sweep,
+               according to the load average
+        :param max_backfill: number of times smaller jobs can start before the first job
+               waiting for resources, after that the first job waits for the resources to free up
+        """
+        super().__init__()
+        if max_cpus is not None and max_cpus <= 0:
+            raise ValueError(f"max_cpus must be a positive number, got {max_cpus}")
+        self.max_cpus = max_cpus
+        self.max_mem_gb = max_mem_gb
+        self.pin_cpus = pin_cpus
+        self.enforce_memory = enforce_memory
+        self.respect_load = respect_load
+        self.max_backfill = max_backfill
+        self.config: Optional[DictConfig] = None
+        self.config_loader: Optional[ConfigLoader] = None
+        self.task_function: Optional[TaskFunction] = None
+        # the CPUs used by the jobs of this launcher, averaged like the load average
+        self.own_load = 0.0
+        self.own_load_time: Optional[float] = None
+        self.own_used_cpus = 0
+
+    def setup(
+        self,
+        config: DictConfig,
+        config_loader: ConfigLoader,
+        task_function: TaskFunction,
+    ) -> None:
+        self.config = config
+        self.config_loader = config_loader
+        self.task_function = task_function
+
+    def create_pool(self) -> ResourcePool:
+        cpus = available_cpus()
+        if self.max_cpus is not None:
+            cpus = cpus[: self.max_cpus]
+        mem_gb = self.max_mem_gb
+        if mem_gb is None:
+            mem_gb = available_memory_gb()
+        return ResourcePool(cpus=cpus, mem_gb=mem_gb)
+
+    def _external_load(self, pool: ResourcePool) -> int:
+        """
+        :return: number of CPUs busy with processes that are not jobs of this launcher
+        """
+        if not self.respect_load:
+            return 0
+        own_load = self._update_own_load(pool.used_cpus)
+        load = load_average()
+        if load is None:
+            return 0
+        # the load average still counts the jobs of this launcher that just completed
+        return max(0, int(load - max(pool.used_cpus, own_load)))
+
+    def _update_own_load(self, used_cpus: int) -> float:
+        """
+        Called whenever the number of CPUs used by the jobs of this launcher changes.
+        :param used_cpus: number of CPUs used by the jobs of this launcher from now on
+        :return: the part of the load average caused by the jobs of this launcher, the CPUs they
+                 used averaged over LOAD_AVERAGE_PERIOD like the load average of the kernel
+        """
+        now = time.monotonic()
+        if self.own_load_time is not None:
+            decay = math.exp(-(now - self.own_load_time) / LOAD_AVERAGE_PERIOD)
+            self.own_load = (
+                self.own_used_cpus + (self.own_load - self.own_used_cpus) * decay
+            )
+        self.own_load_time = now
+        self.own_used_cpus = used_cpus
+        return self.own_load
+
+    def _start_job(
+        self, idx: int, sweep_config: DictConfig, cpus: List[int], mem_gb: Any
+    ) -> _RunningJob:
+        context = multiprocessing.get_context("fork")
+        recv_conn, send_conn = context.Pipe(duplex=False)
+        process = context.Process(
+            target=_run_job_in_process,
+            args=(
+                send_conn,
+                self.task_function,
+                sweep_config,
+                cpus,
+                mem_gb,
+                self.pin_cpus,
+                self.enforce_memory,
+            ),
+        )
+        process.start()
+        send_conn.close()
+        log.debug("Started job #{} on CPUs {}".format(idx, cpus))
+        return _RunningJob(idx, process, recv_conn, cpus, mem_gb)
+
+    def launch(
+        self, job_overrides: Sequence[Sequence[str]], initial_job_idx: int
+    ) -> Sequence[JobReturn]:
+        setup_globals()
+        assert self.config is not None
+        assert self.task_function is not None
+        assert self.config_loader is not None
+
+        configure_log(self.config.hydra.hydra_logging, self.config.hydra.verbose)
+        sweep_dir = self.config.hydra.sweep.dir
+        Path(str(sweep_dir)).mkdir(parents=True, exist_ok=True)
+        pool = self.create_pool()
+        log.info(
+            "Launching {} jobs locally on {} CPUs and {} memory".format(
+                len(job_overrides),
+                len(pool.cpus),
+                "unlimited" if pool.mem_gb is None else f"{pool.mem_gb:.1f} GB",
+            )
+        )
+
+        sweep_configs: Dict[int, DictConfig] = {}
+        results: Dict[int, JobReturn] = {}
+        pending: List[Tuple[int, int, Optional[float]]] = []
+        for idx, overrides in enumerate(job_overrides):
+            idx = initial_job_idx + idx
+            log.info("\t#{} : {}".format(idx, " ".join(filter_overrides(overrides))))
+            sweep_config = self.config_loader.load_sweep_config(
+                self.config, list(overrides)
+            )
+            with open_dict(sweep_config):
+                sweep_config.hydra.job.id = idx
+                sweep_config.hydra.job.num = idx
+            sweep_configs[idx] = sweep_config
+            try:
+                cpus, mem_gb = get_job_resources(sweep_config)
+                if not pool.can_ever_fit(cpus, mem_gb):
+                    raise ValueError(
+                        f"Job requires {cpus} CPUs and {mem_gb} GB of memory,"
+                        f" more than the capacity of the machine"
+                    )
+            except ValueError:
+                results[idx] = failed_job_return(sweep_config, traceback.format_exc())
+                continue
+            pending.append((idx, cpus, mem_gb))
+
+        running: List[_RunningJob] = []
+        head_skips = 0
+        while len(pending) > 0 or len(running) > 0:
+            reserved = self._external_load(pool)
+            for entry in list(pending):
+                idx, cpus, mem_gb = entry
+                is_head = entry == pending[0]
+                # always start a job if nothing is running, to make progress under load
+                if pool.fits(cpus, mem_gb, reserved) or (
+                    len(running) == 0 and pool.fits(cpus, mem_gb)
+                ):
+                    allocated = pool.allocate(cpus, mem_gb)
+                    self._update_own_load(pool.used_cpus)
+                    running.append(
+                        self._start_job(idx, sweep_configs[idx], allocated, mem_gb)
+                    )
+                    pending.remove(entry)
+                    if not is_head:
+                        head_skips += 1
+                    else:
+                        head_skips = 0
+                elif is_head and head_skips >= self.max_backfill:
+                    # reserve the resources for the first job
+                    break
+
+            ready = wait(
+                [job.conn for job in running]
+                + [job.process.sentinel for job in running],
+                timeout=1.0,
+            )
+            for job in list(running):
+                if job.conn not in ready and job.process.sentinel not in ready:
+                    continue
+                if job.conn.poll():
+                    try:
+                        results[job.idx] = job.conn.recv()
+                    except EOFError:
+                        pass
+                job.process.join()
+                if job.idx not in results:
+                    results[job.idx] = failed_job_return(
+                        sweep_configs[job.idx],
+                        "Job process exited with code {}".format(job.process.exitcode),
+                    )
+                job.conn.close()
+                pool.release(job.cpus, job.mem_gb)
+                self._update_own_load(pool.used_cpus)
+                running.remove(job)
+
+        runs = [results[idx] for idx in sweep_configs.keys()]
+        for idx, ret in zip(sweep_configs.keys(), runs):
+            if ret.status == JobStatus.FAILED:
+                log.error("Job #{} failed:\n{}".format(idx, ret.error))
+        return runs
@@ -0,0 +1,146 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+"""
+Launcher running the jobs of a batch concurrently in a pool of threads of the current process.
+Suitable for I/O bound jobs.
+"""
+import contextvars
+import functools
+import logging
+import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+from omegaconf import DictConfig, open_dict
+
+from hydra.core.config_loader import ConfigLoader
+from hydra.core.utils import (
+    JobReturn,
+    JobStatus,
+    configure_log,
+    failed_job_return,
+    filter_overrides,
+    run_job,
+    setup_globals,
+)
+from hydra.plugins.launcher import Launcher
+from hydra.types import TaskFunction
+
+log = logging.getLogger(__name__)
+
+
+def _log_failure(idx: int, future: "Future[JobReturn]") -> None:
+    ret = future.result()
+    if ret.status == JobStatus.FAILED:
+        log.error("Job #{} failed:\n{}".format(idx, ret.error))
+
+
+class ThreadPoolLauncher(Launcher):
+    def __init__(self, n_jobs: int = 8) -> None:
+        """
+        :param n_jobs: maximum number of jobs running concurrently
+        """
+        super().__init__()
+        if n_jobs <= 0:
+            raise ValueError(f"n_jobs must be a positive number, got {n_jobs}")
+        self.n_jobs = n_jobs
+        self.config: Optional[DictConfig] = None
+        self.config_loader: Optional[ConfigLoader] = None
+        self.task_function: Optional[TaskFunction] = None
+        self.executor: Optional[ThreadPoolExecutor] = None
+
+    def setup(
+        self,
+        config: DictConfig,
+        config_loader: ConfigLoader,
+        task_function: TaskFunction,
+    ) -> None:
+        self.config = config
+        self.config_loader = config_loader
+        self.task_function = task_function
+
+    def _run_job(self, sweep_config: DictConfig) -> JobReturn:
+        assert self.task_function is not None
+        try:
+            return run_job(
+                config=sweep_config,
+                task_function=self.task_function,
+                job_dir_key="hydra.sweep.dir",
+                job_subdir_key="hydra.sweep.subdir",
+                configure_logging=False,
+            )
+        except Exception:
+            return failed_job_return(sweep_config, traceback.format_exc())
+
+    def _run_job_in_context(
+        self, context: contextvars.Context, sweep_config: DictConfig
+    ) -> JobReturn:
+        return context.run(self._run_job, sweep_config)
+
+    def _submit(
+        self,
+        executor: ThreadPoolExecutor,
+        job_overrides: Sequence[Sequence[str]],
+        initial_job_idx: int,
+    ) -> List["Future[JobReturn]"]:
+        setup_globals()
+        assert self.config is not None
+        assert self.task_function is not None
+        assert self.config_loader is not None
+
+        configure_log(self.config.hydra.hydra_logging, self.config.hydra.verbose)
+        sweep_dir = self.config.hydra.sweep.dir
+        Path(str(sweep_dir)).mkdir(parents=True, exist_ok=True)
+        log.info(
+            "Launching {} jobs locally with {} threads".format(
+                len(job_overrides), self.n_jobs
+            )
+        )
+
+        sweep_configs: List[Tuple[int, DictConfig]] = []
+        for idx, overrides in enumerate(job_overrides):
+            idx = initial_job_idx + idx
+            log.info("\t#{} : {}".format(idx, " ".join(filter_overrides(overrides))))
+            sweep_config = self.config_loader.load_sweep_config(
+                self.config, list(overrides)
+            )
+            with open_dict(sweep_config):
+                sweep_config.hydra.job.id = idx
+                sweep_config.hydra.job.num = idx
+                # the working directory is shared by all the threads
+                sweep_config.hydra.job.chdir = False
+            sweep_configs.append((idx, sweep_config))
+
+        futures: List["Future[JobReturn]"] = []
+        for idx, sweep_config in sweep_configs:
+            # each job runs in a copy of the launcher context
+            future = executor.submit(
+                self._run_job_in_context, contextvars.copy_context(), sweep_config
+            )
+            future.add_done_callback(functools.partial(_log_failure, idx))
+            futures.append(future)
+        return futures
+
+    def launch(
+        self, job_overrides: Sequence[Sequence[str]], initial_job_idx: int
+    ) -> Sequence[JobReturn]:
+        with ThreadPoolExecutor(max_workers=self.n_jobs) as executor:
+            futures = self._submit(executor, job_overrides, initial_job_idx)
+            return [future.result() for future in futures]
+
+    def launch_async(
+        self, job_overrides: Sequence[Sequence[str]], initial_job_idx: int
+    ) -> Sequence["Future[JobReturn]"]:
+        # batches launched asynchronously share the threads of the launcher
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.n_jobs)
+        return self._submit(self.executor, job_overrides, initial_job_idx)
+
+    def close(self) -> None:
+        """
+        Stops the threads running the jobs launched with launch_async()
+        """
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+        super().close()
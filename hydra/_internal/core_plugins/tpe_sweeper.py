@@ -0,0 +1,321 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+"""
+Tree-structured Parzen Estimator (TPE) sweeper, suggesting batches of configurations from a
+model of the results of the completed jobs.
+The search space uses the syntax of the basic sweeper, for example:
+python foo.py -m hydra/sweeper=tpe lr=range(0,1,0.01) model=resnet,vgg,alexnet
+
+Ranges are numeric dimensions, comma separated lists are categorical dimensions (e.g. the
+options of a config group). The completed jobs are split into the good ones (the best
+gamma fraction) and the others, with a density estimated for each. Suggestions are the
+candidates sampled from the density of the good jobs that maximize the ratio of the two
+densities. Every batch holds as many suggestions as the launcher runs in parallel, each
+suggestion counting as a bad result for the next ones so that they are diverse.
+"""
+import logging
+import math
+import random
+from pathlib import Path
+from typing import Any, List, Optional, Sequence, Set, Tuple
+
+from omegaconf import DictConfig, OmegaConf
+
+from hydra.core.utils import JobReturn
+from hydra.plugins.reducer import job_metric
+from hydra.plugins.step_sweeper import StepSweeper
+
+from .basic_sweeper import RangeSequence, parse_sweep_values
+
+log = logging.getLogger(__name__)
+
+# parameters of the launchers bounding the number of jobs running at once
+_PARALLELISM_PARAMS = ["n_jobs", "max_concurrency", "max_cpus"]
+
+# batch size when the launcher runs as many jobs as the machine has CPUs.
+# The suggestions depend on the batch size, it does not depend on the machine.
+DEFAULT_BATCH_SIZE = 8
+
+
+def launcher_parallelism(config: DictConfig) -> Optional[int]:
+    """
+    :return: the number of jobs the configured launcher runs at once, 1 if unknown,
+             None if it depends on the number of CPUs of the machine
+    """
+    params = config.hydra.launcher.get("params") or {}
+    for key in _PARALLELISM_PARAMS:
+        if key in params:
+            value = params[key]
+            return int(value) if value is not None else None
+    return 1
+
+
+class Dimension:
+    """
+    A dimension of the search space, with the values of one sweep argument.
+    Numeric dimensions (ranges) are modeled on the index of their values, categorical
+    dimensions on the frequency of each value.
+    """
+
+    def __init__(self, key: str, values: Sequence[str]) -> None:
+        if len(values) == 0:
+            raise ValueError(f"No value to sweep for {key}")
+        self.key = key
+        self.values = values
+        self.numeric = isinstance(values, RangeSequence)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def override(self, idx: int) -> str:
+        return "{}={}".format(self.key, self.values[idx])
+
+
+def _normal_cdf(x: float) -> float:
+    return 0.5 * (1.0 + math.erf(x / math.sqrt(2.0)))
+
+
+class ParzenEstimator:
+    """
+    Density of the observed values of a dimension, with a prior covering all its values.
+    """
+
+    def __init__(self, dim: Dimension, observations: Sequence[int]) -> None:
+        self.dim = dim
+        size = len(dim)
+        if dim.numeric:
+            # a gaussian per observation, with the distance to its neighbors as bandwidth
+            mus = sorted(float(idx) for idx in observations)
+            low, high = -0.5, size - 0.5
+            min_sigma = size / min(100.0, len(mus) + 1.0)
+            self.mus: List[float] = []
+            self.sigmas: List[float] = []
+            for i, mu in enumerate(mus):
+                left = mus[i - 1] if i > 0 else low
+                right = mus[i + 1] if i + 1 < len(mus) else high
+                self.mus.append(mu)
+                self.sigmas.append(min(max(mu - left, right - mu, min_sigma), size))
+            # the prior is a wide gaussian in the middle of the range
+            self.mus.append((size - 1) / 2.0)
+            self.sigmas.append(float(size))
+        else:
+            # counts of the observed values, with a pseudo count for each value
+            counts = [1.0] * size
+            for idx in observations:
+                counts[idx] += 1.0
+            total = sum(counts)
+            self.probs = [c / total for c in counts]
+
+    def sample(self, rng: random.Random) -> int:
+        size = len(self.dim)
+        if not self.dim.numeric:
+            return rng.choices(range(size), weights=self.probs)[0]
+        component = rng.randrange(len(self.mus))
+        mu, sigma = self.mus[component], self.sigmas[component]
+        for _ in range(100):
+            idx = int(round(rng.gauss(mu, sigma)))
+            if 0 <= idx < size:
+                return idx
+        return min(max(int(round(mu)), 0), size - 1)
+
+    def log_pdf(self, idx: int) -> float:
+        if not self.dim.numeric:
+            return math.log(self.probs[idx])
+        size = len(self.dim)
+        mass = 0.0
+        for mu, sigma in zip(self.mus, self.sigmas):
+            # mass of the value, for the gaussian truncated to the range of the values
+            total = _normal_cdf((size - 0.5 - mu) / sigma) - _normal_cdf(
+                (-0.5 - mu) / sigma
+            )
+            value = _normal_cdf((idx + 0.5 - mu) / sigma) - _normal_cdf(
+                (idx - 0.5 - mu) / sigma
+            )
+            mass += value / total
+        return math.log(max(mass / len(self.mus), 1e-300))
+
+
+class TPESweeper(StepSweeper):
+    """
+    TPE sweeper, each batch holds batch_size suggestions
+    """
+
+    def __init__(
+        self,
+        num_trials: int = 100,
+        batch_size: Optional[int] = None,
+        num_startup_trials: int = 10,
+        gamma: float = 0.25,
+        num_candidates: int = 24,
+        metric: Optional[str] = None,
+        mode: str = "min",
+        seed: int = 0,
+    ) -> None:
+        """
+        :param num_trials: total number of jobs to launch
+        :param batch_size: number of suggestions in a batch, None for the number of jobs the
+               launcher runs in parallel
+        :param num_startup_trials: number of completed jobs sampled at random before using the model
+        :param gamma: fraction of the completed jobs modeled as good results
+        :param num_candidates: number of candidates sampled for each suggestion
+        :param metric: key of the metric in the dict returned by the jobs, None if they return a number
+        :param mode: min or max, whether the metric is minimized or maximized
+        :param seed: seed of the sampling of the configurations
+        """
+        super(TPESweeper, self).__init__()
+        if num_trials <= 0:
+            raise ValueError(f"num_trials must be a positive number, got {num_trials}")
+        if batch_size is not None and batch_size <= 0:
+            raise ValueError(f"batch_size must be a positive number, got {batch_size}")
+        if not 0 < gamma < 1:
+            raise ValueError(f"gamma must be in (0, 1), got {gamma}")
+        if num_candidates <= 0:
+            raise ValueError(
+                f"num_candidates must be a positive number, got {num_candidates}"
+            )
+        if mode not in ("min", "max"):
+            raise ValueError(f"mode must be min or max, got {mode}")
+        self.num_trials = num_trials
+        self.batch_size = batch_size
+        self.num_startup_trials = num_startup_trials
+        self.gamma = gamma
+        self.num_candidates = num_candidates
+        self.metric = metric
+        self.mode = mode
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.space: List[Dimension] = []
+        # value index of each dimension, with the metric to minimize
+        self.observations: List[Tuple[Tuple[int, ...], float]] = []
+        # configurations already suggested, to avoid duplicates
+        self.suggested: Set[Tuple[int, ...]] = set()
+        self.pending: List[Tuple[int, ...]] = []
+        # number of suggestions in a batch
+        self.q = batch_size or 1
+
+    def set_search_space(self, arguments: Sequence[str]) -> None:
+        self.space = []
+        for s in arguments:
+            key, value = s.split("=", 1)
+            self.space.append(Dimension(key, parse_sweep_values(value)))
+        self.rng = random.Random(self.seed)
+        self.observations = []
+        self.suggested = set()
+        self.pending = []
+
+    def sweep(self, arguments: List[str]) -> Any:
+        assert self.config is not None
+        self.set_search_space(arguments)
+        batch_size = self.batch_size or launcher_parallelism(self.config)
+        if batch_size is None:
+            log.info(
+                "The launcher runs as many jobs as there are CPUs, using batches of {}"
+                " suggestions to make the same suggestions on every machine."
+                " Set hydra.sweeper.params.batch_size to change it".format(
+                    DEFAULT_BATCH_SIZE
+                )
+            )
+            batch_size = DEFAULT_BATCH_SIZE
+        self.q = batch_size
+        log.info(
+            "TPE sweeper : {} trials in batches of {}".format(self.num_trials, self.q)
+        )
+        returns = super(TPESweeper, self).sweep(arguments)
+        self.save_results()
+        return returns
+
+    def sample_random(self) -> Tuple[int, ...]:
+        return tuple(self.rng.randrange(len(dim)) for dim in self.space)
+
+    def sample_model(self, lies: Sequence[Tuple[int, ...]]) -> Tuple[int, ...]:
+        """
+        :param lies: suggestions of the current batch, modeled as bad results
+        :return: the candidate with the highest ratio of the good and bad densities
+        """
+        ranked = sorted(self.observations, key=lambda x: x[1])
+        num_good = max(1, int(math.ceil(self.gamma * len(ranked))))
+        good = [config for config, _ in ranked[:num_good]]
+        bad = [config for config, _ in ranked[num_good:]] + list(lies)
+        candidates: List[Tuple[float, Tuple[int, ...]]] = []
+        good_estimators = []
+        bad_estimators = []
+        for pos, dim in enumerate(self.space):
+            good_estimators.append(ParzenEstimator(dim, [c[pos] for c in good]))
+            bad_estimators.append(ParzenEstimator(dim, [c[pos] for c in bad]))
+        for _ in range(self.num_candidates):
+            candidate = tuple(est.sample(self.rng) for est in good_estimators)
+            score = sum(
+                good_est.log_pdf(idx) - bad_est.log_pdf(idx)
+                for good_est, bad_est, idx in zip(
+                    good_estimators, bad_estimators, candidate
+                )
+            )
+            candidates.append((score, candidate))
+        # stable: ties are broken by the sampling order
+        candidates.sort(key=lambda x: -x[0])
+        for _, candidate in candidates:
+            if candidate not in self.suggested:
+                return candidate
+        return candidates[0][1]
+
+    def suggest(self, lies: Sequence[Tuple[int, ...]]) -> Tuple[int, ...]:
+        if len(self.observations) < self.num_startup_trials:
+            config = self.sample_random()
+            for _ in range(100):
+                if config not in self.suggested:
+                    break
+                config = self.sample_random()
+            return config
+        return self.sample_model(lies)
+
+    def get_job_batch(self) -> Sequence[Sequence[str]]:
+        q = min(self.q, self.num_trials - self.launched_jobs)
+        self.pending = []
+        for _ in range(q):
+            config = self.suggest(self.pending)
+            self.suggested.add(config)
+            self.pending.append(config)
+        return [self.overrides(config) for config in self.pending]
+
+    def is_done(self) -> bool:
+        return self.launched_jobs >= self.num_trials
+
+    def update_results(self, job_results: Sequence[JobReturn]) -> None:
+        for config, ret in zip(self.pending, job_results):
+            value = job_metric(ret, self.metric)
+            if value is None:
+                log.warning("No metric for {}".format(" ".join(self.overrides(config))))
+                continue
+            self.observations.append((config, value if self.mode == "min" else -value))
+        self.pending = []
+
+    def overrides(self, config: Tuple[int, ...]) -> List[str]:
+        return [dim.override(idx) for dim, idx in zip(self.space, config)]
+
+    def get_best(self) -> Optional[Tuple[float, List[str]]]:
+        """
+        :return: the best metric of the completed jobs, with the overrides of the configuration
+        """
+        if len(self.observations) == 0:
+            return None
+        config, value = min(self.observations, key=lambda x: x[1])
+        return (value if self.mode == "min" else -value), self.overrides(config)
+
+    def save_results(self) -> None:
+        assert self.config is not None
+        best = self.get_best()
+        if best is None:
+            log.warning("No job returned a metric")
+            return
+        value, overrides = best
+        log.info("Best configuration : {}".format(" ".join(overrides)))
+        log.info("Best {} : {}".format(self.metric or "metric", value))
+        results = OmegaConf.create(
+            {
+                "name": "tpe",
+                "best_evaluated_params": overrides,
+                "best_evaluated_result": value,
+            }
+        )
+        sweep_dir = Path(str(self.config.hydra.sweep.dir))
+        sweep_dir.mkdir(parents=True, exist_ok=True)
+        OmegaConf.save(results, str(sweep_dir / "optimization_results.yaml"))
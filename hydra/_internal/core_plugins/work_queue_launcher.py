@@ -0,0 +1,180 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+"""
+Launcher writing the jobs to a work queue on a shared file system.
+The jobs are run by workers started on any machine with access to the queue (hydra-worker).
+"""
+import logging
+import multiprocessing
+import time
+from pathlib import Path
+from typing import Any, List, Optional, Sequence, Tuple
+
+from omegaconf import DictConfig, open_dict
+
+from hydra._internal.work_queue import WorkQueue, run_worker
+from hydra.core.config_loader import ConfigLoader
+from hydra.core.utils import (
+    JobReturn,
+    JobStatus,
+    configure_log,
+    filter_overrides,
+    setup_globals,
+)
+from hydra.plugins.launcher import Launcher
+from hydra.types import TaskFunction
+
+log = logging.getLogger(__name__)
+
+
+class WorkQueueLauncher(Launcher):
+    def __init__(
+        self,
+        queue_file: Optional[str] = None,
+        heartbeat_timeout: float = 60.0,
+        poll_interval: float = 1.0,
+        local_workers: int = 0,
+        max_attempts: Optional[int] = 3,
+    ) -> None:
+        """
+        :param queue_file: SQLite database of the queue, on a file system shared with the workers.
+               None for work_queue.sqlite in the sweep directory
+        :param heartbeat_timeout: seconds without a heartbeat after which a running job is
+               considered lost and returned to the queue
+        :param poll_interval: seconds between two checks for completed jobs
+        :param local_workers: number of workers started by the launcher on this machine
+        :param max_attempts: number of times a job can lose its worker before it fails,
+               None to always return it to the queue
+        """
+        super().__init__()
+        if local_workers < 0:
+            raise ValueError(f"local_workers can't be negative, got {local_workers}")
+        if max_attempts is not None and max_attempts <= 0:
+            raise ValueError(
+                f"max_attempts must be a positive number, got {max_attempts}"
+            )
+        self.queue_file = queue_file
+        self.heartbeat_timeout = heartbeat_timeout
+        self.poll_interval = poll_interval
+        self.local_workers = local_workers
+        self.max_attempts = max_attempts
+        self.config: Optional[DictConfig] = None
+        self.config_loader: Optional[ConfigLoader] = None
+        self.task_function: Optional[TaskFunction] = None
+
+    def setup(
+        self,
+        config: DictConfig,
+        config_loader: ConfigLoader,
+        task_function: TaskFunction,
+    ) -> None:
+        self.config = config
+        self.config_loader = config_loader
+        self.task_function = task_function
+
+    def _start_local_workers(self, queue_file: str) -> Tuple[Any, List[Any]]:
+        context = multiprocessing.get_context("fork")
+        stop_event = context.Event()
+        workers = []
+        for _ in range(self.local_workers):
+            worker = context.Process(
+                target=run_worker,
+                kwargs=dict(
+                    queue_file=queue_file,
+                    task_function=self.task_function,
+                    heartbeat_interval=self.heartbeat_timeout / 4,
+                    poll_interval=self.poll_interval,
+                    stop_event=stop_event,
+                ),
+            )
+            worker.start()
+            workers.append(worker)
+        return stop_event, workers
+
+    def launch(
+        self, job_overrides: Sequence[Sequence[str]], initial_job_idx: int
+    ) -> Sequence[JobReturn]:
+        setup_globals()
+        assert self.config is not None
+        assert self.task_function is not None
+        assert self.config_loader is not None
+
+        configure_log(self.config.hydra.hydra_logging, self.config.hydra.verbose)
+        sweep_dir = self.config.hydra.sweep.dir
+        Path(str(sweep_dir)).mkdir(parents=True, exist_ok=True)
+        queue_file = self.queue_file
+        if queue_file is None:
+            queue_file = str(Path(str(sweep_dir)) / "work_queue.sqlite")
+        log.info(
+            "Queueing {} jobs, run workers with: hydra-worker {}".format(
+                len(job_overrides), queue_file
+            )
+        )
+
+        sweep_configs: List[Tuple[int, DictConfig]] = []
+        for idx, overrides in enumerate(job_overrides):
+            idx = initial_job_idx + idx
+            log.info("\t#{} : {}".format(idx, " ".join(filter_overrides(overrides))))
+            sweep_config = self.config_loader.load_sweep_config(
+                self.config, list(overrides)
+            )
+            with open_dict(sweep_config):
+                sweep_config.hydra.job.id = idx
+                sweep_config.hydra.job.num = idx
+            sweep_configs.append((idx, sweep_config))
+
+        if len(sweep_configs) == 0:
+            return []
+
+        queue = WorkQueue(queue_file)
+        stop_event = None
+        workers: List[Any] = []
+        try:
+            batch = queue.submit(self.task_function, sweep_configs)
+            if self.local_workers > 0:
+                stop_event, workers = self._start_local_workers(queue_file)
+            # since when all the local workers are dead and no job is running elsewhere
+            stalled_since: Optional[float] = None
+            while queue.num_done(batch) < len(sweep_configs):
+                time.sleep(self.poll_interval)
+                for idx, lost_worker, failed in queue.requeue_expired(
+                    batch, self.heartbeat_timeout, self.max_attempts
+                ):
+                    if failed:
+                        log.warning(
+                            "Job #{} lost its worker {} {} times, failing it".format(
+                                idx, lost_worker, self.max_attempts
+                            )
+                        )
+                    else:
+                        log.warning(
+                            "Job #{} lost its worker {}, returned to the queue".format(
+                                idx, lost_worker
+                            )
+                        )
+                if len(workers) == 0 or any(w.is_alive() for w in workers):
+                    continue
+                if queue.num_running(batch, self.heartbeat_timeout) > 0:
+                    stalled_since = None
+                elif stalled_since is None:
+                    stalled_since = time.time()
+                elif time.time() - stalled_since > self.heartbeat_timeout:
+                    raise RuntimeError(
+                        "All the {} local workers died and no other worker is running"
+                        " the jobs of the batch, exit codes: {}".format(
+                            len(workers), [w.exitcode for w in workers]
+                        )
+                    )
+            results = queue.results(batch)
+            queue.remove(batch)
+        finally:
+            if stop_event is not None:
+                stop_event.set()
+            for worker in workers:
+                worker.join()
+            queue.close()
+
+        runs = [results[idx] for idx, _ in sweep_configs]
+        for idx, ret in zip([idx for idx, _ in sweep_configs], runs):
+            if ret.status == JobStatus.FAILED:
+                log.error("Job #{} failed:\n{}".format(idx, ret.error))
+        return runs
@@ -12,6 +12,7 @@ from omegaconf import DictConfig, OmegaConf, open_dict
 from hydra.core.config_loader import ConfigLoader
 from hydra.core.config_search_path import ConfigSearchPath
 from hydra.core.hydra_config import HydraConfig
+from hydra.core.phase_timer import PhaseTimer
 from hydra.core.plugins import Plugins
 from hydra.core.utils import (
     JobReturn,
@@ -298,8 +299,8 @@ class Hydra:
             Hydra._log_header(
                 header="{}:".format(plugin_type.__name__), prefix="\t", filler="-"
             )
-            for plugin in Plugins.discover(plugin_type):
-                log.debug("\t\t{}".format(plugin.__name__))
+            for plugin in Plugins.descriptors(plugin_type):
+                log.debug("\t\t{}".format(plugin.name))
 
     def _get_padding(self,) -> Tuple[int, int, int]:
         provider_pad = 0
@@ -366,10 +367,23 @@ class Hydra:
             else:
                 log.debug("{} : NOT FOUND".format(trace.filename))
 
+    def _print_timing(self) -> None:
+        assert log is not None
+        timer = PhaseTimer.instance()
+        if len(timer.get_timings()) == 0:
+            return
+        log.debug("")
+        self._log_header("Timing", filler="*")
+        lines = timer.format_table()
+        self._log_header(lines[0], filler="-")
+        for line in lines[1:]:
+            log.debug(line)
+
     def _print_debug_info(self) -> None:
         self._print_plugins()
         self._print_search_path()
         self._print_composition_trace()
+        self._print_timing()
 
     def compose_config(
         self,
@@ -387,17 +401,24 @@ class Hydra:
                        otherwise forces specific behavior.
         :return:
         """
-        cfg = self.config_loader.load_configuration(
-            config_file=config_file, overrides=overrides, strict=strict
-        )
-        with open_dict(cfg):
-            from .. import __version__
-
-            cfg.hydra.runtime.version = __version__
-            cfg.hydra.runtime.cwd = os.getcwd()
+        timer = PhaseTimer.instance()
+        with timer.phase("compose_config"):
+            with timer.phase("load_configuration"):
+                cfg = self.config_loader.load_configuration(
+                    config_file=config_file, overrides=overrides, strict=strict
+                )
+            with open_dict(cfg):
+                from .. import __version__
+
+                cfg.hydra.runtime.version = __version__
+                cfg.hydra.runtime.cwd = os.getcwd()
+            if with_log_configuration:
+                with timer.phase("configure_log"):
+                    configure_log(cfg.hydra.hydra_logging, cfg.hydra.verbose)
+                global log
+                log = logging.getLogger(__name__)
+        # the startup is over, the configs of the jobs of a sweep are not timed
+        timer.stop()
         if with_log_configuration:
-            configure_log(cfg.hydra.hydra_logging, cfg.hydra.verbose)
-            global log
-            log = logging.getLogger(__name__)
             self._print_debug_info()
         return cfg
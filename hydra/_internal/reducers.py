@@ -0,0 +1,103 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+"""
+Built-in reducers, see hydra.plugins.reducer.Reducer
+"""
+import heapq
+import math
+from typing import Any, Dict, List, Optional, Tuple
+
+from hydra.core.utils import JobReturn, JobStatus
+from hydra.plugins.reducer import Reducer, job_metric
+
+
+class BestK(Reducer):
+    """
+    Keeps the k jobs with the best metric
+    """
+
+    def __init__(
+        self, k: int = 1, metric: Optional[str] = None, mode: str = "min"
+    ) -> None:
+        """
+        :param k: number of jobs to keep
+        :param metric: key of the metric in the dict returned by the jobs, None if they return a number
+        :param mode: min or max, whether the metric is minimized or maximized
+        """
+        if k <= 0:
+            raise ValueError(f"k must be a positive number, got {k}")
+        if mode not in ("min", "max"):
+            raise ValueError(f"mode must be min or max, got {mode}")
+        self.k = k
+        self.metric = metric
+        self.mode = mode
+        # heap of the kept jobs, the worst one first: (-score, -order, job_return)
+        self.heap: List[Tuple[float, int, JobReturn]] = []
+        self.num_added = 0
+
+    def add(self, job_return: JobReturn) -> None:
+        value = job_metric(job_return, self.metric)
+        self.num_added += 1
+        if value is None:
+            return
+        score = value if self.mode == "min" else -value
+        # on ties, the job added first is better
+        item = (-score, -self.num_added, job_return)
+        if len(self.heap) < self.k:
+            heapq.heappush(self.heap, item)
+        elif item[:2] > self.heap[0][:2]:
+            heapq.heapreplace(self.heap, item)
+
+    def result(self) -> List[JobReturn]:
+        """
+        :return: the JobReturn of the best jobs, the best one first
+        """
+        return [
+            ret for _, _, ret in sorted(self.heap, key=lambda x: x[:2], reverse=True)
+        ]
+
+
+class RunningStats(Reducer):
+    """
+    Statistics of the metric of the jobs, computed in a single pass
+    """
+
+    def __init__(self, metric: Optional[str] = None) -> None:
+        """
+        :param metric: key of the metric in the dict returned by the jobs, None if they return a number
+        """
+        self.metric = metric
+        self.count = 0
+        self.failed = 0
+        self.mean = 0.0
+        # sum of the squared differences to the mean
+        self.m2 = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def add(self, job_return: JobReturn) -> None:
+        if job_return.status == JobStatus.FAILED:
+            self.failed += 1
+        value = job_metric(job_return, self.metric)
+        if value is None:
+            return
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def result(self) -> Dict[str, Any]:
+        """
+        :return: count, failed, mean, std (sample standard deviation), min and max.
+                 count is the number of jobs that returned a metric.
+        """
+        std = math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else None
+        return {
+            "count": self.count,
+            "failed": self.failed,
+            "mean": self.mean if self.count > 0 else None,
+            "std": std,
+            "min": self.min,
+            "max": self.max,
+        }
@@ -7,12 +7,21 @@ from hydra.plugins.config_source import ConfigSource
 
 class SourcesRegistry(metaclass=Singleton):
     types: Dict[str, Type[ConfigSource]]
+    # scheme -> class name of sources that are imported on first use
+    lazy_types: Dict[str, str]
 
     def __init__(self) -> None:
         self.types = {}
+        self.lazy_types = {}
 
     def register(self, type_: Type[ConfigSource]) -> None:
         scheme = type_.scheme()
+        if scheme in self.lazy_types:
+            if self.lazy_types[scheme].split(".")[-1] != type_.__name__:
+                raise ValueError(
+                    f"{scheme} is already registered with a different class"
+                )
+            del self.lazy_types[scheme]
         if scheme in self.types:
             if self.types[scheme].__name__ != type_.__name__:
                 raise ValueError(
@@ -23,9 +32,38 @@ class SourcesRegistry(metaclass=Singleton):
                 return
         self.types[scheme] = type_
 
+    def register_lazy(self, scheme: str, class_name: str) -> None:
+        """
+        Registers a config source without importing it.
+        :param scheme: the scheme of the config source
+        :param class_name: fully qualified class name of the config source
+        """
+        registered = self.lazy_types.get(scheme)
+        if registered is None and scheme in self.types:
+            registered = self.types[scheme].__name__
+        if registered is not None:
+            if registered.split(".")[-1] != class_name.split(".")[-1]:
+                raise ValueError(
+                    f"{scheme} is already registered with a different class"
+                )
+            else:
+                # Do not replace existing ConfigSource
+                return
+        self.lazy_types[scheme] = class_name
+
     def resolve(self, scheme: str) -> Type[ConfigSource]:
+        if scheme in self.lazy_types:
+            from hydra.utils import get_class
+
+            type_ = get_class(self.lazy_types[scheme])
+            if not issubclass(type_, ConfigSource):
+                raise ValueError(
+                    f"{self.lazy_types[scheme]} registered for schema {scheme} is not a ConfigSource"
+                )
+            del self.lazy_types[scheme]
+            self.types[scheme] = type_
         if scheme not in self.types:
-            supported = ", ".join(sorted(self.types.keys()))
+            supported = ", ".join(sorted(self.types.keys() | self.lazy_types.keys()))
             raise ValueError(
                 f"No config source registered for schema {scheme}, supported types : [{supported}]"
             )
@@ -128,45 +128,75 @@ def create_automatic_config_search_path(
 
 
 def create_config_search_path(search_path_dir: Optional[str]) -> ConfigSearchPath:
+    from hydra.core.phase_timer import PhaseTimer
     from hydra.core.plugins import Plugins
     from hydra.plugins.search_path_plugin import SearchPathPlugin
 
-    Plugins.register_config_sources()
+    timer = PhaseTimer.instance()
+    with timer.phase("register_config_sources"):
+        Plugins.register_config_sources()
     search_path = ConfigSearchPathImpl()
     search_path.append("hydra", "pkg://hydra.conf")
     if search_path_dir is not None:
         search_path.append("main", search_path_dir)
 
-    search_path_plugins = Plugins.discover(SearchPathPlugin)
+    with timer.phase("discover_search_path_plugins"):
+        search_path_plugins = Plugins.discover(SearchPathPlugin)
     for spp in search_path_plugins:
-        plugin = spp()
-        assert isinstance(plugin, SearchPathPlugin)
-        plugin.manipulate_search_path(search_path)
+        with timer.phase(f"search_path_plugin {spp.__name__}"):
+            plugin = spp()
+            assert isinstance(plugin, SearchPathPlugin)
+            plugin.manipulate_search_path(search_path)
 
     return search_path
 
 
+def _timing_requested(overrides: Sequence[str]) -> bool:
+    """
+    The startup is timed before the config is composed, so only the command line overrides
+    can enable the timing of the startup phases.
+    :return: True if the overrides enable hydra.timing or hydra.verbose
+    """
+    for override in overrides:
+        key, _, value = override.partition("=")
+        key = key.strip()
+        value = value.strip().lower()
+        if key == "hydra.timing" and value == "true":
+            return True
+        if key == "hydra.verbose" and value not in ("", "false", "null", "[]"):
+            return True
+    return False
+
+
 def run_hydra(
     args_parser: argparse.ArgumentParser,
     task_function: TaskFunction,
     config_path: Optional[str],
     strict: Optional[bool],
 ) -> None:
+    from hydra.core.phase_timer import PhaseTimer
+
     from .hydra import Hydra
 
-    calling_file, calling_module = detect_calling_file_or_module(3)
+    args = args_parser.parse_args()
+    timer = PhaseTimer.instance()
+    if _timing_requested(args.overrides):
+        timer.start()
+    with timer.phase("detect_calling_file_or_module"):
+        calling_file, calling_module = detect_calling_file_or_module(3)
     config_dir, config_file = split_config_path(config_path)
     strict = _strict_mode_strategy(strict, config_file)
     task_name = detect_task_name(calling_file, calling_module)
-    search_path = create_automatic_config_search_path(
-        calling_file, calling_module, config_dir
-    )
+    with timer.phase("create_config_search_path"):
+        search_path = create_automatic_config_search_path(
+            calling_file, calling_module, config_dir
+        )
 
-    hydra = Hydra.create_main_hydra2(
-        task_name=task_name, config_search_path=search_path, strict=strict
-    )
+    with timer.phase("create_hydra"):
+        hydra = Hydra.create_main_hydra2(
+            task_name=task_name, config_search_path=search_path, strict=strict
+        )
 
-    args = args_parser.parse_args()
     if args.help:
         hydra.app_help(config_file=config_file, args_parser=args_parser, args=args)
         sys.exit(0)
@@ -0,0 +1,375 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+"""
+A queue of jobs in a SQLite database on a shared file system, and the workers running them.
+Workers on any machine with access to the database pull the jobs, run them and write back
+their results. Start a worker with:
+hydra-worker <queue_file>
+"""
+import argparse
+import importlib
+import importlib.util
+import inspect
+import json
+import logging
+import os
+import pickle
+import socket
+import sqlite3
+import sys
+import threading
+import time
+import traceback
+import uuid
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from omegaconf import DictConfig
+
+from hydra.core.hydra_config import HydraConfig
+from hydra.core.utils import (
+    JobReturn,
+    JobRuntime,
+    failed_job_return,
+    run_job,
+    setup_globals,
+)
+from hydra.types import TaskFunction
+
+log = logging.getLogger(__name__)
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    batch TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    task TEXT NOT NULL,
+    config BLOB NOT NULL,
+    status TEXT NOT NULL,
+    worker TEXT,
+    heartbeat REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    result BLOB
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, id);
+CREATE INDEX IF NOT EXISTS jobs_batch ON jobs (batch, status);
+"""
+
+
+def task_reference(task_function: TaskFunction) -> Dict[str, Optional[str]]:
+    """
+    :return: what a worker needs to import the task function: module, file and qualified name
+    """
+    func: Any = inspect.unwrap(task_function)
+    try:
+        file: Optional[str] = os.path.abspath(inspect.getfile(func))
+    except TypeError:
+        file = None
+    return {
+        "module": getattr(func, "__module__", None),
+        "file": file,
+        "qualname": getattr(func, "__qualname__", None),
+    }
+
+
+def load_task_function(reference: Dict[str, Optional[str]]) -> TaskFunction:
+    """
+    Imports the task function from its reference, see task_reference()
+    """
+    module_name = reference["module"]
+    file = reference["file"]
+    qualname = reference["qualname"]
+    if qualname is None or "<locals>" in qualname:
+        raise ValueError(f"Task function {qualname} can't be imported by a worker")
+    if file is not None:
+        # like running the app, the directory of the app is in the path
+        sys.path.insert(0, os.path.dirname(file))
+    if module_name is not None and module_name != "__main__":
+        module: Any = importlib.import_module(module_name)
+    else:
+        assert file is not None
+        spec = importlib.util.spec_from_file_location("__hydra_task__", file)
+        assert spec is not None and spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    obj = module
+    for name in qualname.split("."):
+        obj = getattr(obj, name)
+    # the function decorated by @hydra.main
+    ret: TaskFunction = inspect.unwrap(obj)
+    return ret
+
+
+class WorkQueue:
+    def __init__(self, queue_file: str) -> None:
+        self.queue_file = queue_file
+        dirname = os.path.dirname(os.path.abspath(queue_file))
+        os.makedirs(dirname, exist_ok=True)
+        self.conn = sqlite3.connect(queue_file, timeout=60, isolation_level=None)
+        self.conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def submit(
+        self,
+        task_function: TaskFunction,
+        sweep_configs: Sequence[Tuple[int, DictConfig]],
+    ) -> str:
+        """
+        Adds the jobs of a batch to the queue
+        :return: the id of the batch
+        """
+        batch = uuid.uuid4().hex
+        task = json.dumps(task_reference(task_function))
+        with self.conn:
+            self.conn.execute("BEGIN IMMEDIATE")
+            self.conn.executemany(
+                "INSERT INTO jobs (batch, idx, task, config, status) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (batch, idx, task, pickle.dumps(config), PENDING)
+                    for idx, config in sweep_configs
+                ],
+            )
+        return batch
+
+    def claim(self, worker: str) -> Optional[Tuple[int, Dict[str, Any], DictConfig]]:
+        """
+        Atomically takes the next pending job
+        :return: the id of the job, the reference of the task function and the job config
+        """
+        with self.conn:
+            self.conn.execute("BEGIN IMMEDIATE")
+            row = self.conn.execute(
+                "SELECT id, task, config FROM jobs WHERE status = ? ORDER BY id LIMIT 1",
+                (PENDING,),
+            ).fetchone()
+            if row is None:
+                return None
+            job_id, task, config = row
+            self.conn.execute(
+                "UPDATE jobs SET status = ?, worker = ?, heartbeat = ?,"
+                " attempts = attempts + 1 WHERE id = ?",
+                (RUNNING, worker, time.time(), job_id),
+            )
+        return job_id, json.loads(task), pickle.loads(config)
+
+    def heartbeat(self, job_id: int, worker: str) -> None:
+        self.conn.execute(
+            "UPDATE jobs SET heartbeat = ? WHERE id = ? AND worker = ? AND status = ?",
+            (time.time(), job_id, worker, RUNNING),
+        )
+
+    def complete(self, job_id: int, worker: str, ret: JobReturn) -> bool:
+        """
+        Stores the result of a job, if the job is still running on this worker
+        :return: False if the job was returned to the queue in the meantime, its result is dropped
+        """
+        cursor = self.conn.execute(
+            "UPDATE jobs SET status = ?, result = ?"
+            " WHERE id = ? AND worker = ? AND status = ?",
+            (DONE, pickle.dumps(ret), job_id, worker, RUNNING),
+        )
+        return cursor.rowcount == 1
+
+    def requeue_expired(
+        self, batch: str, timeout: float, max_attempts: Optional[int] = None
+    ) -> List[Tuple[int, str, bool]]:
+        """
+        Returns the running jobs without a recent heartbeat to the queue.
+        A job that already lost its worker max_attempts times, e.g. because it kills the worker
+        running it, is not returned to the queue but completed with a failed JobReturn.
+        :return: the index and the worker of the expired jobs, and whether they failed
+        """
+        with self.conn:
+            self.conn.execute("BEGIN IMMEDIATE")
+            expired = self.conn.execute(
+                "SELECT id, idx, worker, attempts, config FROM jobs"
+                " WHERE batch = ? AND status = ? AND heartbeat < ?",
+                (batch, RUNNING, time.time() - timeout),
+            ).fetchall()
+            ret: List[Tuple[int, str, bool]] = []
+            for job_id, idx, worker, attempts, config in expired:
+                failed = max_attempts is not None and attempts >= max_attempts
+                if failed:
+                    error = "Job lost its worker {} times, last worker: {}".format(
+                        attempts, worker
+                    )
+                    result = failed_job_return(pickle.loads(config), error)
+                    self.conn.execute(
+                        "UPDATE jobs SET status = ?, result = ? WHERE id = ?",
+                        (DONE, pickle.dumps(result), job_id),
+                    )
+                else:
+                    self.conn.execute(
+                        "UPDATE jobs SET status = ?, worker = NULL WHERE id = ?",
+                        (PENDING, job_id),
+                    )
+                ret.append((idx, worker, failed))
+        return ret
+
+    def num_running(self, batch: str, timeout: float) -> int:
+        """
+        :return: the number of jobs of the batch running with a heartbeat in the last timeout seconds
+        """
+        row = self.conn.execute(
+            "SELECT COUNT(*) FROM jobs WHERE batch = ? AND status = ? AND heartbeat >= ?",
+            (batch, RUNNING, time.time() - timeout),
+        ).fetchone()
+        return int(row[0])
+
+    def num_done(self, batch: str) -> int:
+        row = self.conn.execute(
+            "SELECT COUNT(*) FROM jobs WHERE batch = ? AND status = ?", (batch, DONE)
+        ).fetchone()
+        return int(row[0])
+
+    def results(self, batch: str) -> Dict[int, JobReturn]:
+        """
+        :return: the results of the completed jobs of a batch, by job index
+        """
+        rows = self.conn.execute(
+            "SELECT idx, result FROM jobs WHERE batch = ? AND status = ?",
+            (batch, DONE),
+        ).fetchall()
+        return {idx: pickle.loads(result) for idx, result in rows}
+
+    def remove(self, batch: str) -> None:
+        self.conn.execute("DELETE FROM jobs WHERE batch = ?", (batch,))
+
+
+def _run_claimed_job(task_function: TaskFunction, config: DictConfig) -> JobReturn:
+    HydraConfig.instance().set_config(config)
+    JobRuntime.instance().set("name", config.hydra.job.name)
+    try:
+        return run_job(
+            config=config,
+            task_function=task_function,
+            job_dir_key="hydra.sweep.dir",
+            job_subdir_key="hydra.sweep.subdir",
+        )
+    except Exception:
+        return failed_job_return(config, traceback.format_exc())
+
+
+def run_worker(
+    queue_file: str,
+    task_function: Optional[TaskFunction] = None,
+    heartbeat_interval: float = 10.0,
+    poll_interval: float = 1.0,
+    idle_timeout: Optional[float] = None,
+    stop_event: Optional[Any] = None,
+) -> int:
+    """
+    Runs the jobs of the queue one at a time
+    :param queue_file: the SQLite database of the queue
+    :param task_function: the task function of the jobs, imported from the reference stored
+           with each job if None
+    :param heartbeat_interval: seconds between two heartbeats of a running job
+    :param poll_interval: seconds between two checks for new jobs
+    :param idle_timeout: exit after this many seconds without a job, None to run forever
+    :param stop_event: exit when this event is set (e.g. a multiprocessing.Event)
+    :return: the number of jobs run
+    """
+    setup_globals()
+    worker = "{}:{}:{}".format(socket.gethostname(), os.getpid(), uuid.uuid4().hex[:8])
+    while not os.path.exists(queue_file):
+        time.sleep(poll_interval)
+    queue = WorkQueue(queue_file)
+    tasks: Dict[str, TaskFunction] = {}
+    num_jobs = 0
+    idle_since = time.time()
+    try:
+        while stop_event is None or not stop_event.is_set():
+            claimed = queue.claim(worker)
+            if claimed is None:
+                if idle_timeout is not None and time.time() - idle_since > idle_timeout:
+                    break
+                time.sleep(poll_interval)
+                continue
+            job_id, reference, config = claimed
+            log.info("Worker {} running job #{}".format(worker, config.hydra.job.num))
+            func = task_function
+            if func is None:
+                key = json.dumps(reference, sort_keys=True)
+                if key not in tasks:
+                    tasks[key] = load_task_function(reference)
+                func = tasks[key]
+
+            done = threading.Event()
+
+            def beat() -> None:
+                heartbeat_queue = WorkQueue(queue_file)
+                try:
+                    while not done.wait(heartbeat_interval):
+                        heartbeat_queue.heartbeat(job_id, worker)
+                finally:
+                    heartbeat_queue.close()
+
+            heartbeat_thread = threading.Thread(target=beat, daemon=True)
+            heartbeat_thread.start()
+            try:
+                ret = _run_claimed_job(func, config)
+            finally:
+                done.set()
+                heartbeat_thread.join()
+            try:
+                completed = queue.complete(job_id, worker, ret)
+            except Exception:
+                # e.g. a return value that can't be pickled
+                completed = queue.complete(
+                    job_id, worker, failed_job_return(config, traceback.format_exc())
+                )
+            if not completed:
+                log.warning(
+                    "Job #{} was returned to the queue while worker {} ran it,"
+                    " dropping its result".format(config.hydra.job.num, worker)
+                )
+            num_jobs += 1
+            idle_since = time.time()
+    finally:
+        queue.close()
+    return num_jobs
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Runs the jobs of a Hydra work queue (hydra/launcher=work_queue)"
+    )
+    parser.add_argument("queue_file", help="SQLite database of the queue")
+    parser.add_argument(
+        "--heartbeat-interval",
+        type=float,
+        default=10.0,
+        help="Seconds between two heartbeats of a running job",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=1.0,
+        help="Seconds between two checks for new jobs",
+    )
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=None,
+        help="Exit after this many seconds without a job (default: run forever)",
+    )
+    parsed = parser.parse_args(args)
+    logging.basicConfig(
+        level=logging.INFO,
+        format="[%(asctime)s][%(name)s][%(levelname)s] - %(message)s",
+    )
+    num_jobs = run_worker(
+        queue_file=parsed.queue_file,
+        heartbeat_interval=parsed.heartbeat_interval,
+        poll_interval=parsed.poll_interval,
+        idle_timeout=parsed.idle_timeout,
+    )
+    log.info("Worker exiting after running {} jobs".format(num_jobs))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from omegaconf import DictConfig
 
@@ -47,6 +47,42 @@ class ConfigLoader(ABC):
     ) -> DictConfig:
         ...
 
+    def keep_sweep_configs(
+        self,
+        master_config: DictConfig,
+        sweep_configs: Dict[Tuple[str, ...], DictConfig],
+    ) -> None:
+        """
+        Keeps sweep configs already composed, e.g. by a sweeper, so that the next
+        load_sweep_config() with the same master config and overrides returns the kept config
+        instead of composing it again. Each kept config is returned once.
+        Replaces the configs kept before, an empty dict drops them.
+        :param master_config: the master config the sweep configs are composed from
+        :param sweep_configs: the sweep configs, by their sweep overrides
+        """
+        pass
+
+    def compose_many(
+        self,
+        config_file: Optional[str],
+        overrides_list: Sequence[List[str]],
+        strict: Optional[bool] = None,
+    ) -> List[DictConfig]:
+        """
+        Composes one config per overrides list.
+        Implementations may reuse the work shared between the composed configs.
+        :param config_file: the primary config file
+        :param overrides_list: a list of overrides lists, one per composed config
+        :param strict: strict mode for the composed configs
+        :return: the list of composed configs, in the order of overrides_list
+        """
+        return [
+            self.load_configuration(
+                config_file=config_file, overrides=list(overrides), strict=strict
+            )
+            for overrides in overrides_list
+        ]
+
     @abstractmethod
     def exists_in_search_path(self, filepath: str) -> bool:
         ...
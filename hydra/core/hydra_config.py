@@ -1,26 +1,58 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
 import copy
-from typing import Any
+from contextvars import ContextVar, Token
+from typing import Any, Optional
 
 from omegaconf import DictConfig, OmegaConf
 
 from hydra.core.singleton import Singleton
 
+# Hydra config of the job running in the current context (thread or asyncio task).
+# Jobs running concurrently in the same process each see their own config.
+_context_hydra: ContextVar[Optional[DictConfig]] = ContextVar(
+    "hydra_config", default=None
+)
 
-class HydraConfig(metaclass=Singleton):
-    hydra: DictConfig
 
+class HydraConfig(metaclass=Singleton):
     def __init__(self) -> None:
         ret = OmegaConf.create()
         assert isinstance(ret, DictConfig)
-        self.hydra = ret
+        self._hydra = ret
+
+    @property
+    def hydra(self) -> DictConfig:
+        """
+        The hydra config of the job running in the current context if there is one,
+        the process wide hydra config otherwise.
+        """
+        ret = _context_hydra.get()
+        if ret is None:
+            ret = self._hydra
+        return ret
 
     def set_config(self, cfg: DictConfig) -> None:
+        """
+        Sets the process wide hydra config
+        """
         try:
-            OmegaConf.set_readonly(self.hydra, False)
-            self.hydra = copy.deepcopy(cfg.hydra)
+            OmegaConf.set_readonly(self._hydra, False)
+            self._hydra = copy.deepcopy(cfg.hydra)
         finally:
-            OmegaConf.set_readonly(self.hydra, True)
+            OmegaConf.set_readonly(self._hydra, True)
+
+    def set_context_config(self, cfg: DictConfig) -> "Token[Optional[DictConfig]]":
+        """
+        Sets the hydra config of the current context only.
+        :param cfg: the job config
+        :return: a token to restore the previous config with reset_context_config()
+        """
+        hydra = copy.deepcopy(cfg.hydra)
+        OmegaConf.set_readonly(hydra, True)
+        return _context_hydra.set(hydra)
+
+    def reset_context_config(self, token: "Token[Optional[DictConfig]]") -> None:
+        _context_hydra.reset(token)
 
     @staticmethod
     def instance(*args: Any, **kwargs: Any) -> "HydraConfig":
@@ -0,0 +1,363 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+"""
+The environment of a single job: output dir, working dir, logging and the context local
+HydraConfig and JobRuntime, see run_job().
+Jobs running concurrently in the same process log to their own log files through handlers
+that only pass the records logged in the context of their job.
+"""
+import copy
+import logging
+import os
+from contextvars import ContextVar, Token
+from pathlib import Path
+from time import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from omegaconf import DictConfig, OmegaConf, open_dict
+
+from hydra.core.hydra_config import HydraConfig, _context_hydra
+from hydra.core.job_memo import JobMemo, config_hash
+from hydra.core.log_queue import LogQueue, resolve_log_files, start_log_queue
+from hydra.core.phase_timer import PhaseTimer
+from hydra.core.sweep_manifest import (
+    RUNNING,
+    manifest_enabled,
+    record_job,
+    summarize_return_value,
+)
+from hydra.core.utils import (
+    JobReturn,
+    JobRuntime,
+    JobStatus,
+    _configure_verbose,
+    _context_job_runtime,
+    _save_config,
+    _save_job_status,
+    _save_return_value,
+    configure_log,
+    get_job_memo,
+    log_queue_enabled,
+    set_num_shard,
+)
+
+log = logging.getLogger(__name__)
+
+
+# Identifies the job running in the current context, see _JobLogFilter
+_context_job: ContextVar[Optional[object]] = ContextVar("hydra_job", default=None)
+
+
+class _JobLogFilter(logging.Filter):
+    """
+    Passes the records logged in the context of a single job
+    """
+
+    def __init__(self, job: object) -> None:
+        super().__init__()
+        self.job = job
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return _context_job.get() is self.job
+
+
+def _job_log_config(log_config: DictConfig, output_dir: str) -> Dict[str, Any]:
+    """
+    :return: the job logging config with the relative log file names
+             resolved against the job output dir
+    """
+    conf: Dict[str, Any] = OmegaConf.to_container(  # type: ignore
+        log_config, resolve=True
+    )
+    return resolve_log_files(conf, output_dir)
+
+
+def _create_job_log_handlers(
+    log_config: Optional[DictConfig], output_dir: str, job: object
+) -> List[logging.Handler]:
+    """
+    Creates the file handlers of the job logging config, filtered to the records
+    logged in the context of the job.
+    """
+    if log_config is None:
+        return []
+    conf = _job_log_config(log_config, output_dir)
+    formatters = conf.get("formatters", {})
+    handlers: List[logging.Handler] = []
+    for handler_conf in conf.get("handlers", {}).values():
+        if "filename" not in handler_conf:
+            continue
+        handler = logging.FileHandler(handler_conf["filename"])
+        formatter = formatters.get(handler_conf.get("formatter"), {})
+        handler.setFormatter(
+            logging.Formatter(formatter.get("format"), formatter.get("datefmt"))
+        )
+        if "level" in handler_conf:
+            handler.setLevel(handler_conf["level"])
+        handler.addFilter(_JobLogFilter(job))
+        handlers.append(handler)
+    return handlers
+
+
+def _move_log_files(log_config: Optional[DictConfig], output_dir: str) -> None:
+    """
+    Points the file handlers created from the job logging config to the log files
+    in another output dir, without configuring the logging again.
+    """
+    if log_config is None:
+        return
+    conf = _job_log_config(log_config, output_dir)
+    filenames = {
+        name: handler["filename"]
+        for name, handler in conf.get("handlers", {}).items()
+        if "filename" in handler
+    }
+    loggers = [logging.getLogger()] + [
+        logger
+        for logger in logging.Logger.manager.loggerDict.values()
+        if isinstance(logger, logging.Logger)
+    ]
+    for logger in loggers:
+        for handler in logger.handlers:
+            name = handler.get_name()
+            if not isinstance(handler, logging.FileHandler) or name not in filenames:
+                continue
+            handler.acquire()
+            try:
+                handler.flush()
+                if handler.stream is not None:
+                    handler.stream.close()
+                handler.baseFilename = os.path.abspath(filenames[name])
+                handler.stream = handler._open()
+            finally:
+                handler.release()
+
+
+class _JobContext:
+    """
+    Sets up and tears down the environment of a single job: output dir, working dir,
+    logging and the context local HydraConfig and JobRuntime.
+    """
+
+    def __init__(
+        self,
+        config: DictConfig,
+        task_function: Callable[[DictConfig], Any],
+        job_dir_key: str,
+        job_subdir_key: Optional[str],
+        configure_logging: bool,
+        reuse_logging: bool = False,
+    ) -> None:
+        self.config = config
+        self.task_function = task_function
+        self.configure_logging = configure_logging
+        # the logging is already configured by a previous job with the same logging config
+        self.reuse_logging = reuse_logging
+        self.logging_configured = False
+        self.old_cwd = os.getcwd()
+        self.chdir = bool(config.hydra.job.get("chdir", True))
+        working_dir = str(config.select(job_dir_key))
+        if job_subdir_key is not None:
+            # evaluate job_subdir_key lazily.
+            # this is running on the client side in sweep and contains things such as job:id which
+            # are only available there.
+            set_num_shard(config)
+            subdir = str(config.select(job_subdir_key))
+            working_dir = os.path.join(working_dir, subdir)
+        self.working_dir = working_dir
+        # jobs of a sweep are recorded in the sweep manifest
+        self.record_manifest = job_subdir_key is not None and manifest_enabled(config)
+        self.output_dir = os.path.abspath(working_dir)
+        self.ret = JobReturn()
+        self.task_cfg = DictConfig({})
+        self.memo: Optional[JobMemo] = None
+        self.cfg_hash: Optional[str] = None
+        self.hydra_output = Path()
+        self.log_handlers: List[logging.Handler] = []
+        self.log_queue: Optional[LogQueue] = None
+        self.tokens: List[Tuple[ContextVar[Any], Token[Any]]] = []
+
+    def _set(self, var: "ContextVar[Any]", value: Any) -> None:
+        self.tokens.append((var, var.set(value)))
+
+    def enter(self) -> bool:
+        """
+        :return: False if the result of the job is memoized and it should not run
+        """
+        config = self.config
+        with open_dict(config):
+            config.hydra.runtime.output_dir = self.output_dir
+        self._set(_context_job, self)
+        self.tokens.append(
+            (_context_hydra, HydraConfig.instance().set_context_config(config))
+        )
+        self._set(_context_job_runtime, OmegaConf.create())
+
+        ret = self.ret
+        ret.working_dir = self.working_dir
+        task_cfg = copy.deepcopy(config)
+        del task_cfg["hydra"]
+        self.task_cfg = task_cfg
+        ret.cfg = task_cfg
+        ret.hydra_cfg = OmegaConf.create({"hydra": HydraConfig.instance().hydra})
+        overrides = OmegaConf.to_container(config.hydra.overrides.task)
+        assert isinstance(overrides, list)
+        ret.overrides = overrides
+        ret.task_name = JobRuntime.instance().get("name")
+
+        self.memo = get_job_memo(config, self.task_function)
+        if self.memo is not None or self.record_manifest:
+            try:
+                self.cfg_hash = config_hash(config)
+            except ValueError as e:
+                if self.memo is not None:
+                    log.warning("Not memoizing the result of the job. {}".format(e))
+                    self.memo = None
+        if self.record_manifest:
+            record_job(
+                config,
+                overrides=overrides,
+                status=RUNNING,
+                working_dir=self.output_dir,
+                config_hash=self.cfg_hash,
+                start_time=time(),
+            )
+        if self.memo is not None:
+            assert self.cfg_hash is not None
+            memoized = self.memo.get(self.cfg_hash)
+            if memoized is not None:
+                log.info(
+                    "Using memoized result of identical job in {}".format(
+                        memoized["working_dir"]
+                    )
+                )
+                ret.return_value = memoized["return_value"]
+                ret.status = JobStatus.COMPLETED
+                # the job dir is complete, resumed sweeps and load_sweep_results() find it
+                self._create_output_dir()
+                self._save_return_value()
+                ret.working_dir = memoized["working_dir"]
+                self._record_end(ret.status, working_dir=str(ret.working_dir))
+                return False
+
+        # handle output directories here
+        self._create_output_dir()
+        if self.chdir:
+            os.chdir(self.output_dir)
+
+        if self.configure_logging and log_queue_enabled(config):
+            if config.hydra.job_logging is not None:
+                self.log_queue = start_log_queue()
+                job_num = None
+                if not OmegaConf.is_missing(config.hydra.job, "num"):
+                    job_num = config.hydra.job.num
+                self.log_queue.configure(
+                    OmegaConf.to_container(  # type: ignore
+                        config.hydra.job_logging, resolve=True
+                    ),
+                    output_dir=self.output_dir,
+                    job=job_num,
+                )
+                _configure_verbose(config.hydra.verbose)
+            self.logging_configured = True
+        elif self.configure_logging and self.reuse_logging:
+            _move_log_files(config.hydra.job_logging, self.output_dir)
+            self.logging_configured = True
+        elif self.configure_logging:
+            self._configure_log()
+            self.logging_configured = True
+        else:
+            self.log_handlers = _create_job_log_handlers(
+                config.hydra.job_logging, self.output_dir, self
+            )
+            for handler in self.log_handlers:
+                logging.getLogger().addHandler(handler)
+
+        if config.hydra.get("timing", False):
+            PhaseTimer.instance().save(self.hydra_output / "timing.json")
+        return True
+
+    def _create_output_dir(self) -> None:
+        """
+        Creates the output dir of the job and saves its configs
+        """
+        config = self.config
+        Path(self.output_dir).mkdir(parents=True, exist_ok=True)
+        self.hydra_output = Path(self.output_dir) / str(config.hydra.output_subdir)
+        hydra_cfg = OmegaConf.masked_copy(config, "hydra")
+        assert isinstance(hydra_cfg, DictConfig)
+
+        _save_config(self.task_cfg, "config.yaml", self.hydra_output)
+        _save_config(hydra_cfg, "hydra.yaml", self.hydra_output)
+        _save_config(config.hydra.overrides.task, "overrides.yaml", self.hydra_output)
+
+    def _save_return_value(self) -> None:
+        """
+        Saves the completion marker of the job and its return value (hydra.save_return_value)
+        """
+        ret = self.ret
+        _save_job_status(ret.status, ret.return_value, ret.task_name, self.hydra_output)
+        save_format = self.config.hydra.get("save_return_value", None)
+        if save_format is not None:
+            _save_return_value(ret.return_value, str(save_format), self.hydra_output)
+
+    def _configure_log(self) -> None:
+        log_config = self.config.hydra.job_logging
+        if self.chdir or log_config is None:
+            configure_log(log_config, self.config.hydra.verbose)
+        else:
+            # log files are not relative to the working dir
+            configure_log(
+                OmegaConf.create(_job_log_config(log_config, self.output_dir)),
+                self.config.hydra.verbose,
+            )
+
+    def _record_end(
+        self, status: "JobStatus", working_dir: Optional[str] = None
+    ) -> None:
+        """
+        :param working_dir: the working dir of the job if it's not the one recorded when it
+               started, e.g. the dir of the memoized job
+        """
+        if self.record_manifest:
+            fields: Dict[str, Any] = {}
+            if working_dir is not None:
+                fields["working_dir"] = working_dir
+            record_job(
+                self.config,
+                status=status.name,
+                end_time=time(),
+                return_value=summarize_return_value(self.ret.return_value),
+                **fields,
+            )
+
+    def fail(self) -> None:
+        _save_job_status(JobStatus.FAILED, None, self.ret.task_name, self.hydra_output)
+        self._record_end(JobStatus.FAILED)
+
+    def complete(self, return_value: Any) -> None:
+        ret = self.ret
+        ret.return_value = return_value
+        ret.status = JobStatus.COMPLETED
+        self._save_return_value()
+        if self.memo is not None:
+            assert self.cfg_hash is not None
+            self.memo.put(self.cfg_hash, ret.return_value, self.output_dir)
+        ret.task_name = JobRuntime.instance().get("name")
+        self._record_end(ret.status)
+
+    def exit(self) -> None:
+        if not self.config.hydra.get("return_configs", True):
+            self.ret.cfg = None
+            self.ret.hydra_cfg = None
+        if self.log_queue is not None:
+            # the log files of the job are complete when it returns
+            self.log_queue.flush()
+        for handler in self.log_handlers:
+            logging.getLogger().removeHandler(handler)
+            handler.close()
+        self.log_handlers = []
+        for var, token in reversed(self.tokens):
+            var.reset(token)
+        self.tokens = []
+        if self.chdir:
+            os.chdir(self.old_cwd)
@@ -0,0 +1,102 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+import hashlib
+import inspect
+import json
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from omegaconf import DictConfig, ListConfig, OmegaConf
+from omegaconf.errors import MissingMandatoryValue
+
+from hydra.types import TaskFunction
+
+log = logging.getLogger(__name__)
+
+
+def config_hash(cfg: DictConfig) -> str:
+    """
+    Canonical hash of a config, independent of the order of the keys.
+    The hydra node is not part of the hash, the interpolations to it are resolved.
+    :param cfg: the config
+    :return: a hex digest of the resolved config
+    :raises ValueError: if the config can't be resolved, e.g. it has missing values
+    """
+    container: Dict[str, Any] = {}
+    try:
+        for key in cfg.keys():
+            if key == "hydra":
+                continue
+            value = cfg[key]
+            if isinstance(value, (DictConfig, ListConfig)):
+                value = OmegaConf.to_container(value, resolve=True)
+            container[str(key)] = value
+    except (KeyError, ValueError, MissingMandatoryValue) as e:
+        raise ValueError("The config can't be resolved : {}".format(e)) from e
+    data = json.dumps(container, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def task_function_id(task_function: TaskFunction) -> str:
+    """
+    :return: a name identifying the task function across processes, with a hash of the file
+             defining it, e.g. my_app.main-1a2b3c4d. Apps run as scripts are all in the
+             __main__ module, the file tells them apart.
+    """
+    func: Any = task_function
+    if not hasattr(func, "__qualname__"):
+        # a callable object
+        func = type(func)
+    module = getattr(func, "__module__", None) or "__unknown__"
+    ret = "{}.{}".format(module, func.__qualname__)
+    try:
+        file = os.path.abspath(inspect.getfile(func))
+    except TypeError:
+        # e.g. a builtin
+        return ret
+    return "{}-{}".format(ret, hashlib.sha256(file.encode("utf-8")).hexdigest()[:8])
+
+
+class JobMemo:
+    """
+    Results of completed jobs, keyed by the task function and the hash of the task config.
+    Each result is stored in a pickle file under memo_dir.
+    """
+
+    def __init__(self, memo_dir: str, task_function: TaskFunction) -> None:
+        self.memo_dir = Path(memo_dir) / task_function_id(task_function)
+
+    def _file(self, cfg_hash: str) -> Path:
+        return self.memo_dir / f"{cfg_hash}.pkl"
+
+    def get(self, cfg_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        :return: a dict with the return_value and the working_dir of the job, None if not found
+        """
+        try:
+            with open(str(self._file(cfg_hash)), "rb") as f:
+                entry = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            log.warning(f"Error loading memoized result {self._file(cfg_hash)} : {e}")
+            return None
+        assert isinstance(entry, dict)
+        return entry
+
+    def put(self, cfg_hash: str, return_value: Any, working_dir: str) -> None:
+        entry = {"return_value": return_value, "working_dir": working_dir}
+        try:
+            data = pickle.dumps(entry)
+        except Exception as e:
+            log.warning(f"Return value can't be memoized : {e}")
+            return
+        self.memo_dir.mkdir(parents=True, exist_ok=True)
+        # write and rename, concurrent readers never see a partial file
+        fd, tmp_file = tempfile.mkstemp(dir=str(self.memo_dir), suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_file, str(self._file(cfg_hash)))
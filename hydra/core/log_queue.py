@@ -0,0 +1,355 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+"""
+Queue based logging for the jobs of a sweep.
+The handlers of each logging config are created once per process. The records are put in a
+queue by the thread logging them, and written by the handlers in a background thread.
+Switching from a logging config to another, or moving the log files of a job to the output dir
+of the next job, does not recreate the handlers.
+The records of the jobs can also be collected in a single sweep log, including the records of
+jobs running in worker processes.
+"""
+import atexit
+import copy
+import gzip
+import json
+import logging
+import logging.config
+import os
+import queue
+import shutil
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Dict, List, Optional
+
+log = logging.getLogger(__name__)
+
+SWEEP_LOG_FORMAT = (
+    "[%(asctime)s][#%(hydra_job)s][%(name)s][%(levelname)s] - %(message)s"
+)
+
+
+class GzipRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler compressing the rotated log files, e.g. my_app.log.1.gz.
+    Can be used in the job logging config:
+    class: hydra.core.log_queue.GzipRotatingFileHandler
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.namer = self._gzip_name
+        self.rotator = self._gzip_rotate
+
+    @staticmethod
+    def _gzip_name(name: str) -> str:
+        return name + ".gz"
+
+    @staticmethod
+    def _gzip_rotate(source: str, dest: str) -> None:
+        with open(source, "rb") as f_in, gzip.open(dest, "wb") as f_out:
+            shutil.copyfileobj(f_in, f_out)
+        os.remove(source)
+
+
+def resolve_log_files(conf: Dict[str, Any], output_dir: str) -> Dict[str, Any]:
+    """
+    :param conf: a logging config, as a dict
+    :return: a copy of the config with the relative file names of the handlers
+             resolved against output_dir
+    """
+    conf = copy.deepcopy(conf)
+    for handler in conf.get("handlers", {}).values():
+        if "filename" in handler:
+            handler["filename"] = os.path.join(output_dir, handler["filename"])
+    return conf
+
+
+def _reopen(handler: logging.FileHandler, filename: str) -> None:
+    handler.acquire()
+    try:
+        handler.flush()
+        if handler.stream is not None:
+            handler.stream.close()
+        handler.baseFilename = os.path.abspath(filename)
+        handler.stream = handler._open()
+    finally:
+        handler.release()
+
+
+class _LogTarget:
+    """
+    The handlers of the root logger of a logging config
+    """
+
+    def __init__(self, conf: Dict[str, Any], output_dir: Optional[str]) -> None:
+        self.conf = conf
+        self.output_dir = output_dir
+        if output_dir is not None:
+            conf = resolve_log_files(conf, output_dir)
+        # builds the handlers without replacing the handlers of the logging module
+        configurator = logging.config.DictConfigurator(  # type: ignore
+            copy.deepcopy(conf)
+        )
+        config = configurator.config
+        formatters = config.get("formatters", {})
+        for name in formatters:
+            formatters[name] = configurator.configure_formatter(formatters[name])
+        filters = config.get("filters", {})
+        for name in filters:
+            filters[name] = configurator.configure_filter(filters[name])
+        handlers = config.get("handlers", {})
+        for name in sorted(handlers):
+            handler = configurator.configure_handler(handlers[name])
+            handler.name = name
+            handlers[name] = handler
+        root = config.get("root", {})
+        self.handlers: List[logging.Handler] = [
+            handlers[name] for name in root.get("handlers", [])
+        ]
+        self.file_handlers: Dict[str, logging.FileHandler] = {
+            name: handler
+            for name, handler in handlers.items()
+            if isinstance(handler, logging.FileHandler)
+        }
+
+    def apply_levels(self) -> None:
+        root = self.conf.get("root", {})
+        if "level" in root:
+            logging.getLogger().setLevel(root["level"])
+        for name, logger_conf in self.conf.get("loggers", {}).items():
+            logger = logging.getLogger(name)
+            if "level" in logger_conf:
+                logger.setLevel(logger_conf["level"])
+            if "propagate" in logger_conf:
+                logger.propagate = logger_conf["propagate"]
+
+    def close(self) -> None:
+        for handler in set(self.handlers) | set(self.file_handlers.values()):
+            handler.close()
+
+
+class _MoveLogFiles:
+    """
+    Moves the log files of a target to another output dir.
+    Sent through the queue, so that the records queued before go to the previous files.
+    """
+
+    def __init__(self, target: _LogTarget, output_dir: str) -> None:
+        self.target = target
+        self.output_dir = output_dir
+
+    def apply(self) -> None:
+        conf = resolve_log_files(self.target.conf, self.output_dir)
+        for name, handler in self.target.file_handlers.items():
+            _reopen(handler, conf["handlers"][name]["filename"])
+
+
+class _RoutingQueueHandler(QueueHandler):
+    """
+    Queues the records with the target and the job they are logged for
+    """
+
+    def __init__(self, log_queue: "LogQueue") -> None:
+        super().__init__(log_queue.queue)
+        self.log_queue = log_queue
+
+    def prepare(self, record: logging.LogRecord) -> Any:
+        ret = super().prepare(record)
+        ret.hydra_target = self.log_queue.target
+        ret.hydra_job = self.log_queue.job
+        return ret
+
+
+class _RoutingQueueListener(QueueListener):
+    def __init__(self, log_queue: "LogQueue") -> None:
+        super().__init__(log_queue.queue)
+        self.log_queue = log_queue
+
+    def handle(self, record: Any) -> None:
+        if isinstance(record, _MoveLogFiles):
+            try:
+                record.apply()
+            except Exception:
+                log.exception("Failed to move the log files")
+            return
+        target = record.hydra_target
+        if target is not None:
+            for handler in target.handlers:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+        sweep_log_queue = _sweep_log_queue
+        if record.hydra_job is not None and sweep_log_queue is not None:
+            # targets hold handlers, they are not sent to the sweep log
+            record = copy.copy(record)
+            del record.hydra_target
+            sweep_log_queue.put(record)
+
+
+class LogQueue:
+    """
+    Routes the records of the root logger of this process through a queue
+    """
+
+    def __init__(self) -> None:
+        self.pid = os.getpid()
+        self.queue: "queue.Queue[Any]" = queue.Queue()
+        # the targets of the logging configs used so far, by config
+        self.targets: Dict[str, _LogTarget] = {}
+        self.target: Optional[_LogTarget] = None
+        # the job number of the job logging, None outside of a job
+        self.job: Optional[Any] = None
+        self.handler = _RoutingQueueHandler(self)
+        self.listener = _RoutingQueueListener(self)
+
+    def start(self) -> None:
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        root.addHandler(self.handler)
+        self.listener.start()
+
+    def configure(
+        self,
+        conf: Dict[str, Any],
+        output_dir: Optional[str] = None,
+        job: Optional[Any] = None,
+    ) -> None:
+        """
+        Routes the next records to the handlers of a logging config.
+        The handlers of a config are created the first time it's used.
+        :param conf: the logging config, as a dict
+        :param output_dir: the dir of the relative log files, None for the current dir
+        :param job: the job number added to the records sent to the sweep log,
+               None if the records are not from a job
+        """
+        key = json.dumps(conf, sort_keys=True, default=str)
+        target = self.targets.get(key)
+        if target is None:
+            target = _LogTarget(conf, output_dir)
+            self.targets[key] = target
+        elif output_dir is not None and output_dir != target.output_dir:
+            self.queue.put(_MoveLogFiles(target, output_dir))
+            target.output_dir = output_dir
+        target.apply_levels()
+        self.target = target
+        self.job = job
+
+    def flush(self) -> None:
+        """
+        Waits for the records queued so far to be written
+        """
+        self.queue.join()
+
+    def stop(self) -> None:
+        root = logging.getLogger()
+        root.removeHandler(self.handler)
+        self.listener.stop()
+        for target in self.targets.values():
+            target.close()
+        self.targets = {}
+        self.target = None
+
+
+_log_queue: Optional[LogQueue] = None
+# queue of the sweep log, records of the jobs are sent to it
+_sweep_log_queue: Optional[Any] = None
+
+
+def get_log_queue() -> Optional[LogQueue]:
+    """
+    :return: the log queue of this process if queue based logging is started, None otherwise
+    """
+    if _log_queue is not None and _log_queue.pid == os.getpid():
+        return _log_queue
+    return None
+
+
+def start_log_queue() -> LogQueue:
+    """
+    Starts queue based logging in this process, if it's not started yet
+    :return: the log queue of this process
+    """
+    global _log_queue
+    ret = get_log_queue()
+    if ret is None:
+        ret = LogQueue()
+        ret.start()
+        _log_queue = ret
+    return ret
+
+
+def stop_log_queue() -> None:
+    """
+    Stops queue based logging in this process, after writing the queued records.
+    The root logger is left without handlers.
+    """
+    global _log_queue
+    log_queue = get_log_queue()
+    if log_queue is not None:
+        log_queue.stop()
+    _log_queue = None
+
+
+def _detach_in_child() -> None:
+    # the listener thread does not exist in a forked process, the handlers of the
+    # current target are used directly until the child starts its own log queue
+    global _log_queue
+    log_queue = _log_queue
+    _log_queue = None
+    if log_queue is None:
+        return
+    root = logging.getLogger()
+    root.removeHandler(log_queue.handler)
+    if log_queue.target is not None:
+        for handler in log_queue.target.handlers:
+            root.addHandler(handler)
+
+
+atexit.register(stop_log_queue)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_detach_in_child)
+
+
+def set_sweep_log_queue(sweep_log_queue: Optional[Any]) -> None:
+    """
+    Sends the records of the jobs running in this process to the queue of a sweep log
+    :param sweep_log_queue: the queue of the sweep log, None to stop sending the records
+    """
+    global _sweep_log_queue
+    _sweep_log_queue = sweep_log_queue
+
+
+class _SweepLogListener(QueueListener):
+    """
+    Also supports multiprocessing.SimpleQueue, which has no timeout or task_done()
+    """
+
+    def dequeue(self, block: bool) -> Any:
+        return self.queue.get()
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(getattr(self, "_sentinel", None))
+
+
+class SweepLog:
+    """
+    A log file collecting the records of all the jobs of a sweep, prefixed with the job number
+    """
+
+    def __init__(self, filename: str, sweep_log_queue: Any) -> None:
+        """
+        :param filename: the sweep log file
+        :param sweep_log_queue: the queue the jobs send their records to, a
+               multiprocessing.SimpleQueue for jobs running in other processes
+        """
+        self.queue = sweep_log_queue
+        self.handler = logging.FileHandler(filename)
+        self.handler.setFormatter(logging.Formatter(SWEEP_LOG_FORMAT))
+        self.listener = _SweepLogListener(sweep_log_queue, self.handler)
+        self.listener.start()
+
+    def close(self) -> None:
+        """
+        Writes the records sent so far and closes the file
+        """
+        self.listener.stop()
+        self.handler.close()
@@ -0,0 +1,109 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+import json
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from hydra.core.singleton import Singleton
+
+
+@dataclass
+class PhaseTiming:
+    name: str
+    # phase or config (time to load a single config file)
+    kind: str
+    # nesting level of the phase
+    depth: int
+    # wall and cpu time in seconds
+    wall: float
+    cpu: float
+
+
+class PhaseTimer(metaclass=Singleton):
+    """
+    Records the wall and cpu time spent in the phases of Hydra's startup and in loading
+    each config file. Nothing is recorded until start() is called, and only the phases of
+    the thread that called start() are recorded.
+    """
+
+    enabled: bool
+    timings: List[PhaseTiming]
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.timings = []
+        self.depth = 0
+        self.thread_id: Optional[int] = None
+
+    def start(self) -> None:
+        """
+        Clears previously recorded timings and starts recording the phases of the current thread
+        """
+        self.enabled = True
+        self.timings = []
+        self.depth = 0
+        self.thread_id = threading.get_ident()
+
+    def stop(self) -> None:
+        """
+        Stops recording, the recorded timings are kept
+        """
+        self.enabled = False
+
+    @contextmanager
+    def phase(self, name: str, kind: str = "phase") -> Iterator[None]:
+        if not self.enabled or threading.get_ident() != self.thread_id:
+            yield
+            return
+
+        # Reserve the slot so phases are listed in the order they started
+        idx = len(self.timings)
+        self.timings.append(
+            PhaseTiming(name=name, kind=kind, depth=self.depth, wall=0.0, cpu=0.0)
+        )
+        self.depth += 1
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            timing = self.timings[idx]
+            timing.wall = time.perf_counter() - wall_start
+            timing.cpu = time.process_time() - cpu_start
+            self.depth -= 1
+
+    def get_timings(self) -> List[PhaseTiming]:
+        return list(self.timings)
+
+    def format_table(self) -> List[str]:
+        """
+        :return: the lines of a table with the recorded timings, in milliseconds
+        """
+        names = [
+            "  " * t.depth + (t.name if t.kind == "phase" else f"[{t.kind}] {t.name}")
+            for t in self.timings
+        ]
+        name_pad = max([len("Phase")] + [len(n) for n in names]) + 1
+        lines = [
+            "| {} | {} | {} |".format("Phase".ljust(name_pad), "Wall (ms)", "CPU (ms)")
+        ]
+        for name, timing in zip(names, self.timings):
+            lines.append(
+                "| {} | {:>9.1f} | {:>8.1f} |".format(
+                    name.ljust(name_pad), timing.wall * 1000, timing.cpu * 1000
+                )
+            )
+        return lines
+
+    def save(self, filename: Path) -> None:
+        data: Dict[str, Any] = {"timings": [asdict(t) for t in self.timings]}
+        filename.parent.mkdir(parents=True, exist_ok=True)
+        with open(str(filename), "w") as file:
+            json.dump(data, file, indent=2)
+
+    @staticmethod
+    def instance(*args: Any, **kwargs: Any) -> "PhaseTimer":
+        return Singleton.instance(PhaseTimer, *args, **kwargs)  # type: ignore
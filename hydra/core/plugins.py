@@ -1,22 +1,115 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
 import importlib
 import inspect
+import os
 import pkgutil
+import sys
 import warnings
-from typing import Any, List, Optional, Type
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Type
 
-from omegaconf import DictConfig
+from omegaconf import DictConfig, ListConfig, OmegaConf
 
 from hydra._internal.sources_registry import SourcesRegistry
 from hydra.core.config_loader import ConfigLoader
+from hydra.plugins.completion_plugin import CompletionPlugin
 from hydra.plugins.config_source import ConfigSource
 from hydra.plugins.launcher import Launcher
 from hydra.plugins.plugin import Plugin
+from hydra.plugins.search_path_plugin import SearchPathPlugin
 from hydra.plugins.sweeper import Sweeper
 from hydra.types import TaskFunction
 
+# Name of the file declaring the plugins of a plugin package
+MANIFEST_FILE = "plugins.yaml"
+
+# Plugin types that can be used in the type field of a manifest entry
+PLUGIN_TYPES: Dict[str, Type[Plugin]] = {
+    "config_source": ConfigSource,
+    "launcher": Launcher,
+    "sweeper": Sweeper,
+    "search_path": SearchPathPlugin,
+    "completion": CompletionPlugin,
+    "plugin": Plugin,
+}
+
+
+class PluginDescriptor:
+    """
+    Describes a plugin without importing it.
+    The plugin class is imported on the first call to load().
+    """
+
+    class_name: str
+    types: List[Type[Plugin]]
+    scheme: Optional[str]
+
+    def __init__(
+        self,
+        class_name: str,
+        types: List[Type[Plugin]],
+        scheme: Optional[str] = None,
+        clazz: Optional[Type[Plugin]] = None,
+    ) -> None:
+        self.class_name = class_name
+        self.types = types
+        self.scheme = scheme
+        self.clazz = clazz
+
+    @property
+    def name(self) -> str:
+        return self.class_name.split(".")[-1]
+
+    def is_loaded(self) -> bool:
+        return self.clazz is not None
+
+    def provides(self, plugin_type: Type[Plugin]) -> bool:
+        """
+        :return: True if the plugin is declared to implement plugin_type
+        """
+        if self.clazz is not None:
+            return issubclass(self.clazz, plugin_type)
+        return any(issubclass(t, plugin_type) for t in self.types)
+
+    def may_provide(self, plugin_type: Type[Plugin]) -> bool:
+        """
+        :return: True if the plugin implements plugin_type or a base class of it,
+                 in which case only the loaded class can tell if it actually implements plugin_type.
+        """
+        return self.provides(plugin_type) or any(
+            issubclass(plugin_type, t) for t in self.types
+        )
+
+    def load(self) -> Type[Plugin]:
+        if self.clazz is None:
+            from ..utils import get_class
+
+            clazz = get_class(self.class_name)
+            if not issubclass(clazz, Plugin):
+                raise ImportError(f"{self.class_name} is not a Hydra plugin")
+            self.clazz = clazz
+        return self.clazz
+
+    def __repr__(self) -> str:
+        return f"PluginDescriptor({self.class_name})"
+
+    @staticmethod
+    def from_class(clazz: Type[Plugin]) -> "PluginDescriptor":
+        types = [t for t in PLUGIN_TYPES.values() if issubclass(clazz, t)]
+        scheme = None
+        if issubclass(clazz, ConfigSource):
+            scheme = clazz.scheme()
+        return PluginDescriptor(
+            class_name=f"{clazz.__module__}.{clazz.__name__}",
+            types=types,
+            scheme=scheme,
+            clazz=clazz,
+        )
+
 
 class Plugins:
+    # Plugins found in this process, discovery runs once
+    _descriptors: Optional[List[PluginDescriptor]] = None
+
     def __init__(self) -> None:
         raise NotImplementedError("Plugins is a static class, do not instantiate")
 
@@ -93,33 +186,50 @@ class Plugins:
         :param supertype: look for subclasses of this type, if None return all classes
         :return: a set of all classes found
         """
-        ret = {}
+        return Plugins._get_all_subclasses_in_modules(
+            Plugins._walk_modules(modules), supertype
+        )
+
+    @staticmethod
+    def _walk_modules(modules: List[Any]) -> Iterable[Tuple[Any, str, bool]]:
         for mdl in modules:
-            for importer, modname, ispkg in pkgutil.walk_packages(
+            yield from pkgutil.walk_packages(
                 path=mdl.__path__, prefix=mdl.__name__ + ".", onerror=lambda x: None
-            ):
-                try:
-                    loaded_mod = importer.find_module(modname).load_module(modname)
-                except ImportError as e:
-                    warnings.warn(
-                        message=f"\n"
-                        f"\tError importing '{modname}'.\n"
-                        f"\tPlugin is incompatible with this Hydra version or buggy.\n"
-                        f"\tRecommended to uninstall or upgrade plugin.\n"
-                        f"\t\t{type(e).__name__} : {e}",
-                        category=UserWarning,
-                    )
-                    loaded_mod = None
-
-                if loaded_mod is not None:
-                    for name, obj in inspect.getmembers(loaded_mod):
-                        if inspect.isclass(obj):
-                            if (
-                                supertype is None
-                                or issubclass(obj, supertype)
-                                and not inspect.isabstract(obj)
-                            ):
-                                ret[obj.__name__] = obj
+            )
+
+    @staticmethod
+    def _get_all_subclasses_in_modules(
+        module_infos: Iterable[Tuple[Any, str, bool]], supertype: Optional[type] = None
+    ) -> List[Type[Plugin]]:
+        """
+        :param module_infos: (importer, module name, is package) of the modules to look in
+        :param supertype: look for subclasses of this type, if None return all classes
+        :return: a set of all classes found
+        """
+        ret = {}
+        for importer, modname, ispkg in module_infos:
+            try:
+                loaded_mod = importer.find_module(modname).load_module(modname)
+            except ImportError as e:
+                warnings.warn(
+                    message=f"\n"
+                    f"\tError importing '{modname}'.\n"
+                    f"\tPlugin is incompatible with this Hydra version or buggy.\n"
+                    f"\tRecommended to uninstall or upgrade plugin.\n"
+                    f"\t\t{type(e).__name__} : {e}",
+                    category=UserWarning,
+                )
+                loaded_mod = None
+
+            if loaded_mod is not None:
+                for name, obj in inspect.getmembers(loaded_mod):
+                    if inspect.isclass(obj):
+                        if (
+                            supertype is None
+                            or issubclass(obj, supertype)
+                            and not inspect.isabstract(obj)
+                        ):
+                            ret[obj.__name__] = obj
 
         result: List[Type[Plugin]] = []
         for v in ret.values():
@@ -128,27 +238,162 @@ class Plugins:
         return result
 
     @staticmethod
-    def discover(plugin_type: Optional[Type[Plugin]] = None) -> List[Type[Plugin]]:
+    def _load_manifest(package_dir: str) -> Optional[List[PluginDescriptor]]:
         """
-        :param plugin_type: class of plugin to discover, None for all
-        :return: a list of plugins implementing the plugin type (or all if plugin type is None)
+        :param package_dir: directory of a plugin package
+        :return: the plugins declared in the manifest of the package,
+                 None if the package does not have a valid manifest
         """
-        assert plugin_type is None or issubclass(plugin_type, Plugin)
-        top_level: List[Any] = []
+        manifest_file = os.path.join(package_dir, MANIFEST_FILE)
+        if not os.path.isfile(manifest_file):
+            return None
+        try:
+            manifest = OmegaConf.load(manifest_file)
+            entries = manifest.plugins
+            if not isinstance(entries, ListConfig):
+                raise ValueError("plugins must be a list")
+            ret = []
+            for entry in entries:
+                types = entry.type
+                if isinstance(types, str):
+                    types = [types]
+                for t in types:
+                    if t not in PLUGIN_TYPES:
+                        raise ValueError(f"Unknown plugin type '{t}'")
+                ret.append(
+                    PluginDescriptor(
+                        class_name=entry["class"],
+                        types=[PLUGIN_TYPES[t] for t in types],
+                        scheme=entry.get("scheme", None),
+                    )
+                )
+            return ret
+        except Exception as e:
+            warnings.warn(
+                message=f"\n"
+                f"\tError reading plugins manifest '{manifest_file}', importing the package instead.\n"
+                f"\t\t{type(e).__name__} : {e}",
+                category=UserWarning,
+            )
+            return None
+
+    @staticmethod
+    def _discover_descriptors() -> List[PluginDescriptor]:
+        ret: List[PluginDescriptor] = []
         core_plugins = importlib.import_module("hydra._internal.core_plugins")
-        top_level.append(core_plugins)
+        assert core_plugins.__file__ is not None
+        manifest = Plugins._load_manifest(os.path.dirname(core_plugins.__file__))
+        if manifest is not None:
+            ret.extend(manifest)
+        else:
+            for clazz in Plugins._get_all_subclasses_in([core_plugins], Plugin):
+                ret.append(PluginDescriptor.from_class(clazz))
 
         try:
             hydra_plugins = importlib.import_module("hydra_plugins")
-            top_level.append(hydra_plugins)
         except ImportError:
             # If no plugins are installed the hydra_plugins package does not exist.
-            pass
-        return Plugins._get_all_subclasses_in(top_level, plugin_type)
+            return ret
+
+        # Plugin packages with a manifest are not imported.
+        # Other modules in hydra_plugins are imported and scanned for plugins.
+        without_manifest: List[Tuple[Any, str, bool]] = []
+        seen: Set[str] = set()
+        for importer, modname, ispkg in pkgutil.iter_modules(
+            hydra_plugins.__path__, prefix=hydra_plugins.__name__ + "."
+        ):
+            if modname in seen:
+                continue
+            seen.add(modname)
+            manifest = None
+            importer_path = getattr(importer, "path", None)
+            if ispkg and importer_path is not None:
+                package_dir = os.path.join(importer_path, modname.split(".")[-1])
+                manifest = Plugins._load_manifest(package_dir)
+            if manifest is not None:
+                ret.extend(manifest)
+            else:
+                without_manifest.append((importer, modname, ispkg))
+
+        for clazz in Plugins._get_all_subclasses_in_modules(
+            Plugins._walk_plugin_modules(without_manifest), Plugin
+        ):
+            ret.append(PluginDescriptor.from_class(clazz))
+
+        return ret
+
+    @staticmethod
+    def _walk_plugin_modules(
+        module_infos: List[Tuple[Any, str, bool]]
+    ) -> Iterable[Tuple[Any, str, bool]]:
+        for importer, modname, ispkg in module_infos:
+            yield importer, modname, ispkg
+            # the package is imported by the consumer before it's walked
+            package = sys.modules.get(modname) if ispkg else None
+            if package is not None:
+                yield from Plugins._walk_modules([package])
+
+    @staticmethod
+    def descriptors(
+        plugin_type: Optional[Type[Plugin]] = None,
+    ) -> List[PluginDescriptor]:
+        """
+        Lists the plugins without importing them.
+        :param plugin_type: class of plugin to list, None for all
+        :return: descriptors of the plugins declared to implement the plugin type
+        """
+        if Plugins._descriptors is None:
+            Plugins._descriptors = Plugins._discover_descriptors()
+        if plugin_type is None:
+            return list(Plugins._descriptors)
+        return [d for d in Plugins._descriptors if d.provides(plugin_type)]
+
+    @staticmethod
+    def invalidate() -> None:
+        """
+        Drops the discovered plugins, they are discovered again on the next use
+        """
+        Plugins._descriptors = None
+
+    @staticmethod
+    def discover(plugin_type: Optional[Type[Plugin]] = None) -> List[Type[Plugin]]:
+        """
+        :param plugin_type: class of plugin to discover, None for all
+        :return: a list of plugins implementing the plugin type (or all if plugin type is None)
+        """
+        assert plugin_type is None or issubclass(plugin_type, Plugin)
+        ret: List[Type[Plugin]] = []
+        for descriptor in Plugins.descriptors():
+            if plugin_type is not None and not descriptor.may_provide(plugin_type):
+                continue
+            try:
+                clazz = descriptor.load()
+            except (ImportError, AttributeError) as e:
+                warnings.warn(
+                    message=f"\n"
+                    f"\tError importing '{descriptor.class_name}'.\n"
+                    f"\tPlugin is incompatible with this Hydra version or buggy.\n"
+                    f"\tRecommended to uninstall or upgrade plugin.\n"
+                    f"\t\t{type(e).__name__} : {e}",
+                    category=UserWarning,
+                )
+                continue
+            if plugin_type is None or (
+                issubclass(clazz, plugin_type) and not inspect.isabstract(clazz)
+            ):
+                if clazz not in ret:
+                    ret.append(clazz)
+        return ret
 
     @staticmethod
     def register_config_sources() -> None:
-        config_sources = Plugins.discover(ConfigSource)
-        for source in config_sources:
-            assert issubclass(source, ConfigSource)
-            SourcesRegistry.instance().register(source)
+        for descriptor in Plugins.descriptors(ConfigSource):
+            if descriptor.is_loaded() or descriptor.scheme is None:
+                source = descriptor.load()
+                assert issubclass(source, ConfigSource)
+                SourcesRegistry.instance().register(source)
+            else:
+                # The source is imported when its scheme is first used
+                SourcesRegistry.instance().register_lazy(
+                    scheme=descriptor.scheme, class_name=descriptor.class_name
+                )
@@ -0,0 +1,183 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+"""
+Index of the jobs of a sweep, an append-only JSON lines file in the sweep dir.
+Each line is a record of an event of a job (submitted, started, finished), keyed by the job number.
+Records are appended with a single write to a file opened in append mode, so jobs running in
+other processes of the same machine can append to the same manifest. Appends are not atomic on
+NFS: records appended at the same time by jobs on different machines may be interleaved, the
+lines that can't be parsed are skipped when loading the manifest.
+The records of a job are merged when the manifest is loaded, the later records updating the
+fields of the earlier ones.
+The working dirs of the jobs are recorded relative to the sweep dir, so the sweep dir can be moved.
+"""
+import json
+import logging
+import math
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
+
+from omegaconf import DictConfig, OmegaConf
+
+log = logging.getLogger(__name__)
+
+MANIFEST_FILE = "sweep_manifest.jsonl"
+
+SUBMITTED = "SUBMITTED"
+RUNNING = "RUNNING"
+
+
+def manifest_enabled(config: DictConfig) -> bool:
+    """
+    :return: True if the jobs of the sweep are recorded in the sweep manifest
+    """
+    return bool(config.select("hydra.manifest.enabled"))
+
+
+def get_sweep_dir(config: DictConfig) -> str:
+    """
+    :return: the absolute sweep dir, a relative hydra.sweep.dir is relative to the directory
+             the app was started from (hydra.runtime.cwd) and not to the working dir of a job
+    """
+    sweep_dir = str(config.hydra.sweep.dir)
+    if not os.path.isabs(sweep_dir):
+        cwd = config.select("hydra.runtime.cwd")
+        sweep_dir = os.path.join(os.getcwd() if cwd is None else str(cwd), sweep_dir)
+    return sweep_dir
+
+
+def summarize_return_value(value: Any) -> Any:
+    """
+    :return: the part of a return value saved in the manifest: primitive values as is,
+             the primitive values of a dict, None for other values
+    """
+    if isinstance(value, DictConfig):
+        value = OmegaConf.to_container(value, resolve=True)
+    if isinstance(value, float) and not math.isfinite(value):
+        return str(value)
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, Mapping):
+        return {
+            str(k): summarize_return_value(v)
+            for k, v in value.items()
+            if v is None or isinstance(v, (bool, int, float, str))
+        }
+    return None
+
+
+def append_manifest_records(
+    sweep_dir: Union[str, Path], records: Sequence[Dict[str, Any]]
+) -> None:
+    """
+    Appends records to the manifest of a sweep
+    :param sweep_dir: the sweep dir
+    :param records: the records, each with the job number in num
+    """
+    if len(records) == 0:
+        return
+    data = "".join(json.dumps(record, default=str) + "\n" for record in records)
+    os.makedirs(str(sweep_dir), exist_ok=True)
+    fd = os.open(
+        os.path.join(str(sweep_dir), MANIFEST_FILE),
+        os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+        0o644,
+    )
+    try:
+        os.write(fd, data.encode("utf-8"))
+    finally:
+        os.close(fd)
+
+
+def record_submitted(
+    config: DictConfig, batch: Sequence[Sequence[str]], initial_job_idx: int
+) -> None:
+    """
+    Records the jobs of a batch as submitted, if the manifest is enabled
+    :param config: the config of the sweep
+    :param batch: the overrides of the jobs
+    :param initial_job_idx: the job number of the first job in the batch
+    """
+    if not manifest_enabled(config):
+        return
+    now = time.time()
+    append_manifest_records(
+        get_sweep_dir(config),
+        [
+            {
+                "num": initial_job_idx + idx,
+                "overrides": list(overrides),
+                "status": SUBMITTED,
+                "submit_time": now,
+            }
+            for idx, overrides in enumerate(batch)
+        ],
+    )
+
+
+def _relative_to(path: str, sweep_dir: str) -> str:
+    """
+    :return: the path relative to the sweep dir if it's in the sweep dir, the absolute path otherwise
+             (e.g. the working dir of a memoized job of another sweep)
+    """
+    path = os.path.abspath(path)
+    relpath = os.path.relpath(path, os.path.abspath(sweep_dir))
+    if relpath == os.pardir or relpath.startswith(os.pardir + os.sep):
+        return path
+    return relpath
+
+
+def record_job(config: DictConfig, **fields: Any) -> None:
+    """
+    Records the fields of a job of a sweep, if the manifest is enabled.
+    Does nothing for jobs that are not a part of a sweep.
+    :param config: the config of the job
+    """
+    if not manifest_enabled(config):
+        return
+    num = config.select("hydra.job.num")
+    if num is None:
+        return
+    sweep_dir = get_sweep_dir(config)
+    record: Dict[str, Any] = {"num": num}
+    record.update(fields)
+    working_dir = record.get("working_dir")
+    if working_dir is not None:
+        record["working_dir"] = _relative_to(str(working_dir), sweep_dir)
+    try:
+        append_manifest_records(sweep_dir, [record])
+    except OSError as e:
+        log.warning(f"Job #{num} could not be recorded in the sweep manifest : {e}")
+
+
+def load_sweep_manifest(
+    sweep_dir: Union[str, Path], status: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Loads the manifest of a sweep
+    :param sweep_dir: the sweep dir (hydra.sweep.dir)
+    :param status: only return the jobs with this status, e.g. COMPLETED or FAILED
+    :return: a dict per job, sorted by job number, with the fields: num, overrides, status,
+             working_dir, config_hash, submit_time, start_time, end_time, return_value and error.
+             working_dir is resolved against the sweep dir argument.
+             The fields that were not recorded for a job are missing.
+    """
+    jobs: Dict[int, Dict[str, Any]] = {}
+    with open(os.path.join(str(sweep_dir), MANIFEST_FILE), encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # e.g. the last line of a sweep that was killed while writing it
+                continue
+            jobs.setdefault(record["num"], {}).update(record)
+    ret = [jobs[num] for num in sorted(jobs)]
+    for job in ret:
+        if "working_dir" in job:
+            job["working_dir"] = os.path.join(
+                os.path.abspath(str(sweep_dir)), job["working_dir"]
+            )
+    if status is not None:
+        ret = [job for job in ret if job.get("status") == status]
+    return ret
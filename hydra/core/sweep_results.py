@@ -0,0 +1,116 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+"""
+Loading of the return values saved by the jobs of a sweep (hydra.save_return_value) for analysis.
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+
+from omegaconf import OmegaConf
+
+from hydra.core.sweep_manifest import MANIFEST_FILE, load_sweep_manifest
+from hydra.core.utils import JobStatus, find_job_dirs, load_return_value, split_key_val
+
+log = logging.getLogger(__name__)
+
+# prefix of the columns of the items of the dicts returned by the jobs
+RETURN_VALUE_COLUMN = "return_value"
+
+
+def _list_jobs(
+    sweep_dir: Path, output_subdir: str
+) -> List[Tuple[Path, Optional[List[str]]]]:
+    """
+    :return: the working dir of the jobs of the sweep, with their overrides if they are known
+             without reading the output dir of the job
+    """
+    if (sweep_dir / MANIFEST_FILE).exists():
+        # one read for all the jobs, only the completed jobs saved a return value
+        jobs = load_sweep_manifest(sweep_dir, JobStatus.COMPLETED.name)
+        if all(
+            "working_dir" in job
+            and "overrides" in job
+            and Path(job["working_dir"]).is_dir()
+            for job in jobs
+        ):
+            return [(Path(job["working_dir"]), list(job["overrides"])) for job in jobs]
+        log.warning(
+            "The sweep manifest of {} does not match the job dirs, scanning the sweep dir".format(
+                sweep_dir
+            )
+        )
+    return [(job_dir, None) for job_dir in find_job_dirs(sweep_dir, output_subdir)]
+
+
+def _load_job(
+    job_dir: Path, overrides: Optional[List[str]], output_subdir: str
+) -> Optional[Tuple[Path, List[str], Any]]:
+    hydra_output = job_dir / output_subdir
+    try:
+        return_value = load_return_value(hydra_output)
+    except FileNotFoundError:
+        return None
+    if overrides is None:
+        loaded = OmegaConf.to_container(
+            OmegaConf.load(str(hydra_output / "overrides.yaml"))
+        )
+        assert isinstance(loaded, list)
+        overrides = loaded
+    return job_dir, overrides, return_value
+
+
+def load_sweep_results(
+    sweep_dir: Union[str, Path],
+    output_subdir: str = ".hydra",
+    max_workers: Optional[int] = None,
+) -> Dict[str, List[Any]]:
+    """
+    Loads the return values saved by the jobs of a sweep as a table, a list of values per column.
+    The jobs are found with the sweep manifest if it's enabled, by scanning the sweep dir otherwise.
+    A warning is logged for the jobs that did not save their return value.
+    :param sweep_dir: the sweep dir (hydra.sweep.dir)
+    :param output_subdir: the hydra output subdir of the jobs (hydra.output_subdir)
+    :param max_workers: number of threads loading the jobs, None for the default of ThreadPoolExecutor
+    :return: a row per job that saved its return value. The columns are working_dir, a column per
+             overridden key with the override value, and return_value. The items of dicts
+             returned by the jobs are in return_value.<key> columns instead.
+             Missing values are None.
+    """
+    jobs = _list_jobs(Path(str(sweep_dir)), output_subdir)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        loaded = list(
+            executor.map(lambda job: _load_job(job[0], job[1], output_subdir), jobs,)
+        )
+
+    num_skipped = sum(job is None for job in loaded)
+    if num_skipped > 0:
+        log.warning(
+            "Skipped {} of the {} jobs in {}, they did not save their return value"
+            " (hydra.save_return_value)".format(num_skipped, len(loaded), sweep_dir)
+        )
+
+    rows: List[Dict[str, Any]] = []
+    override_columns: Dict[str, None] = {}
+    value_columns: Dict[str, None] = {}
+    for job in loaded:
+        if job is None:
+            continue
+        job_dir, overrides, return_value = job
+        row: Dict[str, Any] = {"working_dir": str(job_dir)}
+        for override in overrides:
+            key, value = split_key_val(override)
+            row[key] = value
+            override_columns[key] = None
+        if isinstance(return_value, Mapping):
+            for key, value in return_value.items():
+                column = f"{RETURN_VALUE_COLUMN}.{key}"
+                row[column] = value
+                value_columns[column] = None
+        else:
+            row[RETURN_VALUE_COLUMN] = return_value
+            value_columns[RETURN_VALUE_COLUMN] = None
+        rows.append(row)
+
+    columns = ["working_dir"] + list(override_columns) + list(value_columns)
+    return {column: [row.get(column) for row in rows] for column in columns}
@@ -1,28 +1,60 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
-import copy
+import asyncio
+import inspect
+import json
 import logging
 import os
+import pickle
+import queue
 import re
 import sys
+import traceback
+from contextvars import ContextVar
+from enum import Enum
 from os.path import basename, dirname, splitext
 from pathlib import Path
-from time import localtime, strftime
-from typing import Any, Dict, Optional, Sequence, Tuple, Union
-
-from omegaconf import DictConfig, OmegaConf
+from time import localtime, strftime, time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from omegaconf import DictConfig, OmegaConf, open_dict
 
 from hydra.core.hydra_config import HydraConfig
+from hydra.core.job_memo import JobMemo
+from hydra.core.log_queue import (
+    SweepLog,
+    get_log_queue,
+    set_sweep_log_queue,
+    stop_log_queue,
+)
 from hydra.core.singleton import Singleton
+from hydra.core.sweep_manifest import get_sweep_dir, record_job
 from hydra.types import TaskFunction
 
 log = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 def configure_log(
     log_config: DictConfig, verbose_config: Union[bool, str, Sequence[str]]
 ) -> None:
     assert isinstance(verbose_config, (bool, str)) or OmegaConf.is_list(verbose_config)
-    if log_config is not None:
+    log_queue = get_log_queue()
+    if log_config is not None and log_queue is not None:
+        # queue based logging, the handlers of the config are only created once
+        log_queue.configure(OmegaConf.to_container(log_config, resolve=True))  # type: ignore
+    elif log_config is not None:
         conf: Dict[str, Any] = OmegaConf.to_container(  # type: ignore
             log_config, resolve=True
         )
@@ -37,6 +69,10 @@ def configure_log(
         )
         handler.setFormatter(formatter)
         root.addHandler(handler)
+    _configure_verbose(verbose_config)
+
+
+def _configure_verbose(verbose_config: Union[bool, str, Sequence[str]]) -> None:
     if isinstance(verbose_config, bool):
         if verbose_config:
             logging.getLogger().setLevel(logging.DEBUG)
@@ -75,6 +111,35 @@ def get_overrides_dirname(
     return ret
 
 
+def get_num_shard(num: int, size: int = 1000) -> Tuple[str, str]:
+    """
+    :param num: the job number
+    :param size: the number of jobs in a shard
+    :return: the zero padded shard of the job and the zero padded job number,
+             e.g. ("000", "000123") for job 123 with 1000 jobs per shard
+    """
+    if size <= 0:
+        raise ValueError(f"The shard size must be a positive number, got {size}")
+    width = len(str(size - 1))
+    return str(num // size).zfill(width), str(num).zfill(2 * width)
+
+
+def set_num_shard(config: DictConfig) -> None:
+    """
+    Populates hydra.job.num_shard and hydra.job.num_padded from the job number,
+    used by sharded sweep subdirs such as ${hydra.job.num_shard}/${hydra.job.num_padded}.
+    Does nothing if the job is not a part of a sweep.
+    """
+    num = config.select("hydra.job.num")
+    if num is None:
+        return
+    size = config.select("hydra.job.config.num_shard.size")
+    num_shard, num_padded = get_num_shard(int(num), 1000 if size is None else size)
+    with open_dict(config):
+        config.hydra.job.num_shard = num_shard
+        config.hydra.job.num_padded = num_padded
+
+
 def filter_overrides(overrides: Sequence[str]) -> Sequence[str]:
     """
     :param overrides: overrides list
@@ -96,43 +161,381 @@ def run_job(
     task_function: TaskFunction,
     job_dir_key: str,
     job_subdir_key: Optional[str],
+    configure_logging: bool = True,
 ) -> "JobReturn":
-    old_cwd = os.getcwd()
-    working_dir = str(config.select(job_dir_key))
-    if job_subdir_key is not None:
-        # evaluate job_subdir_key lazily.
-        # this is running on the client side in sweep and contains things such as job:id which
-        # are only available there.
-        subdir = str(config.select(job_subdir_key))
-        working_dir = os.path.join(working_dir, subdir)
+    """
+    Runs a job in the current thread.
+    :param config: the job config
+    :param task_function: the task function
+    :param job_dir_key: key of the job directory in the config, e.g. hydra.sweep.dir
+    :param job_subdir_key: key of the job subdirectory in the config, e.g. hydra.sweep.subdir
+    :param configure_logging: if false the logging of the process is not reconfigured,
+           the records logged by the job are written to the job log files by handlers
+           that are only active in the context of the job. For jobs running concurrently.
+    """
+    ret, _ = _run_job(
+        config, task_function, job_dir_key, job_subdir_key, configure_logging
+    )
+    return ret
+
+
+def _run_job(
+    config: DictConfig,
+    task_function: TaskFunction,
+    job_dir_key: str,
+    job_subdir_key: Optional[str],
+    configure_logging: bool,
+    reuse_logging: bool = False,
+) -> Tuple["JobReturn", bool]:
+    """
+    :return: the JobReturn, and whether the job logging is configured for the job
+             and can be reused by the next job
+    """
+    if inspect.iscoroutinefunction(task_function):
+        # an async task function running outside of an event loop
+        loop = asyncio.new_event_loop()
+        try:
+            ret = loop.run_until_complete(
+                run_job_async(
+                    config,
+                    task_function,
+                    job_dir_key,
+                    job_subdir_key,
+                    configure_logging,
+                )
+            )
+            return ret, False
+        finally:
+            loop.close()
+
+    from hydra.core.job_context import _JobContext
+
+    job = _JobContext(
+        config,
+        task_function,
+        job_dir_key,
+        job_subdir_key,
+        configure_logging,
+        reuse_logging,
+    )
     try:
-        ret = JobReturn()
-        ret.working_dir = working_dir
-        task_cfg = copy.deepcopy(config)
-        del task_cfg["hydra"]
-        ret.cfg = task_cfg
-        ret.hydra_cfg = OmegaConf.create({"hydra": HydraConfig.instance().hydra})
-        overrides = OmegaConf.to_container(config.hydra.overrides.task)
-        assert isinstance(overrides, list)
-        ret.overrides = overrides
-        # handle output directories here
-        Path(str(working_dir)).mkdir(parents=True, exist_ok=True)
-        os.chdir(working_dir)
-        hydra_output = Path(config.hydra.output_subdir)
-
-        configure_log(config.hydra.job_logging, config.hydra.verbose)
-
-        hydra_cfg = OmegaConf.masked_copy(config, "hydra")
-        assert isinstance(hydra_cfg, DictConfig)
+        if job.enter():
+            try:
+                return_value = task_function(job.task_cfg)
+            except Exception:
+                job.fail()
+                raise
+            job.complete(return_value)
+        return job.ret, job.logging_configured
+    finally:
+        job.exit()
 
-        _save_config(task_cfg, "config.yaml", hydra_output)
-        _save_config(hydra_cfg, "hydra.yaml", hydra_output)
-        _save_config(config.hydra.overrides.task, "overrides.yaml", hydra_output)
-        ret.return_value = task_function(task_cfg)
-        ret.task_name = JobRuntime.instance().get("name")
-        return ret
+
+def run_job_pack(
+    configs: Sequence[DictConfig],
+    task_function: TaskFunction,
+    job_dir_key: str,
+    job_subdir_key: Optional[str],
+    catch_errors: bool = False,
+) -> List["JobReturn"]:
+    """
+    Runs multiple jobs one after the other, sharing their setup.
+    The job logging is configured once, the following jobs only move the log files
+    to their own output dir. Each job still has its own output dir and JobReturn.
+    :param configs: the job configs
+    :param catch_errors: if true a job raising an exception gets a failed JobReturn and the
+           next jobs still run, otherwise the exception is raised.
+           This includes SystemExit and KeyboardInterrupt, a job calling sys.exit() in a worker
+           process must not take the worker down with the results of its pack.
+    """
+    rets: List[JobReturn] = []
+    logging_key: Optional[Tuple[str, str]] = None
+    for config in configs:
+        HydraConfig.instance().set_config(config)
+        key = (str(config.hydra.job_logging), str(config.hydra.verbose))
+        try:
+            ret, logging_configured = _run_job(
+                config=config,
+                task_function=task_function,
+                job_dir_key=job_dir_key,
+                job_subdir_key=job_subdir_key,
+                configure_logging=True,
+                reuse_logging=key == logging_key,
+            )
+            rets.append(ret)
+            logging_key = key if logging_configured else None
+        except BaseException:
+            logging_key = None
+            if not catch_errors:
+                raise
+            rets.append(failed_job_return(config, traceback.format_exc()))
+    return rets
+
+
+def get_jobs_per_task(config: DictConfig) -> int:
+    """
+    :return: number of jobs a launcher runs in each of its tasks (hydra.launcher.jobs_per_task)
+    """
+    ret = int(config.hydra.launcher.get("jobs_per_task", 1) or 1)
+    if ret <= 0:
+        raise ValueError(f"hydra.launcher.jobs_per_task must be positive, got {ret}")
+    return ret
+
+
+def log_queue_enabled(config: DictConfig) -> bool:
+    """
+    :return: True if the jobs log through a queue (hydra.log_queue.enabled)
+    """
+    log_queue_cfg = config.hydra.get("log_queue", None)
+    return log_queue_cfg is not None and bool(log_queue_cfg.enabled)
+
+
+def open_sweep_log(
+    config: DictConfig, mp_context: Optional[Any] = None
+) -> Optional[SweepLog]:
+    """
+    Starts collecting the records of the jobs in the sweep log (hydra.log_queue.sweep_log)
+    :param mp_context: the multiprocessing context of the worker processes running the jobs,
+           None for jobs running in this process. The workers send their records to the
+           queue of the sweep log, see set_sweep_log_queue()
+    :return: the sweep log, None if it's not enabled
+    """
+    if not log_queue_enabled(config) or config.hydra.log_queue.sweep_log is None:
+        return None
+    sweep_dir = Path(str(config.hydra.sweep.dir))
+    sweep_dir.mkdir(parents=True, exist_ok=True)
+    sweep_log_queue: Any = queue.Queue()
+    if mp_context is not None:
+        sweep_log_queue = mp_context.SimpleQueue()
+    set_sweep_log_queue(sweep_log_queue)
+    return SweepLog(
+        str(sweep_dir / str(config.hydra.log_queue.sweep_log)), sweep_log_queue
+    )
+
+
+def close_sweep_logging(config: DictConfig, sweep_log: Optional[SweepLog]) -> None:
+    """
+    Stops the queue based logging of the jobs that ran in this process, closes the sweep log
+    and configures the hydra logging again.
+    """
+    if not log_queue_enabled(config):
+        return
+    stop_log_queue()
+    set_sweep_log_queue(None)
+    if sweep_log is not None:
+        sweep_log.close()
+    configure_log(config.hydra.hydra_logging, config.hydra.verbose)
+
+
+def split_into_packs(items: Sequence[T], jobs_per_task: int) -> List[List[T]]:
+    """
+    :return: the items split into consecutive packs of at most jobs_per_task items
+    """
+    return [
+        list(items[i : i + jobs_per_task]) for i in range(0, len(items), jobs_per_task)
+    ]
+
+
+async def run_job_async(
+    config: DictConfig,
+    task_function: Callable[[DictConfig], Awaitable[Any]],
+    job_dir_key: str,
+    job_subdir_key: Optional[str],
+    configure_logging: bool = False,
+) -> "JobReturn":
+    """
+    Runs a job with an async task function, see run_job().
+    By default the logging is not reconfigured, jobs are expected to run concurrently.
+    """
+    from hydra.core.job_context import _JobContext
+
+    job = _JobContext(
+        config, task_function, job_dir_key, job_subdir_key, configure_logging
+    )
+    try:
+        if job.enter():
+            try:
+                return_value = await task_function(job.task_cfg)
+            except Exception:
+                job.fail()
+                raise
+            job.complete(return_value)
+        return job.ret
     finally:
-        os.chdir(old_cwd)
+        job.exit()
+
+
+def failed_job_return(config: DictConfig, error: str) -> "JobReturn":
+    """
+    :param config: the config of a job of a sweep
+    :param error: the formatted traceback of the exception that failed the job
+    :return: the JobReturn of the failed job
+    """
+    ret = JobReturn()
+    ret.status = JobStatus.FAILED
+    ret.error = error
+    ret.overrides = list(config.hydra.overrides.task)
+    set_num_shard(config)
+    ret.working_dir = os.path.join(
+        str(config.hydra.sweep.dir), str(config.hydra.sweep.subdir)
+    )
+    lines = [line for line in error.splitlines() if line.strip() != ""]
+    record_job(
+        config,
+        overrides=ret.overrides,
+        status=ret.status.name,
+        working_dir=os.path.join(get_sweep_dir(config), str(config.hydra.sweep.subdir)),
+        end_time=time(),
+        error=lines[-1] if len(lines) > 0 else error,
+    )
+    return ret
+
+
+def get_job_memo(config: DictConfig, task_function: TaskFunction) -> Optional[JobMemo]:
+    """
+    :return: the memo of the job results if enabled in hydra.memo, None otherwise
+    """
+    memo_cfg = config.hydra.get("memo", None)
+    if memo_cfg is None or not memo_cfg.enabled:
+        return None
+    return JobMemo(memo_dir=str(memo_cfg.dir), task_function=task_function)
+
+
+JOB_STATUS_FILE = "job_status.yaml"
+
+
+def _save_job_status(
+    status: "JobStatus", return_value: Any, task_name: Optional[str], output_dir: Path
+) -> None:
+    """
+    Saves the completion marker of a job.
+    The return value is only saved if it's a primitive value.
+    """
+    if not isinstance(return_value, (bool, int, float, str)):
+        return_value = None
+    marker = OmegaConf.create(
+        {"status": status.name, "return_value": return_value, "task_name": task_name}
+    )
+    _save_config(marker, JOB_STATUS_FILE, output_dir)
+
+
+RETURN_VALUE_FILES = {"json": "return_value.json", "pickle": "return_value.pkl"}
+
+
+def _save_return_value(return_value: Any, fmt: str, output_dir: Path) -> None:
+    """
+    Saves the return value of a job, see hydra.save_return_value.
+    Values that can't be serialized to JSON are pickled.
+    """
+    if fmt not in RETURN_VALUE_FILES:
+        raise ValueError(
+            f"Unsupported hydra.save_return_value {fmt}, expected one of json, pickle"
+        )
+    if isinstance(return_value, DictConfig):
+        return_value = OmegaConf.to_container(return_value, resolve=True)
+    if fmt == "json":
+        try:
+            data = json.dumps(return_value, allow_nan=True)
+        except (TypeError, ValueError):
+            fmt = "pickle"
+        else:
+            with open(str(output_dir / RETURN_VALUE_FILES["json"]), "w") as f:
+                f.write(data)
+            return
+    try:
+        data_bytes = pickle.dumps(return_value)
+    except Exception as e:
+        log.warning(f"Return value can't be saved : {e}")
+        return
+    with open(str(output_dir / RETURN_VALUE_FILES["pickle"]), "wb") as f:
+        f.write(data_bytes)
+
+
+def load_return_value(output_dir: Path) -> Any:
+    """
+    :param output_dir: the hydra output subdir of a job
+    :return: the return value saved by the job, see hydra.save_return_value
+    :raises FileNotFoundError: if the job did not save its return value
+    """
+    try:
+        with open(str(output_dir / RETURN_VALUE_FILES["json"])) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        pass
+    with open(str(output_dir / RETURN_VALUE_FILES["pickle"]), "rb") as f:
+        return pickle.load(f)
+
+
+def find_job_dirs(sweep_dir: Path, output_subdir: str) -> List[Path]:
+    """
+    :return: the working dirs of the jobs in a sweep dir, the dirs containing an output subdir,
+             sorted by path. Job dirs can be nested, e.g. in shard dirs with hydra/output=sharded
+    """
+    ret = []
+    for root, dirs, files in os.walk(str(sweep_dir)):
+        if output_subdir not in dirs:
+            dirs.sort()
+            continue
+        # the outputs of a job don't contain other jobs
+        dirs[:] = []
+        ret.append(Path(root))
+    return ret
+
+
+def load_job_status(output_dir: Path) -> Optional[DictConfig]:
+    """
+    :param output_dir: the hydra output subdir of a job
+    :return: the completion marker of the job (status, return_value and task_name),
+             None if there is no marker
+    """
+    marker_file = output_dir / JOB_STATUS_FILE
+    if not marker_file.exists():
+        return None
+    marker = OmegaConf.load(str(marker_file))
+    assert isinstance(marker, DictConfig)
+    return marker
+
+
+def load_job_return(
+    job_dir: Path, output_subdir: str, load_configs: bool = True
+) -> Optional["JobReturn"]:
+    """
+    Reconstructs the JobReturn of a completed job from the files saved in its output subdir.
+    :param job_dir: the working directory of the job
+    :param output_subdir: the hydra output subdir (hydra.output_subdir)
+    :param load_configs: False to leave cfg and hydra_cfg unset (hydra.return_configs)
+    :return: the JobReturn, None if the job did not complete
+    """
+    hydra_output = job_dir / output_subdir
+    marker = load_job_status(hydra_output)
+    if marker is None or marker.status != JobStatus.COMPLETED.name:
+        return None
+    ret = JobReturn()
+    ret.status = JobStatus.COMPLETED
+    ret.working_dir = str(job_dir)
+    ret.return_value = marker.return_value
+    try:
+        ret.return_value = load_return_value(hydra_output)
+    except FileNotFoundError:
+        pass
+    task_name = marker.get("task_name", None)
+    if load_configs or task_name is None:
+        # markers saved by older versions do not have the task name
+        hydra_cfg = OmegaConf.load(str(hydra_output / "hydra.yaml"))
+        assert isinstance(hydra_cfg, DictConfig)
+        task_name = hydra_cfg.hydra.job.name
+        if load_configs:
+            cfg = OmegaConf.load(str(hydra_output / "config.yaml"))
+            assert isinstance(cfg, DictConfig)
+            ret.cfg = cfg
+            ret.hydra_cfg = hydra_cfg
+    overrides = OmegaConf.to_container(
+        OmegaConf.load(str(hydra_output / "overrides.yaml"))
+    )
+    assert isinstance(overrides, list)
+    ret.overrides = overrides
+    ret.task_name = task_name
+    return ret
 
 
 def get_valid_filename(s: str) -> str:
@@ -150,14 +553,29 @@ def setup_globals() -> None:
         pass
 
 
+class JobStatus(Enum):
+    UNKNOWN = 0
+    COMPLETED = 1
+    FAILED = 2
+
+
 class JobReturn:
     def __init__(self) -> None:
+        self.status: JobStatus = JobStatus.UNKNOWN
         self.overrides: Optional[Sequence[str]] = None
         self.return_value: Any = None
         self.cfg: Optional[DictConfig] = None
         self.hydra_cfg: Optional[DictConfig] = None
         self.working_dir: Optional[str] = None
         self.task_name: Optional[str] = None
+        # formatted traceback of the exception that failed the job
+        self.error: Optional[str] = None
+
+
+# Values set in the context of a job, on top of the process wide JobRuntime values
+_context_job_runtime: ContextVar[Optional[DictConfig]] = ContextVar(
+    "hydra_job_runtime", default=None
+)
 
 
 class JobRuntime(metaclass=Singleton):
@@ -166,14 +584,26 @@ class JobRuntime(metaclass=Singleton):
         self.set("name", "UNKNOWN_NAME")
 
     def get(self, key: str) -> Any:
-        ret = self.conf.select(key)
+        context_conf = _context_job_runtime.get()
+        ret = None
+        if context_conf is not None:
+            ret = context_conf.select(key)
+        if ret is None:
+            ret = self.conf.select(key)
         if ret is None:
             raise KeyError("Key not found in {}: {}".format(type(self).__name__, key))
         return ret
 
     def set(self, key: str, value: Any) -> None:
+        """
+        Sets a value in the context of the current job, or process wide outside of a job
+        """
         log.debug("Setting {}:{}={}".format(type(self).__name__, key, value))
-        self.conf[key] = value
+        context_conf = _context_job_runtime.get()
+        if context_conf is not None:
+            context_conf[key] = value
+        else:
+            self.conf[key] = value
 
 
 def split_config_path(
@@ -1,4 +1,4 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
-from .compose import compose, initialize
+from .compose import compose, compose_many, initialize
 
-__all__ = ["initialize", "compose"]
+__all__ = ["initialize", "compose", "compose_many"]
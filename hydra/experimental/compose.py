@@ -1,5 +1,5 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from omegaconf import DictConfig
 
@@ -50,3 +50,32 @@ def compose(
     if "hydra" in cfg:
         del cfg["hydra"]
     return cfg
+
+
+def compose_many(
+    config_file: Optional[str] = None,
+    overrides_list: Sequence[List[str]] = [],
+    strict: Optional[bool] = None,
+) -> List[DictConfig]:
+    """
+    Composes one config per overrides list.
+    Configs sharing a prefix of their defaults list reuse the merged prefix, so composing many
+    configs that differ in a few config groups is much faster than calling compose() repeatedly.
+    :param config_file: optional config file to load
+    :param overrides_list: list of overrides lists, one per composed config
+    :param strict: optionally override the default strict mode
+    :return: the composed configs, in the order of overrides_list
+    """
+    assert (
+        GlobalHydra().is_initialized()
+    ), "GlobalHydra is not initialized, use @hydra.main() or call hydra.experimental.initialize() first"
+
+    gh = GlobalHydra.instance()
+    assert gh.hydra is not None
+    cfgs = gh.hydra.config_loader.compose_many(
+        config_file=config_file, overrides_list=overrides_list, strict=strict
+    )
+    for cfg in cfgs:
+        if "hydra" in cfg:
+            del cfg["hydra"]
+    return cfgs
@@ -1,7 +1,7 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
 from abc import abstractmethod
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from omegaconf import Container
 
@@ -52,6 +52,29 @@ class ConfigSource(Plugin):
     def list(self, config_path: str, results_filter: Optional[ObjectType]) -> List[str]:
         ...
 
+    def list_entries(self, config_path: str) -> Optional[Dict[str, ObjectType]]:
+        """
+        :param config_path: path of a group in this source
+        :return: a mapping from the raw names of the entries in the group (config files including
+                 their extension) to their type, an empty dict if the group does not exist or None
+                 if this source does not support listing raw entries.
+        """
+        return None
+
+    def get_cache_token(self, config_path: str) -> Optional[Any]:
+        """
+        :param config_path: path of a config in this source
+        :return: a hashable token that changes whenever the config changes (for example its mtime),
+                 or None if this source does not support caching of parsed configs.
+        """
+        return None
+
+    def invalidate(self) -> None:
+        """
+        Drops the caches of this source, called by ConfigRepository.invalidate()
+        """
+        pass
+
     def __str__(self) -> str:
         return repr(self)
 
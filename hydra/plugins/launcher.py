@@ -2,8 +2,10 @@
 """
 Launcher plugin interface
 """
+import contextvars
 from abc import abstractmethod
-from typing import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional, Sequence
 
 from omegaconf import DictConfig
 
@@ -15,6 +17,12 @@ from .plugin import Plugin
 
 
 class Launcher(Plugin):
+    # the thread of the default launch_async(), created by its first call
+    _launch_executor: Optional[ThreadPoolExecutor] = None
+
+    def __init__(self) -> None:
+        self._launch_executor = None
+
     @abstractmethod
     def setup(
         self,
@@ -28,8 +36,73 @@ class Launcher(Plugin):
         raise NotImplementedError()
 
     @abstractmethod
-    def launch(self, job_overrides: Sequence[Sequence[str]]) -> Sequence[JobReturn]:
+    def launch(
+        self, job_overrides: Sequence[Sequence[str]], initial_job_idx: int
+    ) -> Sequence[JobReturn]:
         """
         :param job_overrides: a batch of job arguments
+        :param initial_job_idx: Initial job idx in batch.
+                                e.g. the number of jobs launched by previous batches of the sweep.
         """
         raise NotImplementedError()
+
+    def launch_async(
+        self, job_overrides: Sequence[Sequence[str]], initial_job_idx: int
+    ) -> Sequence["Future[JobReturn]"]:
+        """
+        Launches a batch of jobs without waiting for them to complete.
+        The default implementation calls launch() in a background thread and completes all the
+        futures of the batch at once. Batches launched this way run one after the other.
+        Launchers able to report each job as it completes should override it.
+        Note that with the default implementation, launchers changing the state of the process
+        like the basic launcher (working dir with hydra.job.chdir, logging configuration) do so
+        from the background thread while the caller keeps running.
+        :param job_overrides: a batch of job arguments
+        :param initial_job_idx: Initial job idx in batch.
+        :return: a future per job, in the order of job_overrides
+        """
+        futures: List["Future[JobReturn]"] = [Future() for _ in job_overrides]
+        for future in futures:
+            future.set_running_or_notify_cancel()
+
+        def run() -> None:
+            try:
+                results = self.launch(job_overrides, initial_job_idx=initial_job_idx)
+                if len(results) != len(futures):
+                    raise RuntimeError(
+                        "Launcher returned {} results for {} jobs".format(
+                            len(results), len(futures)
+                        )
+                    )
+            except BaseException as e:
+                for future in futures:
+                    future.set_exception(e)
+                return
+            for future, result in zip(futures, results):
+                future.set_result(result)
+
+        executor = self._launch_executor
+        if executor is None:
+            # a single thread: launchers are not expected to support concurrent launch() calls
+            executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="hydra-launch"
+            )
+            self._launch_executor = executor
+        # the batch is launched in a copy of the current context
+        context = contextvars.copy_context()
+
+        def run_in_context() -> None:
+            context.run(run)
+
+        executor.submit(run_in_context)
+        return futures
+
+    def close(self) -> None:
+        """
+        Releases the resources of the launcher, called by the sweeper at the end of the sweep.
+        The default implementation waits for the batches launched with the default
+        launch_async() and stops its thread.
+        """
+        if self._launch_executor is not None:
+            self._launch_executor.shutdown()
+            self._launch_executor = None
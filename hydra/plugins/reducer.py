@@ -0,0 +1,82 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+"""
+Reducers aggregate the results of the jobs of a sweep as they complete
+"""
+import math
+from abc import ABC, abstractmethod
+from typing import Any, Mapping, Optional
+
+from omegaconf import DictConfig
+
+from hydra.core.utils import JobReturn, JobStatus
+
+
+class Reducer(ABC):
+    """
+    Aggregates the results of the jobs of a sweep as they complete, so that the sweeper does not
+    keep the JobReturn of every job. Configured in hydra.sweeper.reducer, either as a class name
+    or as a config with class and params.
+    A StepSweeper with a reducer returns the result of the reducer instead of the results
+    of all the jobs.
+    """
+
+    def setup(self, config: DictConfig) -> None:
+        """
+        Called once before the sweep
+        :param config: the config of the sweep
+        """
+        pass
+
+    @abstractmethod
+    def add(self, job_return: JobReturn) -> None:
+        """
+        Called with the result of each job as it completes
+        """
+        ...
+
+    @abstractmethod
+    def result(self) -> Any:
+        """
+        :return: the aggregate of the results of the jobs added so far
+        """
+        ...
+
+
+def job_metric(ret: JobReturn, metric: Optional[str]) -> Optional[float]:
+    """
+    :param ret: the result of a job
+    :param metric: the key of the metric if the job returns a dict, None if it returns a number
+    :return: the metric returned by the job, None if the job failed or returned no metric
+    """
+    if ret.status != JobStatus.COMPLETED:
+        return None
+    value = ret.return_value
+    if metric is not None and isinstance(value, (Mapping, DictConfig)):
+        value = value.get(metric)
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    if math.isnan(value):
+        return None
+    return float(value)
+
+
+def instantiate_reducer(config: DictConfig) -> Optional[Reducer]:
+    """
+    :param config: the config of the sweep
+    :return: the reducer configured in hydra.sweeper.reducer, None if there is none
+    """
+    from hydra.utils import get_class, instantiate
+
+    reducer_cfg = config.hydra.sweeper.get("reducer", None)
+    if reducer_cfg is None:
+        return None
+    if isinstance(reducer_cfg, DictConfig):
+        reducer = instantiate(reducer_cfg)
+    else:
+        reducer = get_class(str(reducer_cfg))()
+    if not isinstance(reducer, Reducer):
+        raise TypeError(
+            f"hydra.sweeper.reducer must be a subclass of Reducer, got {type(reducer).__name__}"
+        )
+    reducer.setup(config)
+    return reducer
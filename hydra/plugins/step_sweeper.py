@@ -4,15 +4,18 @@ A sweeper that operates on generational batches of jobs
 """
 import logging
 from abc import abstractmethod
-from typing import Any, List, Optional, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Any, Dict, List, Optional, Sequence
 
 from omegaconf import DictConfig
 
 from hydra.core.config_loader import ConfigLoader
+from hydra.core.sweep_manifest import record_submitted
 from hydra.core.utils import JobReturn
 from hydra.types import TaskFunction
 
 from .launcher import Launcher
+from .reducer import Reducer, instantiate_reducer
 from .sweeper import Sweeper
 
 log = logging.getLogger(__name__)
@@ -24,6 +27,8 @@ class StepSweeper(Sweeper):
     of jobs for every generation. This may not be flexible enough for all use cases, but probably
     covers 90% of the sweeping algorithms.
     It's using an internal launcher instance to launch each batch.
+    With a reducer (hydra.sweeper.reducer), the results of the jobs are passed to the reducer
+    and not kept, the sweep returns the result of the reducer.
     """
 
     def __init__(self) -> None:
@@ -31,6 +36,10 @@ class StepSweeper(Sweeper):
         self.arguments: Optional[List[str]] = None
         self.launcher: Optional[Launcher] = None
         self.config: Optional[DictConfig] = None
+        self.config_loader: Optional[ConfigLoader] = None
+        self.reducer: Optional[Reducer] = None
+        # number of jobs launched so far in the current sweep
+        self.launched_jobs = 0
 
     def setup(
         self,
@@ -41,6 +50,8 @@ class StepSweeper(Sweeper):
         from hydra.core.plugins import Plugins
 
         self.config = config
+        self.config_loader = config_loader
+        self.reducer = instantiate_reducer(config)
 
         self.launcher = Plugins.instantiate_launcher(
             config=config, config_loader=config_loader, task_function=task_function
@@ -54,6 +65,14 @@ class StepSweeper(Sweeper):
         """
         ...
 
+    def get_initial_job_idx(self) -> int:
+        """
+        Called after get_job_batch().
+        :return: the job number of the first job in the batch returned by get_job_batch().
+                 defaults to the number of jobs launched by the previous batches.
+        """
+        return self.launched_jobs
+
     @abstractmethod
     def is_done(self) -> bool:
         """
@@ -71,16 +90,144 @@ class StepSweeper(Sweeper):
         """
         ...
 
+    def launch_batch(
+        self, batch: Sequence[Sequence[str]], initial_job_idx: int
+    ) -> Sequence[JobReturn]:
+        """
+        Launches a batch of jobs with the launcher.
+        :param batch: the batch returned by get_job_batch()
+        :param initial_job_idx: the job number of the first job in the batch
+        :return: the results of the jobs, in the order of the batch
+        """
+        assert self.config is not None
+        assert self.launcher is not None
+        record_submitted(self.config, batch, initial_job_idx)
+        return self.launcher.launch(batch, initial_job_idx=initial_job_idx)
+
+    def collect_results(
+        self, results: Sequence[JobReturn], returns: List[Sequence[JobReturn]]
+    ) -> None:
+        """
+        Passes the results of completed jobs to the reducer, or keeps them in returns
+        if there is no reducer
+        """
+        if self.reducer is None:
+            returns.append(results)
+        else:
+            for job_return in results:
+                self.reducer.add(job_return)
+
+    def sweep_result(self, returns: List[Sequence[JobReturn]]) -> Any:
+        """
+        :return: the result of the sweep, the result of the reducer if there is one
+        """
+        if self.reducer is None:
+            return returns
+        return self.reducer.result()
+
     def sweep(self, arguments: List[str]) -> Any:
         assert self.config is not None
         assert self.launcher is not None
         log.info("Sweep output dir : {}".format(self.config.hydra.sweep.dir))
 
         self.arguments = arguments
+        self.launched_jobs = 0
         returns: List[Sequence[JobReturn]] = []
-        while not self.is_done():
-            batch = self.get_job_batch()
-            results = self.launcher.launch(batch)
-            returns.append(results)
-            self.update_results(results)
-        return returns
+        try:
+            while not self.is_done():
+                batch = self.get_job_batch()
+                initial_job_idx = self.get_initial_job_idx()
+                results = self.launch_batch(batch, initial_job_idx=initial_job_idx)
+                self.launched_jobs += len(batch)
+                self.collect_results(results, returns)
+                self.update_results(results)
+        finally:
+            self.launcher.close()
+        return self.sweep_result(returns)
+
+
+class AsyncStepSweeper(StepSweeper):
+    """
+    A StepSweeper consuming the results of the jobs as they complete instead of once per batch.
+    The sweeper is asked for new jobs whenever fewer than max_in_flight jobs are running,
+    so a few slow jobs do not leave the workers idle until the end of the generation.
+    Batches are launched with Launcher.launch_async().
+    get_job_batch() may return an empty batch to wait for more results, and update_results()
+    is called with the jobs that completed since its last call, in the order they were launched.
+    """
+
+    def __init__(self, max_in_flight: Optional[int] = None) -> None:
+        """
+        :param max_in_flight: maximum number of jobs launched and not completed yet,
+               None for no limit
+        """
+        super(AsyncStepSweeper, self).__init__()
+        if max_in_flight is not None and max_in_flight <= 0:
+            raise ValueError(
+                f"max_in_flight must be a positive number, got {max_in_flight}"
+            )
+        self.max_in_flight = max_in_flight
+        # number of jobs launched and not completed yet
+        self.num_in_flight = 0
+
+    def launch_batch_async(
+        self, batch: Sequence[Sequence[str]], initial_job_idx: int
+    ) -> Sequence["Future[JobReturn]"]:
+        """
+        Launches a batch of jobs with the launcher, without waiting for them to complete.
+        :param batch: the batch returned by get_job_batch()
+        :param initial_job_idx: the job number of the first job in the batch
+        :return: a future per job, in the order of the batch
+        """
+        assert self.config is not None
+        assert self.launcher is not None
+        record_submitted(self.config, batch, initial_job_idx)
+        return self.launcher.launch_async(batch, initial_job_idx=initial_job_idx)
+
+    def sweep(self, arguments: List[str]) -> Any:
+        assert self.config is not None
+        assert self.launcher is not None
+        log.info("Sweep output dir : {}".format(self.config.hydra.sweep.dir))
+
+        self.arguments = arguments
+        self.launched_jobs = 0
+        self.num_in_flight = 0
+        returns: List[Sequence[JobReturn]] = []
+        # job number of each job in flight
+        in_flight: Dict["Future[JobReturn]", int] = {}
+        try:
+            while True:
+                while not self.is_done() and (
+                    self.max_in_flight is None or len(in_flight) < self.max_in_flight
+                ):
+                    batch = self.get_job_batch()
+                    if len(batch) == 0:
+                        break
+                    initial_job_idx = self.get_initial_job_idx()
+                    futures = self.launch_batch_async(
+                        batch, initial_job_idx=initial_job_idx
+                    )
+                    for idx, future in enumerate(futures):
+                        in_flight[future] = initial_job_idx + idx
+                    self.launched_jobs += len(batch)
+                    self.num_in_flight = len(in_flight)
+
+                if len(in_flight) == 0:
+                    if not self.is_done():
+                        raise RuntimeError(
+                            "Sweeper is not done but has no job to launch and no job running"
+                        )
+                    break
+
+                done, _ = wait(in_flight.keys(), return_when=FIRST_COMPLETED)
+                completed = sorted(done, key=lambda f: in_flight[f])
+                results = [future.result() for future in completed]
+                for future in completed:
+                    del in_flight[future]
+                self.num_in_flight = len(in_flight)
+                self.collect_results(results, returns)
+                self.update_results(results)
+        finally:
+            # waits for the jobs still running if the sweep failed
+            self.launcher.close()
+        return self.sweep_result(returns)
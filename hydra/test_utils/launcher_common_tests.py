@@ -257,6 +257,10 @@ def sweep_two_config_groups(sweep_runner: TSweepRunner, overrides: List[str]) ->
 
 
 class IntegrationTestSuite:
+    # expression printed by the jobs to check that they run in their output dir,
+    # launchers that do not change the working dir of the jobs print their output dir instead
+    workdir_prints = "os.getcwd()"
+
     @staticmethod
     def verify_plugin(plugin_module: Optional[str]) -> None:
         if plugin_module is not None:
@@ -414,7 +418,7 @@ class IntegrationTestSuite:
             tmpdir=tmpdir,
             task_config=cfg,
             overrides=overrides,
-            prints="os.getcwd()",
+            prints=self.workdir_prints,
             expected_outputs=str(tmpdir / expected_dir),
         )
 
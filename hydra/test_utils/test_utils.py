@@ -223,6 +223,43 @@ class SweepTaskFunction:
         shutil.rmtree(self.temp_dir)
 
 
+@contextmanager
+def hydra_app(
+    calling_module: str = "hydra.test_utils.a_module",
+    config_dir: str = "configs",
+    strict: Optional[bool] = True,
+) -> Iterator[Hydra]:
+    """
+    Hydra instance of a module, for tests calling a task function in process
+    """
+    hydra_ = Hydra.create_main_hydra_file_or_module(
+        calling_file=None,
+        calling_module=calling_module,
+        config_dir=config_dir,
+        strict=strict,
+    )
+    try:
+        yield hydra_
+    finally:
+        GlobalHydra().clear()
+
+
+def run_multirun(
+    task_function: Callable[[DictConfig], Any],
+    overrides: List[str],
+    config_file: str = "compose.yaml",
+    strict: Optional[bool] = True,
+) -> Any:
+    """
+    Runs a sweep of a task function with the configs of hydra.test_utils
+    :return: the JobReturns of the batches of the sweep
+    """
+    with hydra_app(strict=strict) as hydra_:
+        return hydra_.multirun(
+            config_file=config_file, task_function=task_function, overrides=overrides
+        )
+
+
 @pytest.fixture(scope="function")  # type: ignore
 def sweep_runner() -> Callable[
     [Optional[str], Optional[str], Optional[str], Optional[List[str]], Optional[bool]],
@@ -1,10 +1,11 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
 import logging.config
 from pathlib import Path
-from typing import Any
+from typing import Any, Dict, List, Optional, Union
 
 from omegaconf import DictConfig, OmegaConf
 
+from hydra.core import sweep_manifest, sweep_results
 from hydra.core.hydra_config import HydraConfig
 
 log = logging.getLogger(__name__)
@@ -74,6 +75,16 @@ def get_original_cwd() -> str:
     return ret
 
 
+def get_output_dir() -> str:
+    """
+    :return: the output directory of the current job.
+    It's also the working directory of the job unless hydra.job.chdir is false.
+    """
+    ret = HydraConfig.instance().hydra.runtime.output_dir
+    assert ret is not None and isinstance(ret, str)
+    return ret
+
+
 def to_absolute_path(path: str) -> str:
     """
     converts the specified path to be absolute path.
@@ -88,3 +99,34 @@ def to_absolute_path(path: str) -> str:
     else:
         ret = Path(get_original_cwd()) / p
     return str(ret)
+
+
+def load_sweep_manifest(
+    sweep_dir: Union[str, Path], status: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Loads the index of the jobs of a sweep (hydra.manifest), a single file read
+    :param sweep_dir: the sweep dir (hydra.sweep.dir)
+    :param status: only return the jobs with this status, e.g. COMPLETED or FAILED
+    :return: a dict per job, sorted by job number, with the fields: num, overrides, status,
+             working_dir, config_hash, submit_time, start_time, end_time, return_value and error.
+             The fields that were not recorded for a job are missing.
+    """
+    return sweep_manifest.load_sweep_manifest(sweep_dir, status)
+
+
+def load_sweep_results(
+    sweep_dir: Union[str, Path],
+    output_subdir: str = ".hydra",
+    max_workers: Optional[int] = None,
+) -> Dict[str, List[Any]]:
+    """
+    Loads the return values saved by the jobs of a sweep (hydra.save_return_value) as a table
+    :param sweep_dir: the sweep dir (hydra.sweep.dir)
+    :param output_subdir: the hydra output subdir of the jobs (hydra.output_subdir)
+    :param max_workers: number of threads loading the jobs, None for the default of ThreadPoolExecutor
+    :return: a list of values per column, with a row per job: working_dir, a column per
+             overridden key, and return_value or a return_value.<key> column per item of the
+             dicts returned by the jobs. Missing values are None.
+    """
+    return sweep_results.load_sweep_results(sweep_dir, output_subdir, max_workers)
@@ -55,7 +55,9 @@ class ExampleLauncher(Launcher):
         self.config_loader = config_loader
         self.task_function = task_function
 
-    def launch(self, job_overrides: Sequence[Sequence[str]]) -> Sequence[JobReturn]:
+    def launch(
+        self, job_overrides: Sequence[Sequence[str]], initial_job_idx: int
+    ) -> Sequence[JobReturn]:
         """
         :param job_overrides: a List of List<String>, where each inner list is the arguments for one job run.
         :return: an array of return values from run_job with indexes corresponding to the input list indexes.
@@ -77,6 +79,7 @@ class ExampleLauncher(Launcher):
         runs = []
 
         for idx, overrides in enumerate(job_overrides):
+            idx = initial_job_idx + idx
             log.info("\t#{} : {}".format(idx, " ".join(filter_overrides(overrides))))
             sweep_config = self.config_loader.load_sweep_config(
                 self.config, list(overrides)
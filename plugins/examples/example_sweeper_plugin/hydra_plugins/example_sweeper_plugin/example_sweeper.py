@@ -63,5 +63,5 @@ class ExampleSweeper(Sweeper):
 
         batch = list(itertools.product(*src_lists))
 
-        returns = [self.launcher.launch(batch)]
+        returns = [self.launcher.launch(batch, initial_job_idx=0)]
         return returns
@@ -105,7 +105,15 @@ with open("README.md", "r") as fh:
             "Operating System :: MacOS",
             "Operating System :: Microsoft :: Windows",
         ],
-        install_requires=["omegaconf>=2.0.0rc4", "typing_extensions"],
+        entry_points={
+            "console_scripts": ["hydra-worker = hydra._internal.work_queue:main"]
+        },
+        install_requires=[
+            "omegaconf>=2.0.0rc4",
+            "typing_extensions",
+            "importlib_resources;python_version<'3.9'",
+            "contextvars;python_version<'3.7'",
+        ],
         # Install development dependencies with
         # pip install -e .[dev]
         extras_require={
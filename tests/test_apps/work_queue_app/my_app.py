@@ -0,0 +1,16 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+import os
+from typing import Any
+
+from omegaconf import DictConfig
+
+import hydra
+
+
+@hydra.main()
+def my_app(cfg: DictConfig) -> Any:
+    return os.getpid(), cfg.foo
+
+
+if __name__ == "__main__":
+    my_app()
@@ -0,0 +1,108 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+import asyncio
+import logging
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+from omegaconf import DictConfig
+
+from hydra._internal.hydra import Hydra
+from hydra.core.global_hydra import GlobalHydra
+from hydra.core.hydra_config import HydraConfig
+from hydra.core.utils import JobStatus
+from hydra.test_utils.launcher_common_tests import (
+    IntegrationTestSuite,
+    LauncherTestSuite,
+)
+
+# noinspection PyUnresolvedReferences
+from hydra.test_utils.test_utils import chdir_hydra_root, sweep_runner  # noqa: F401
+from hydra.utils import get_output_dir
+
+chdir_hydra_root()
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "launcher_name, overrides",
+    [("asyncio", []), ("asyncio", ["hydra.launcher.params.max_concurrency=1"])],
+)
+class TestAsyncioLauncher(LauncherTestSuite):
+    pass
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "task_launcher_cfg, extra_flags, plugin_module",
+    [
+        (
+            {
+                "defaults": [
+                    {"hydra/launcher": "asyncio"},
+                    {"hydra/hydra_logging": "hydra_debug"},
+                    {"hydra/job_logging": "disabled"},
+                ]
+            },
+            ["-m"],
+            "hydra._internal.core_plugins.asyncio_launcher",
+        )
+    ],
+)
+class TestAsyncioLauncherIntegration(IntegrationTestSuite):
+    """
+    Run this launcher through the integration test suite.
+    """
+
+    # the jobs run without changing the working dir
+    workdir_prints = "hydra.utils.get_output_dir()"
+
+
+def test_async_task_function(tmpdir: Path) -> None:
+    running = 0
+    max_running = 0
+
+    async def task_function(cfg: DictConfig) -> Any:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        logging.getLogger(__name__).info(f"job foo={cfg.foo}")
+        await asyncio.sleep(0.05)
+        running -= 1
+        if cfg.foo == 2:
+            raise ValueError("bad foo")
+        return get_output_dir(), HydraConfig.instance().hydra.job.num
+
+    hydra_ = Hydra.create_main_hydra_file_or_module(
+        calling_file=None,
+        calling_module="hydra.test_utils.a_module",
+        config_dir="configs",
+        strict=False,
+    )
+    try:
+        returns = hydra_.multirun(
+            config_file="compose.yaml",
+            task_function=task_function,
+            overrides=[
+                "hydra/launcher=asyncio",
+                f"hydra.sweep.dir={tmpdir}",
+                "foo=1,2,3,4",
+            ],
+        )
+    finally:
+        GlobalHydra().clear()
+
+    results: List[Any] = returns[0]
+    assert max_running == 4
+    assert [r.status for r in results] == [
+        JobStatus.COMPLETED,
+        JobStatus.FAILED,
+        JobStatus.COMPLETED,
+        JobStatus.COMPLETED,
+    ]
+    assert "bad foo" in results[1].error
+    for num in (0, 2, 3):
+        output_dir = str(Path(str(tmpdir)) / str(num))
+        assert results[num].return_value == (output_dir, num)
+        # each job log only contains the records logged by the job
+        log_file = Path(output_dir) / "a_module.log"
+        assert log_file.read_text().count("job foo=") == 1
+        assert f"job foo={num + 1}" in log_file.read_text()
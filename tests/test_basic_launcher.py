@@ -1,5 +1,14 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+import logging
+import logging.config
+from pathlib import Path
+from typing import Any, List
+
 import pytest
+from omegaconf import DictConfig
+
+from hydra._internal.hydra import Hydra
+from hydra.core.global_hydra import GlobalHydra
 
 from hydra.test_utils.launcher_common_tests import (
     IntegrationTestSuite,
@@ -7,10 +16,15 @@ from hydra.test_utils.launcher_common_tests import (
 )
 
 # noinspection PyUnresolvedReferences
-from hydra.test_utils.test_utils import sweep_runner  # noqa: F401
+from hydra.test_utils.test_utils import chdir_hydra_root, sweep_runner  # noqa: F401
 
+chdir_hydra_root()
 
-@pytest.mark.parametrize("launcher_name, overrides", [("basic", [])])
+
+@pytest.mark.parametrize(
+    "launcher_name, overrides",
+    [("basic", []), ("basic", ["hydra.launcher.jobs_per_task=2"])],
+)
 class TestBasicLauncher(LauncherTestSuite):
     pass
 
@@ -37,3 +51,46 @@ class TestExampleLauncherIntegration(IntegrationTestSuite):
     """
 
     pass
+
+
+def test_jobs_per_task(tmpdir: Path, monkeypatch: Any) -> None:
+    dict_configs: List[Any] = []
+    dict_config = logging.config.dictConfig
+
+    def counting_dict_config(conf: Any) -> None:
+        dict_configs.append(conf)
+        dict_config(conf)
+
+    monkeypatch.setattr(logging.config, "dictConfig", counting_dict_config)
+
+    def task_function(cfg: DictConfig) -> Any:
+        logging.getLogger(__name__).info(f"running foo={cfg.foo}")
+        return cfg.foo
+
+    hydra_ = Hydra.create_main_hydra_file_or_module(
+        calling_file=None,
+        calling_module="hydra.test_utils.a_module",
+        config_dir="configs",
+        strict=True,
+    )
+    try:
+        returns = hydra_.multirun(
+            config_file="compose.yaml",
+            task_function=task_function,
+            overrides=[
+                "hydra.launcher.jobs_per_task=3",
+                f"hydra.sweep.dir={tmpdir}",
+                "foo=1,2,3,4",
+            ],
+        )
+    finally:
+        GlobalHydra().clear()
+
+    assert [r.return_value for r in returns[0]] == [1, 2, 3, 4]
+    # the job logging is configured once per pack
+    job_logging = [conf for conf in dict_configs if "file" in conf["handlers"]]
+    assert len(job_logging) == 2
+    for num in range(4):
+        log_file = Path(str(tmpdir)) / str(num) / "a_module.log"
+        assert log_file.read_text().count("running foo=") == 1
+        assert f"running foo={num + 1}" in log_file.read_text()
@@ -0,0 +1,270 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+import itertools
+import os
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+from omegaconf import DictConfig, OmegaConf
+
+from hydra._internal.core_plugins.basic_sweeper import (
+    BasicSweeper,
+    SweepGrid,
+    parse_sweep_values,
+)
+from hydra._internal.hydra import Hydra
+from hydra.core.global_hydra import GlobalHydra
+from hydra.core.utils import JOB_STATUS_FILE, JobStatus, get_num_shard
+
+# noinspection PyUnresolvedReferences
+from hydra.test_utils.test_utils import (  # noqa: F401
+    TSweepRunner,
+    chdir_hydra_root,
+    sweep_runner,
+)
+
+chdir_hydra_root()
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "value, expected",
+    [
+        ("1,2,3", ["1", "2", "3"]),
+        ("abc", ["abc"]),
+        ("range(3)", ["0", "1", "2"]),
+        ("range(1,4)", ["1", "2", "3"]),
+        ("range(0,10,3)", ["0", "3", "6", "9"]),
+        ("range(0,1,0.25)", ["0.0", "0.25", "0.5", "0.75"]),
+        ("range(1.0,3)", ["1.0", "2.0"]),
+        ("range(3,0,-1)", ["3", "2", "1"]),
+        ("range(3,0)", []),
+    ],
+)
+def test_parse_sweep_values(value: str, expected: List[str]) -> None:
+    values = parse_sweep_values(value)
+    assert len(values) == len(expected)
+    assert list(values) == expected
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "value", ["range()", "range(1,2,3,4)", "range(a,b)", "range(0,1,0)", "range(0,inf)"]
+)
+def test_parse_sweep_values_errors(value: str) -> None:
+    with pytest.raises(ValueError):
+        parse_sweep_values(value)
+
+
+def test_sweep_grid() -> None:
+    arguments = ["a=1,2,3", "b=x", "c=range(0,0.5,0.1)"]
+    grid = SweepGrid(arguments)
+    expected = list(
+        itertools.product(
+            ["a=1", "a=2", "a=3"],
+            ["b=x"],
+            ["c=0.0", "c=0.1", "c=0.2", "c=0.3", "c=0.4"],
+        )
+    )
+    assert len(grid) == len(expected)
+    assert [tuple(x) for x in grid] == expected
+    assert grid[-1] == list(expected[-1])
+    assert [tuple(x) for x in grid[3:7]] == expected[3:7]
+
+
+def test_sweep_grid_is_lazy() -> None:
+    grid = SweepGrid(["a=range(0,100000)", "b=range(0,100000)", "c=1,2"])
+    assert len(grid) == 2 * 10 ** 10
+    assert grid[12345678901] == ["a=61728", "b=39450", "c=2"]
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "max_batch_size, expected_batches", [("null", [6]), (4, [4, 2]), (6, [6])]
+)
+def test_max_batch_size(
+    sweep_runner: TSweepRunner,  # noqa: F811
+    max_batch_size: Any,
+    expected_batches: List[int],
+) -> None:
+    sweep = sweep_runner(
+        calling_file=None,
+        calling_module="hydra.test_utils.a_module",
+        config_path="configs/compose.yaml",
+        overrides=[
+            f"hydra.sweeper.params.max_batch_size={max_batch_size}",
+            "foo=1,2,3",
+            "bar=range(0,2)",
+        ],
+        strict=True,
+    )
+    with sweep:
+        assert sweep.returns is not None
+        assert [len(batch) for batch in sweep.returns] == expected_batches
+        returns = list(itertools.chain(*sweep.returns))
+        assert [r.overrides for r in returns] == [
+            [f"foo={foo}", f"bar={bar}"] for foo in [1, 2, 3] for bar in [0, 1]
+        ]
+        assert [r.hydra_cfg.hydra.job.num for r in returns] == list(range(6))
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "num_jobs, num_shards", [(6, 1), (6, 2), (7, 3), (2, 4)]
+)
+def test_shards_cover_all_jobs(num_jobs: int, num_shards: int) -> None:
+    ranges = [
+        BasicSweeper(shard_index=i, num_shards=num_shards).get_shard_range(num_jobs)
+        for i in range(num_shards)
+    ]
+    jobs = list(itertools.chain(*[range(start, stop) for start, stop in ranges]))
+    assert jobs == list(range(num_jobs))
+    sizes = [stop - start for start, stop in ranges]
+    assert max(sizes) - min(sizes) <= 1
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "shard_index, num_shards", [(1, 1), (-1, 2), (0, 0)]
+)
+def test_invalid_shard(shard_index: int, num_shards: int) -> None:
+    with pytest.raises(ValueError):
+        BasicSweeper(shard_index=shard_index, num_shards=num_shards)
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "shard_index, expected_nums", [(0, [0, 1, 2]), (1, [3, 4, 5, 6])]
+)
+def test_sharded_sweep(
+    sweep_runner: TSweepRunner,  # noqa: F811
+    shard_index: int,
+    expected_nums: List[int],
+) -> None:
+    sweep = sweep_runner(
+        calling_file=None,
+        calling_module="hydra.test_utils.a_module",
+        config_path="configs/compose.yaml",
+        overrides=[
+            f"hydra.sweeper.params.shard_index={shard_index}",
+            "hydra.sweeper.params.num_shards=2",
+            "hydra.sweeper.params.max_batch_size=2",
+            "foo=range(7)",
+        ],
+        strict=True,
+    )
+    with sweep:
+        assert sweep.returns is not None
+        returns = list(itertools.chain(*sweep.returns))
+        assert [r.overrides for r in returns] == [[f"foo={n}"] for n in expected_nums]
+        assert [r.hydra_cfg.hydra.job.num for r in returns] == expected_nums
+        assert [os.path.basename(str(r.working_dir)) for r in returns] == [
+            str(n) for n in expected_nums
+        ]
+
+
+def test_resume(tmpdir: Path) -> None:
+    calls: List[int] = []
+    fail_on = [3]
+
+    def task_function(cfg: DictConfig) -> int:
+        calls.append(cfg.foo)
+        if cfg.foo in fail_on:
+            raise RuntimeError("failed")
+        return int(cfg.foo) * 10
+
+    def multirun(overrides: List[str]) -> Any:
+        hydra_ = Hydra.create_main_hydra_file_or_module(
+            calling_file=None,
+            calling_module="hydra.test_utils.a_module",
+            config_dir="configs",
+            strict=True,
+        )
+        try:
+            return hydra_.multirun(
+                config_file="compose.yaml",
+                task_function=task_function,
+                overrides=overrides + [f"hydra.sweep.dir={tmpdir}"],
+            )
+        finally:
+            GlobalHydra().clear()
+
+    with pytest.raises(RuntimeError):
+        multirun(["foo=range(5)"])
+    assert calls == [0, 1, 2, 3]
+    statuses = [
+        OmegaConf.load(str(Path(str(tmpdir)) / str(i) / ".hydra" / JOB_STATUS_FILE))
+        for i in range(4)
+    ]
+    assert [s.status for s in statuses] == ["COMPLETED"] * 3 + ["FAILED"]
+    assert [s.return_value for s in statuses] == [0, 10, 20, None]
+
+    calls.clear()
+    fail_on.clear()
+    returns = multirun(
+        ["foo=range(5)", "hydra.sweeper.params.resume=true"]
+        + ["hydra.sweeper.params.max_batch_size=2"]
+    )
+    # only the failed and the missing jobs are launched
+    assert calls == [3, 4]
+    results = list(itertools.chain(*returns))
+    assert [r.status for r in results] == [JobStatus.COMPLETED] * 5
+    assert [r.return_value for r in results] == [0, 10, 20, 30, 40]
+    assert [r.overrides for r in results] == [[f"foo={i}"] for i in range(5)]
+    assert [r.cfg.foo for r in results] == list(range(5))
+    assert [r.hydra_cfg.hydra.job.num for r in results] == list(range(5))
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "num, size, expected",
+    [
+        (0, 1000, ("000", "000000")),
+        (123, 1000, ("000", "000123")),
+        (4567, 1000, ("004", "004567")),
+        (1234567, 1000, ("1234", "1234567")),
+        (5, 10, ("0", "05")),
+        (3, 1, ("3", "03")),
+    ],
+)
+def test_get_num_shard(num: int, size: int, expected: Any) -> None:
+    assert get_num_shard(num, size) == expected
+
+
+def test_sharded_subdirs_resume(tmpdir: Path) -> None:
+    calls: List[int] = []
+
+    def task_function(cfg: DictConfig) -> int:
+        calls.append(cfg.foo)
+        return int(cfg.foo) * 10
+
+    def multirun(overrides: List[str]) -> Any:
+        hydra_ = Hydra.create_main_hydra_file_or_module(
+            calling_file=None,
+            calling_module="hydra.test_utils.a_module",
+            config_dir="configs",
+            strict=True,
+        )
+        try:
+            return hydra_.multirun(
+                config_file="compose.yaml",
+                task_function=task_function,
+                overrides=overrides
+                + [
+                    "hydra/output=sharded",
+                    "hydra.job.config.num_shard.size=2",
+                    f"hydra.sweep.dir={tmpdir}",
+                ],
+            )
+        finally:
+            GlobalHydra().clear()
+
+    returns = multirun(["foo=range(3)"])
+    results = list(itertools.chain(*returns))
+    assert [os.path.relpath(str(r.working_dir), str(tmpdir)) for r in results] == [
+        os.path.join("0", "00"),
+        os.path.join("0", "01"),
+        os.path.join("1", "02"),
+    ]
+    assert [r.hydra_cfg.hydra.job.num_shard for r in results] == ["0", "0", "1"]
+    assert sorted(os.listdir(str(tmpdir / "0"))) == ["00", "01"]
+
+    calls.clear()
+    returns = multirun(["foo=range(5)", "hydra.sweeper.params.resume=true"])
+    assert calls == [3, 4]
+    results = list(itertools.chain(*returns))
+    assert [r.return_value for r in results] == [0, 10, 20, 30, 40]
+    assert sorted(os.listdir(str(tmpdir / "2"))) == ["04"]
@@ -65,7 +65,20 @@ base_completion_list: List[str] = [
             ],
         ),
         ("hydra/lau", 2, ["hydra/launcher="]),
-        ("hydra/launcher=", 2, ["hydra/launcher=basic", "hydra/launcher=fairtask"]),
+        (
+            "hydra/launcher=",
+            2,
+            [
+                "hydra/launcher=asyncio",
+                "hydra/launcher=basic",
+                "hydra/launcher=fairtask",
+                "hydra/launcher=fork_server",
+                "hydra/launcher=process_pool",
+                "hydra/launcher=resources",
+                "hydra/launcher=thread_pool",
+                "hydra/launcher=work_queue",
+            ],
+        ),
         ("hydra/launcher=ba", 2, ["hydra/launcher=basic"]),
         # loading groups
         ("gro", 2, ["group="]),
@@ -6,7 +6,7 @@ import pytest
 from hydra._internal.config_search_path_impl import ConfigSearchPathImpl
 from hydra.core.config_search_path import SearchPathQuery
 from hydra.core.global_hydra import GlobalHydra
-from hydra.experimental import compose, initialize
+from hydra.experimental import compose, compose_many, initialize
 
 # noinspection PyUnresolvedReferences
 from hydra.test_utils.test_utils import (  # noqa: F401
@@ -69,6 +69,18 @@ class TestCompose:
             ret = compose(config_file, overrides)
             assert ret == expected
 
+    def test_compose_many(
+        self,
+        hydra_global_context: TGlobalHydraContext,  # noqa: F811
+        config_dir: str,
+        config_file: str,
+        overrides: List[str],
+        expected: Any,
+    ) -> None:
+        with hydra_global_context(config_dir=config_dir):
+            ret = compose_many(config_file, [overrides, overrides])
+            assert ret == [expected, expected]
+
     def test_compose_config(
         self,
         config_dir: str,
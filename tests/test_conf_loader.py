@@ -1,5 +1,8 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+import os
+from pathlib import Path
 from typing import Any, List
+from unittest import mock
 
 import pkg_resources
 import pytest
@@ -168,6 +171,43 @@ class TestConfigLoader:
             ("custom_default_launcher.yaml", path, "main"),
         ]
 
+    def test_compose_many(self, path: str) -> None:
+        config_loader = ConfigLoaderImpl(
+            config_search_path=create_config_search_path(path)
+        )
+        overrides_list = [["group1=file1"], ["group1=file2"], ["group2=file2"]]
+        expected = [
+            config_loader.load_configuration(
+                config_file="compose.yaml", overrides=overrides, strict=False
+            )
+            for overrides in overrides_list
+        ]
+        expected_history = [
+            (t.filename, t.path, t.provider) for t in config_loader.get_load_history()
+        ]
+        config_loader.all_config_checked.clear()
+        with mock.patch.object(
+            config_loader.repository,
+            "load_config",
+            wraps=config_loader.repository.load_config,
+        ) as load_config:
+            cfgs = config_loader.compose_many(
+                config_file="compose.yaml", overrides_list=overrides_list, strict=False
+            )
+        assert cfgs == expected
+        # the hydra defaults prefix is merged once and reused by the following configs
+        hydra_loads = [
+            c
+            for c in load_config.call_args_list
+            if c[1]["config_path"].startswith("hydra/")
+        ]
+        assert len(hydra_loads) == 7
+        # the configs reused from the memo are still in the load history
+        assert config_loader.get_load_history() == expected_history
+        # a config reusing the memoized prefix is independent of other configs
+        cfgs[0].foo = "changed"
+        assert cfgs[1].foo == 20
+
     def test_load_yml_file(self, path: str) -> None:
         config_loader = ConfigLoaderImpl(
             config_search_path=create_config_search_path(path)
@@ -396,3 +436,73 @@ def test_mixed_composition_order() -> None:
         ("group1/file1.yaml", "file://hydra/test_utils/configs", "main"),
         ("config.yaml", "file://hydra/test_utils/configs", "main"),
     ]
+
+
+def test_sweep_memo_with_changed_config(tmpdir: Path) -> None:
+    config_dir = Path(str(tmpdir))
+    (config_dir / "group").mkdir()
+    (config_dir / "config.yaml").write_text("defaults:\n  - group: a\n")
+    (config_dir / "group" / "a.yaml").write_text("value: 1\n")
+    config_loader = ConfigLoaderImpl(
+        config_search_path=create_config_search_path(f"file://{config_dir}")
+    )
+    master_config = config_loader.load_configuration(
+        config_file="config.yaml", overrides=[], strict=False
+    )
+    num_loads = len(config_loader.get_load_history())
+    assert config_loader.load_sweep_config(master_config, ["x=1"]).value == 1
+    first = [
+        (t.filename, t.path, t.provider)
+        for t in config_loader.get_load_history()[num_loads:]
+    ]
+    num_loads += len(first)
+    assert config_loader.load_sweep_config(master_config, ["x=2"]).value == 1
+    # the configs reused from the memo are still in the load history
+    assert config_loader.get_load_history()[num_loads:] == first
+
+    config_file = config_dir / "group" / "a.yaml"
+    config_file.write_text("value: 22\n")
+    stat = os.stat(str(config_file))
+    os.utime(str(config_file), ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert config_loader.load_sweep_config(master_config, ["x=3"]).value == 22
+
+
+@pytest.mark.parametrize("memoized", [False, True])
+def test_merge_defaults_order(tmpdir: Path, memoized: bool) -> None:
+    config_dir = Path(str(tmpdir))
+    (config_dir / "group").mkdir()
+    (config_dir / "config.yaml").write_text(
+        "defaults:\n"
+        "  - group: a\n"
+        "  - group2: missing\n"
+        "    optional: true\n"
+        "  - b\n"
+        "x: primary\n"
+        "y: primary\n"
+        "z: primary\n"
+    )
+    (config_dir / "group" / "a.yaml").write_text("x: a\ny: a\n")
+    (config_dir / "b.yaml").write_text("y: b\n")
+    config_loader = ConfigLoaderImpl(
+        config_search_path=create_config_search_path(f"file://{config_dir}")
+    )
+
+    def load(overrides: List[str]) -> Any:
+        if memoized:
+            return config_loader.compose_many(
+                config_file="config.yaml", overrides_list=[overrides], strict=False
+            )[0]
+        return config_loader.load_configuration(
+            config_file="config.yaml", overrides=overrides, strict=False
+        )
+
+    # the defaults are merged after the primary config, in order
+    cfg = load([])
+    del cfg["hydra"]
+    assert cfg == {"x": "a", "y": "b", "z": "primary"}
+    # a missing optional config is skipped
+    assert ("group2/missing.yaml", None, None) in config_loader.get_load_history()
+
+    # a required config that is missing is an error
+    with pytest.raises(MissingConfigException):
+        load(["group=missing"])
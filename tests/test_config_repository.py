@@ -1,8 +1,13 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
-from typing import List, Optional
+import os
+import sys
+import zipfile
+from pathlib import Path
+from typing import Any, List, Optional
 
 import pytest
 
+from hydra._internal.config_cache import ConfigCache
 from hydra._internal.config_repository import ConfigRepository
 from hydra._internal.config_search_path_impl import ConfigSearchPathImpl
 from hydra._internal.core_plugins.file_config_source import FileConfigSource
@@ -52,6 +57,22 @@ class TestConfigRepository:
         }
         assert repo.load_config(config_path="not_found.yaml") is None
 
+    def test_config_repository_load_cached(self, path: str) -> None:
+        ConfigCache.instance().clear()
+        config_search_path = create_config_search_path(path)
+        repo = ConfigRepository(config_search_path=config_search_path)
+        ret1 = repo.load_config(config_path="dataset/imagenet.yaml")
+        ret2 = repo.load_config(config_path="dataset/imagenet.yaml")
+        assert ret1 is not None and ret2 is not None
+        assert ConfigCache.instance().hits == 1
+        assert ret1.config == ret2.config
+        assert ret1.config is not ret2.config
+        # mutating a loaded config must not corrupt the cached entry
+        ret1.config.dataset.name = "corrupted"
+        ret3 = repo.load_config(config_path="dataset/imagenet.yaml")
+        assert ret3 is not None
+        assert ret3.config.dataset.name == "imagenet"
+
     def test_config_repository_exists(self, path: str) -> None:
         config_search_path = create_config_search_path(path)
         repo = ConfigRepository(config_search_path=config_search_path)
@@ -86,3 +107,112 @@ class TestConfigRepository:
             group_name=config_path, results_filter=results_filter
         )
         assert ret == expected
+
+
+def test_config_cache_invalidated_on_change(tmpdir: Path) -> None:
+    ConfigCache.instance().clear()
+    cfg_file = Path(str(tmpdir)) / "config.yaml"
+    cfg_file.write_text("foo: 1\n")
+    repo = ConfigRepository(
+        config_search_path=create_config_search_path(f"file://{tmpdir}")
+    )
+    ret = repo.load_config(config_path="config.yaml")
+    assert ret is not None and ret.config == {"foo": 1}
+
+    cfg_file.write_text("foo: 20\n")
+    stat = os.stat(str(cfg_file))
+    os.utime(str(cfg_file), ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    ret = repo.load_config(config_path="config.yaml")
+    assert ret is not None and ret.config == {"foo": 20}
+    assert ConfigCache.instance().hits == 0
+
+
+def test_config_repository_index(tmpdir: Path) -> None:
+    group_dir = Path(str(tmpdir)) / "group"
+    group_dir.mkdir()
+    (group_dir / "a.yaml").write_text("a: 1\n")
+    repo = ConfigRepository(
+        config_search_path=create_config_search_path(f"file://{tmpdir}")
+    )
+    assert repo.exists("group/a.yaml")
+    assert not repo.exists("group/b.yaml")
+    assert repo.get_group_options("group") == ["a"]
+
+    # lookups are served from the index without probing the sources
+    def fail(*args: Any, **kwargs: Any) -> Any:
+        assert False
+
+    for source in repo.get_sources():
+        source.exists = fail  # type: ignore
+        source.list = fail  # type: ignore
+    assert repo.exists("group/a.yaml")
+    assert not repo.exists("group/not_there.yaml")
+    assert repo.get_group_options("group") == ["a"]
+
+    # the cache tokens are only checked once until the next composition
+    for source in repo.get_sources():
+        source.get_cache_token = fail  # type: ignore
+    assert repo.exists("group/a.yaml")
+    for source in repo.get_sources():
+        del source.get_cache_token
+
+    # adding a file changes the group mtime and invalidates the index
+    (group_dir / "b.yaml").write_text("b: 1\n")
+    stat = os.stat(str(group_dir))
+    os.utime(str(group_dir), ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert not repo.exists("group/b.yaml")
+    repo.revalidate()
+    assert repo.exists("group/b.yaml")
+    assert repo.get_group_options("group") == ["a", "b"]
+
+    (group_dir / "c.yaml").write_text("c: 1\n")
+    repo.invalidate()
+    assert repo.exists("group/c.yaml")
+
+
+def test_package_config_source_zipped(tmpdir: Path) -> None:
+    zip_file = Path(str(tmpdir)) / "zipped.zip"
+    with zipfile.ZipFile(str(zip_file), "w") as zf:
+        zf.writestr("zipped_configs/__init__.py", "")
+        zf.writestr("zipped_configs/config.yaml", "foo: bar\n")
+        zf.writestr("zipped_configs/group/a.yaml", "a: 1\n")
+        zf.writestr("zipped_configs/group/b.yaml", "b: 2\n")
+    sys.path.insert(0, str(zip_file))
+    try:
+        src = PackageConfigSource(provider="foo", path="pkg://zipped_configs")
+        assert src.get_type("") == ObjectType.GROUP
+        assert src.get_type("group") == ObjectType.GROUP
+        assert src.get_type("config.yaml") == ObjectType.CONFIG
+        assert not src.exists("group/c.yaml")
+        assert src.list("group", results_filter=ObjectType.CONFIG) == ["a", "b"]
+        assert src.load_config("group/b.yaml").config == {"b": 2}
+    finally:
+        sys.path.remove(str(zip_file))
+        sys.modules.pop("zipped_configs", None)
+
+
+def test_package_config_source_listing_changes(tmpdir: Path) -> None:
+    package_dir = Path(str(tmpdir)) / "listed_configs"
+    (package_dir / "group").mkdir(parents=True)
+    (package_dir / "__init__.py").write_text("")
+    (package_dir / "group" / "a.yaml").write_text("a: 1\n")
+    sys.path.insert(0, str(tmpdir))
+    try:
+        src = PackageConfigSource(provider="foo", path="pkg://listed_configs")
+        assert src.list("group", results_filter=ObjectType.CONFIG) == ["a"]
+
+        # the listing is refreshed when the directory changes
+        (package_dir / "group" / "b.yaml").write_text("b: 1\n")
+        stat = os.stat(str(package_dir / "group"))
+        os.utime(
+            str(package_dir / "group"),
+            ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9),
+        )
+        assert src.list("group", results_filter=ObjectType.CONFIG) == ["a", "b"]
+
+        # and dropped by ConfigRepository.invalidate()
+        src.invalidate()
+        assert PackageConfigSource._listings == {}
+    finally:
+        sys.path.remove(str(tmpdir))
+        sys.modules.pop("listed_configs", None)
@@ -0,0 +1,101 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+import itertools
+import os
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+from omegaconf import DictConfig
+
+from hydra._internal.hydra import Hydra
+from hydra.core.global_hydra import GlobalHydra
+from hydra.core.utils import JobStatus
+from hydra.test_utils.launcher_common_tests import (
+    IntegrationTestSuite,
+    LauncherTestSuite,
+)
+
+# noinspection PyUnresolvedReferences
+from hydra.test_utils.test_utils import chdir_hydra_root, sweep_runner  # noqa: F401
+
+chdir_hydra_root()
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "launcher_name, overrides",
+    [("fork_server", []), ("fork_server", ["hydra.launcher.params.n_jobs=1"])],
+)
+class TestForkServerLauncher(LauncherTestSuite):
+    pass
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "task_launcher_cfg, extra_flags, plugin_module",
+    [
+        (
+            {
+                "defaults": [
+                    {"hydra/launcher": "fork_server"},
+                    {"hydra/hydra_logging": "hydra_debug"},
+                    {"hydra/job_logging": "disabled"},
+                ]
+            },
+            ["-m"],
+            "hydra._internal.core_plugins.fork_server_launcher",
+        )
+    ],
+)
+class TestForkServerLauncherIntegration(IntegrationTestSuite):
+    """
+    Run this launcher through the integration test suite.
+    """
+
+    pass
+
+
+def test_template_is_reused_across_batches(tmpdir: Path) -> None:
+    def task_function(cfg: DictConfig) -> Any:
+        if cfg.foo == 2:
+            raise ValueError("bad foo")
+        if cfg.foo == 3:
+            # the job process dies without reporting a result
+            os._exit(3)
+        return os.getpid(), os.getppid()
+
+    hydra_ = Hydra.create_main_hydra_file_or_module(
+        calling_file=None,
+        calling_module="hydra.test_utils.a_module",
+        config_dir="configs",
+        strict=False,
+    )
+    try:
+        returns = hydra_.multirun(
+            config_file="compose.yaml",
+            task_function=task_function,
+            overrides=[
+                "hydra/launcher=fork_server",
+                "hydra.launcher.params.n_jobs=2",
+                "hydra.sweeper.params.max_batch_size=2",
+                f"hydra.sweep.dir={tmpdir}",
+                "foo=1,2,3,4,5",
+            ],
+        )
+    finally:
+        GlobalHydra().clear()
+
+    assert [len(batch) for batch in returns] == [2, 2, 1]
+    results: List[Any] = list(itertools.chain(*returns))
+    assert [r.status for r in results] == [
+        JobStatus.COMPLETED,
+        JobStatus.FAILED,
+        JobStatus.FAILED,
+        JobStatus.COMPLETED,
+        JobStatus.COMPLETED,
+    ]
+    assert "bad foo" in results[1].error
+    assert "exit code 3" in results[2].error
+    completed = [results[i].return_value for i in (0, 3, 4)]
+    # a process per job, all forked from the same template process
+    assert len(set(pid for pid, _ in completed)) == 3
+    assert len(set(ppid for _, ppid in completed)) == 1
+    assert completed[0][1] != os.getpid()
@@ -1,7 +1,9 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+import json
 import os
 import subprocess
 import sys
+import threading
 from pathlib import Path
 from typing import Any, List
 
@@ -9,12 +11,15 @@ import pytest
 from omegaconf import OmegaConf
 
 from hydra import MissingConfigException
+from hydra.core.phase_timer import PhaseTimer
+from hydra.core.singleton import Singleton
 
 # noinspection PyUnresolvedReferences
 from hydra.test_utils.test_utils import (  # noqa: F401
     TSweepRunner,
     TTaskRunner,
     chdir_hydra_root,
+    integration_test,
     sweep_runner,
     task_runner,
     verify_dir_outputs,
@@ -425,3 +430,86 @@ def test_sys_exit(tmpdir: Path) -> None:
         "hydra.run.dir=" + str(tmpdir),
     ]
     assert subprocess.run(cmd).returncode == 42
+
+
+def test_timing(tmpdir: Path) -> None:
+    cmd = [
+        sys.executable,
+        "examples/tutorial/4_defaults/my_app.py",
+        "hydra.run.dir=" + str(tmpdir),
+        "hydra.timing=true",
+    ]
+    subprocess.check_call(cmd)
+    with open(str(Path(str(tmpdir)) / ".hydra" / "timing.json")) as f:
+        timings = json.load(f)["timings"]
+    phases = [t["name"] for t in timings if t["kind"] == "phase"]
+    assert "create_config_search_path" in phases
+    assert "compose_config" in phases
+    configs = [t["name"] for t in timings if t["kind"] == "config"]
+    assert "db/mysql.yaml" in configs
+    assert all(t["wall"] >= 0 and t["cpu"] >= 0 for t in timings)
+
+
+def test_timing_multirun(tmpdir: Path) -> None:
+    cmd = [
+        sys.executable,
+        "examples/tutorial/4_defaults/my_app.py",
+        "-m",
+        "hydra.sweep.dir=" + str(tmpdir),
+        "hydra.timing=true",
+        "db=mysql,postgresql,mysql",
+    ]
+    subprocess.check_call(cmd)
+    timings = []
+    for job in range(3):
+        with open(str(Path(str(tmpdir)) / str(job) / ".hydra" / "timing.json")) as f:
+            timings.append(json.load(f)["timings"])
+    # the jobs do not add the timings of their own composition
+    assert [len(t) for t in timings[1:]] == [len(timings[0])] * 2
+    assert [t["name"] for t in timings[0] if t["kind"] == "config"].count(
+        "db/postgresql.yaml"
+    ) == 0
+
+
+def test_phase_timer() -> None:
+    state = dict(Singleton.get_state())
+    Singleton.get_state().pop(PhaseTimer, None)
+    try:
+        timer = PhaseTimer.instance()
+        with timer.phase("not_started"):
+            pass
+        timer.start()
+
+        def in_thread() -> None:
+            with timer.phase("thread"):
+                pass
+
+        with timer.phase("outer"):
+            with timer.phase("inner"):
+                pass
+            # phases of other threads are not recorded
+            thread = threading.Thread(target=in_thread)
+            thread.start()
+            thread.join()
+        timer.stop()
+        with timer.phase("stopped"):
+            pass
+        assert [(t.name, t.depth) for t in timer.get_timings()] == [
+            ("outer", 0),
+            ("inner", 1),
+        ]
+    finally:
+        Singleton.set_state(state)
+
+
+def test_no_chdir(tmpdir: Path) -> None:
+    output_dir = Path(str(tmpdir)) / "output"
+    integration_test(
+        tmpdir=tmpdir,
+        task_config=OmegaConf.create(),
+        overrides=[f"hydra.run.dir={output_dir}", "hydra.job.chdir=false"],
+        prints="os.getcwd() + ',' + hydra.utils.get_output_dir()",
+        expected_outputs=f"{tmpdir},{output_dir}",
+    )
+    assert (output_dir / "task.log").exists()
+    assert (output_dir / ".hydra" / "config.yaml").exists()
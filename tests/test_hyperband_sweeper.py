@@ -0,0 +1,147 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import pytest
+from omegaconf import DictConfig, OmegaConf
+
+from hydra._internal.core_plugins.hyperband_sweeper import HyperbandSweeper
+from hydra._internal.hydra import Hydra
+from hydra.core.global_hydra import GlobalHydra
+from hydra.test_utils.test_utils import chdir_hydra_root
+
+chdir_hydra_root()
+
+
+def test_brackets() -> None:
+    sweeper = HyperbandSweeper(min_budget=1, max_budget=81, eta=3)
+    assert sweeper.s_max == 4
+    assert [sweeper.get_num_configs(s) for s in range(4, -1, -1)] == [81, 34, 15, 8, 5]
+    assert [sweeper.get_budget(4, rung) for rung in range(5)] == [1, 3, 9, 27, 81]
+    assert [sweeper.get_budget(1, rung) for rung in range(2)] == [27, 81]
+    assert (
+        HyperbandSweeper(min_budget=0.5, max_budget=2.0, eta=2).get_budget(2, 0) == 0.5
+    )
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "params",
+    [
+        {"min_budget": 0},
+        {"min_budget": 10, "max_budget": 5},
+        {"eta": 1},
+        {"mode": "best"},
+        {"max_budget": 9, "num_brackets": 4},
+    ],
+)
+def test_invalid_params(params: Dict[str, Any]) -> None:
+    with pytest.raises(ValueError):
+        HyperbandSweeper(**params)
+
+
+def hyperband_sweep(
+    tmpdir: Path, task_function: Callable[[DictConfig], Any], overrides: List[str]
+) -> Any:
+    hydra_ = Hydra.create_main_hydra_file_or_module(
+        calling_file=None,
+        calling_module="hydra.test_utils.a_module",
+        config_dir="configs",
+        strict=False,
+    )
+    try:
+        return hydra_.multirun(
+            config_file="compose.yaml",
+            task_function=task_function,
+            overrides=[
+                "hydra/sweeper=hyperband",
+                "hydra/job_logging=disabled",
+                f"hydra.sweep.dir={tmpdir}",
+            ]
+            + overrides,
+        )
+    finally:
+        GlobalHydra().clear()
+
+
+def test_successive_halving(tmpdir: Path) -> None:
+    def task_function(cfg: DictConfig) -> Any:
+        return (cfg.x - 7) ** 2 + 10 / cfg.epochs
+
+    returns = hyperband_sweep(
+        tmpdir, task_function, ["hydra.sweeper.params.num_brackets=1", "x=range(20)"]
+    )
+    # the grid only has 20 configurations
+    assert [len(batch) for batch in returns] == [20, 6, 2, 1, 1]
+    for batch, epochs in zip(returns, [1, 3, 9, 27, 81]):
+        assert all(ret.overrides[-1] == f"epochs={epochs}" for ret in batch)
+    # each rung only runs the best configurations of the previous rung
+    assert sorted(int(r.overrides[0][2:]) for r in returns[1]) == [4, 5, 6, 7, 8, 9]
+    assert returns[-1][0].overrides == ["x=7", "epochs=81"]
+    assert [r.hydra_cfg.hydra.job.num for batch in returns for r in batch] == list(
+        range(30)
+    )
+    results = OmegaConf.load(str(Path(str(tmpdir)) / "optimization_results.yaml"))
+    assert results.best_evaluated_params == ["x=7"]
+    assert results.best_evaluated_result == pytest.approx(10 / 81)
+
+
+def test_hyperband(tmpdir: Path) -> None:
+    def task_function(cfg: DictConfig) -> Any:
+        if cfg.x == 3:
+            raise ValueError("bad x")
+        return {"acc": cfg.x * cfg.epochs}
+
+    returns = hyperband_sweep(
+        tmpdir,
+        task_function,
+        [
+            "hydra.sweeper.params.max_budget=9",
+            "hydra.sweeper.params.metric=acc",
+            "hydra.sweeper.params.mode=max",
+            # failed jobs are returned by the launcher
+            "hydra/launcher=thread_pool",
+            "x=0,1,2,3",
+        ],
+    )
+    # brackets of 3 rungs (4 of 9 configurations), 2 rungs (4 of 5) and 1 rung (3)
+    assert [len(batch) for batch in returns] == [4, 1, 1, 4, 1, 3]
+    assert [batch[0].overrides[-1] for batch in returns] == [
+        "epochs=1",
+        "epochs=3",
+        "epochs=9",
+        "epochs=3",
+        "epochs=9",
+        "epochs=9",
+    ]
+    # the failed configuration is never promoted
+    for batch in returns[1:3] + returns[4:5]:
+        assert batch[0].overrides[0] == "x=2"
+    results = OmegaConf.load(str(Path(str(tmpdir)) / "optimization_results.yaml"))
+    assert results.best_evaluated_params == ["x=2"]
+    assert results.best_evaluated_result == 18
+
+
+def test_same_configurations_with_the_same_seed(tmpdir: Path) -> None:
+    def task_function(cfg: DictConfig) -> Any:
+        return cfg.x
+
+    def sampled(seed: int) -> List[List[str]]:
+        returns = hyperband_sweep(
+            tmpdir,
+            task_function,
+            [
+                f"hydra.sweeper.params.seed={seed}",
+                "hydra.sweeper.params.max_budget=3",
+                "hydra.sweeper.params.num_brackets=1",
+                "x=range(1000)",
+            ],
+        )
+        return [ret.overrides for ret in returns[0]]
+
+    assert sampled(1) == sampled(1)
+    assert sampled(1) != sampled(2)
+
+
+def test_budget_key_is_not_swept(tmpdir: Path) -> None:
+    with pytest.raises(ValueError):
+        hyperband_sweep(tmpdir, lambda cfg: 0, ["epochs=1,2"])
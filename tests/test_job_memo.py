@@ -0,0 +1,122 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+import itertools
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+from omegaconf import DictConfig, OmegaConf
+
+from hydra._internal.config_loader_impl import ConfigLoaderImpl
+from hydra._internal.hydra import Hydra
+from hydra.core.global_hydra import GlobalHydra
+from hydra.core.job_memo import JobMemo, config_hash, task_function_id
+from hydra.core.utils import JobStatus, load_job_status, load_return_value
+from hydra.test_utils.test_utils import chdir_hydra_root
+
+chdir_hydra_root()
+
+
+def test_config_hash() -> None:
+    cfg1 = OmegaConf.create({"a": 1, "b": {"c": [1, 2], "d": "${a}"}})
+    cfg2 = OmegaConf.create({"b": {"d": 1, "c": [1, 2]}, "a": 1, "hydra": {"x": 1}})
+    assert config_hash(cfg1) == config_hash(cfg2)
+    cfg3 = OmegaConf.create({"a": 1, "b": {"c": [2, 1], "d": 1}})
+    assert config_hash(cfg1) != config_hash(cfg3)
+    # interpolations to the hydra node are resolved
+    cfg4 = OmegaConf.create({"a": "${hydra.x}", "hydra": {"x": 1}})
+    cfg5 = OmegaConf.create({"a": "${hydra.x}", "hydra": {"x": 2}})
+    assert config_hash(cfg4) != config_hash(cfg5)
+    with pytest.raises(ValueError, match="can't be resolved"):
+        config_hash(OmegaConf.create({"a": "${hydra.x}", "hydra": {"x": "???"}}))
+
+
+def my_task(cfg: DictConfig) -> Any:
+    return None
+
+
+def test_job_memo(tmpdir: Path) -> None:
+    assert task_function_id(my_task).startswith("tests.test_job_memo.my_task-")
+    memo = JobMemo(memo_dir=str(tmpdir), task_function=my_task)
+    assert memo.get("abc") is None
+    memo.put("abc", {"x": 1}, "/some/dir")
+    assert JobMemo(memo_dir=str(tmpdir), task_function=my_task).get("abc") == {
+        "return_value": {"x": 1},
+        "working_dir": "/some/dir",
+    }
+
+
+def test_task_function_id_of_scripts(tmpdir: Path) -> None:
+    # apps run as scripts all define __main__.main
+    ids = []
+    for name in ["train", "eval"]:
+        script = Path(str(tmpdir)) / f"{name}.py"
+        script.write_text("def main(cfg):\n    return 0\n")
+        namespace = {"__name__": "__main__", "__file__": str(script)}
+        exec(compile(script.read_text(), str(script), "exec"), namespace)
+        ids.append(task_function_id(namespace["main"]))
+    assert ids[0].startswith("__main__.main-")
+    assert ids[0] != ids[1]
+
+
+def test_memoized_sweep(tmpdir: Path, monkeypatch: Any) -> None:
+    calls: List[Any] = []
+    compositions: List[Any] = []
+    load_configuration = ConfigLoaderImpl.load_configuration
+
+    def counting_load_configuration(self: Any, *args: Any, **kwargs: Any) -> Any:
+        compositions.append(kwargs.get("overrides"))
+        return load_configuration(self, *args, **kwargs)
+
+    monkeypatch.setattr(
+        ConfigLoaderImpl, "load_configuration", counting_load_configuration
+    )
+
+    def task_function(cfg: DictConfig) -> Any:
+        calls.append(cfg.foo)
+        return cfg.foo * 2
+
+    def multirun(overrides: List[str]) -> Any:
+        hydra_ = Hydra.create_main_hydra_file_or_module(
+            calling_file=None,
+            calling_module="hydra.test_utils.a_module",
+            config_dir="configs",
+            strict=False,
+        )
+        try:
+            return hydra_.multirun(
+                config_file="compose.yaml",
+                task_function=task_function,
+                overrides=overrides
+                + [
+                    "hydra.memo.enabled=true",
+                    f"hydra.memo.dir={tmpdir}/memo",
+                    f"hydra.sweep.dir={tmpdir}/sweep",
+                ],
+            )
+        finally:
+            GlobalHydra().clear()
+
+    # duplicates in a batch run once
+    returns = list(itertools.chain(*multirun(["foo=1,1,2"])))
+    assert calls == [1, 2]
+    assert [r.return_value for r in returns] == [2, 2, 4]
+    assert returns[0].working_dir == returns[1].working_dir
+    # the master config, then each job once: the launcher reuses the configs composed to
+    # find the duplicates
+    assert len(compositions) == 4
+
+    # jobs that already ran in a previous sweep are not run again
+    calls.clear()
+    returns = list(
+        itertools.chain(*multirun(["foo=2,3", "hydra.save_return_value=json"]))
+    )
+    assert calls == [3]
+    assert [r.return_value for r in returns] == [4, 6]
+    assert [r.overrides for r in returns] == [["foo=2"], ["foo=3"]]
+    # the memoized job has its own job dir, found by resumed sweeps and load_sweep_results()
+    job_output = Path(f"{tmpdir}/sweep/0/.hydra")
+    assert list(OmegaConf.load(str(job_output / "overrides.yaml"))) == ["foo=2"]
+    status = load_job_status(job_output)
+    assert status is not None
+    assert status.status == JobStatus.COMPLETED.name and status.return_value == 4
+    assert load_return_value(job_output) == 4
@@ -0,0 +1,130 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+import gzip
+import logging
+import logging.config
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+from omegaconf import DictConfig
+
+from hydra.core.log_queue import GzipRotatingFileHandler, LogQueue, get_log_queue
+from hydra.test_utils.test_utils import chdir_hydra_root, run_multirun
+
+chdir_hydra_root()
+
+
+def task_function(cfg: DictConfig) -> Any:
+    logging.getLogger("my_task").info(f"running foo={cfg.foo}")
+    return cfg.foo
+
+
+def multirun(tmpdir: Path, overrides: List[str]) -> Any:
+    return run_multirun(
+        task_function,
+        ["hydra.log_queue.enabled=true", f"hydra.sweep.dir={tmpdir}", "foo=1,2,3"]
+        + overrides,
+    )
+
+
+def check_job_logs(tmpdir: Path) -> None:
+    for num in range(3):
+        log_file = Path(str(tmpdir)) / str(num) / "a_module.log"
+        assert log_file.read_text().count("running foo=") == 1
+        assert f"[my_task][INFO] - running foo={num + 1}" in log_file.read_text()
+
+
+def test_job_handlers_are_created_once(tmpdir: Path, monkeypatch: Any) -> None:
+    dict_configs: List[Any] = []
+    dict_config = logging.config.dictConfig
+
+    def counting_dict_config(conf: Any) -> None:
+        dict_configs.append(conf)
+        dict_config(conf)
+
+    monkeypatch.setattr(logging.config, "dictConfig", counting_dict_config)
+    returns = multirun(tmpdir, [])
+
+    assert [r.return_value for r in returns[0]] == [1, 2, 3]
+    assert not [conf for conf in dict_configs if "file" in conf["handlers"]]
+    check_job_logs(tmpdir)
+    # the queue is stopped at the end of the sweep
+    assert get_log_queue() is None
+    assert not any(
+        isinstance(h, logging.handlers.QueueHandler)
+        for h in logging.getLogger().handlers
+    )
+
+
+@pytest.mark.parametrize("launcher", ["basic", "process_pool"])  # type: ignore
+def test_sweep_log(tmpdir: Path, launcher: str) -> None:
+    multirun(
+        tmpdir,
+        [f"hydra/launcher={launcher}", "hydra.log_queue.sweep_log=multirun.log",],
+    )
+    check_job_logs(tmpdir)
+    lines = (Path(str(tmpdir)) / "multirun.log").read_text().splitlines()
+    for num in range(3):
+        expected = f"[#{num}][my_task][INFO] - running foo={num + 1}"
+        assert len([line for line in lines if line.endswith(expected)]) == 1
+    # only the records of the jobs
+    assert all("[#" in line for line in lines)
+
+
+def test_log_files_move_in_order(tmpdir: Path) -> None:
+    conf = {
+        "version": 1,
+        "formatters": {"simple": {"format": "%(message)s"}},
+        "handlers": {
+            "file": {
+                "class": "logging.FileHandler",
+                "formatter": "simple",
+                "filename": "job.log",
+            }
+        },
+        "root": {"level": "INFO", "handlers": ["file"]},
+    }
+    root = logging.getLogger()
+    saved_handlers, saved_level = list(root.handlers), root.level
+    log_queue = LogQueue()
+    log_queue.start()
+    try:
+        for job in range(3):
+            output_dir = Path(str(tmpdir)) / str(job)
+            output_dir.mkdir()
+            log_queue.configure(conf, output_dir=str(output_dir), job=job)
+            for i in range(100):
+                logging.getLogger("test").info(f"job {job} line {i}")
+        # a single handler moved to the output dir of each job
+        assert len(log_queue.targets) == 1
+        log_queue.flush()
+    finally:
+        log_queue.stop()
+        root.handlers = saved_handlers
+        root.setLevel(saved_level)
+    for job in range(3):
+        lines = (Path(str(tmpdir)) / str(job) / "job.log").read_text().splitlines()
+        assert lines == [f"job {job} line {i}" for i in range(100)]
+
+
+def test_gzip_rotating_file_handler(tmpdir: Path) -> None:
+    filename = Path(str(tmpdir)) / "job.log"
+    handler = GzipRotatingFileHandler(str(filename), maxBytes=100, backupCount=2)
+    logger = logging.getLogger("test_gzip_rotating_file_handler")
+    logger.propagate = False
+    logger.addHandler(handler)
+    try:
+        for i in range(20):
+            logger.warning(f"line {i:02d} of the log")
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+    assert sorted(p.name for p in Path(str(tmpdir)).iterdir()) == [
+        "job.log",
+        "job.log.1.gz",
+        "job.log.2.gz",
+    ]
+    with gzip.open(str(filename) + ".1.gz", "rt") as f:
+        rotated = f.read()
+    assert rotated.startswith("line ")
+    assert "line 19" in filename.read_text()
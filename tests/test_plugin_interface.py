@@ -1,4 +1,6 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+import sys
+from pathlib import Path
 from typing import List, Type
 
 import pytest
@@ -12,8 +14,20 @@ from hydra.utils import get_class
 
 # This only test core plugins.
 # Individual plugins are responsible to test that they are discoverable.
-launchers = ["hydra._internal.core_plugins.basic_launcher.BasicLauncher"]
-sweepers = ["hydra._internal.core_plugins.basic_sweeper.BasicSweeper"]
+launchers = [
+    "hydra._internal.core_plugins.basic_launcher.BasicLauncher",
+    "hydra._internal.core_plugins.process_pool_launcher.ProcessPoolLauncher",
+    "hydra._internal.core_plugins.fork_server_launcher.ForkServerLauncher",
+    "hydra._internal.core_plugins.resource_launcher.ResourceLauncher",
+    "hydra._internal.core_plugins.thread_pool_launcher.ThreadPoolLauncher",
+    "hydra._internal.core_plugins.asyncio_launcher.AsyncioLauncher",
+    "hydra._internal.core_plugins.work_queue_launcher.WorkQueueLauncher",
+]
+sweepers = [
+    "hydra._internal.core_plugins.basic_sweeper.BasicSweeper",
+    "hydra._internal.core_plugins.hyperband_sweeper.HyperbandSweeper",
+    "hydra._internal.core_plugins.tpe_sweeper.TPESweeper",
+]
 search_path_plugins: List[str] = []
 
 
@@ -31,3 +45,57 @@ def test_discover(plugin_type: Type[Plugin], expected: List[str]) -> None:
     expected_classes = [get_class(c) for c in sorted(expected)]
     for ex in expected_classes:
         assert ex in plugins
+
+
+def test_discover_core_plugins_lazily() -> None:
+    descriptors = Plugins.descriptors(Launcher)
+    assert "hydra._internal.core_plugins.basic_launcher.BasicLauncher" in [
+        d.class_name for d in descriptors
+    ]
+    assert all(issubclass(d.load(), Launcher) for d in descriptors)
+
+
+def test_discover_from_manifest(tmpdir: Path) -> None:
+    plugins_dir = Path(str(tmpdir)) / "hydra_plugins"
+    with_manifest = plugins_dir / "with_manifest_plugin"
+    with_manifest.mkdir(parents=True)
+    (with_manifest / "__init__.py").write_text("")
+    (with_manifest / "launcher.py").write_text(
+        "from hydra._internal.core_plugins.basic_launcher import BasicLauncher\n"
+        "class ManifestLauncher(BasicLauncher):\n"
+        "    pass\n"
+    )
+    (with_manifest / "plugins.yaml").write_text(
+        "plugins:\n"
+        "  - class: hydra_plugins.with_manifest_plugin.launcher.ManifestLauncher\n"
+        "    type: launcher\n"
+    )
+    without_manifest = plugins_dir / "without_manifest_plugin"
+    without_manifest.mkdir()
+    (without_manifest / "__init__.py").write_text(
+        "from hydra.plugins.search_path_plugin import SearchPathPlugin\n"
+        "class WalkedSearchPathPlugin(SearchPathPlugin):\n"
+        "    def manipulate_search_path(self, search_path):\n"
+        "        pass\n"
+    )
+
+    sys.path.insert(0, str(tmpdir))
+    Plugins.invalidate()
+    try:
+        names = [d.name for d in Plugins.descriptors()]
+        assert "ManifestLauncher" in names
+        assert "WalkedSearchPathPlugin" in names
+        # packages with a manifest are not imported until the plugin is needed
+        assert "hydra_plugins.with_manifest_plugin" not in sys.modules
+        assert "hydra_plugins.without_manifest_plugin" in sys.modules
+
+        assert "ManifestLauncher" not in [c.__name__ for c in Plugins.discover(Sweeper)]
+        assert "hydra_plugins.with_manifest_plugin" not in sys.modules
+        launchers = Plugins.discover(Launcher)
+        assert "ManifestLauncher" in [c.__name__ for c in launchers]
+    finally:
+        sys.path.remove(str(tmpdir))
+        for name in list(sys.modules.keys()):
+            if name == "hydra_plugins" or name.startswith("hydra_plugins."):
+                del sys.modules[name]
+        Plugins.invalidate()
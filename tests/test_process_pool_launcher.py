@@ -0,0 +1,164 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+import os
+import sys
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+from omegaconf import DictConfig
+
+from hydra._internal.hydra import Hydra
+from hydra.core.global_hydra import GlobalHydra
+from hydra.core.utils import JobStatus
+from hydra.test_utils.launcher_common_tests import (
+    IntegrationTestSuite,
+    LauncherTestSuite,
+)
+
+# noinspection PyUnresolvedReferences
+from hydra.test_utils.test_utils import chdir_hydra_root, sweep_runner  # noqa: F401
+
+chdir_hydra_root()
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "launcher_name, overrides",
+    [
+        ("process_pool", []),
+        ("process_pool", ["hydra.launcher.params.n_jobs=1"]),
+        ("process_pool", ["hydra.launcher.jobs_per_task=2"]),
+    ],
+)
+class TestProcessPoolLauncher(LauncherTestSuite):
+    pass
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "task_launcher_cfg, extra_flags, plugin_module",
+    [
+        (
+            {
+                "defaults": [
+                    {"hydra/launcher": "process_pool"},
+                    {"hydra/hydra_logging": "hydra_debug"},
+                    {"hydra/job_logging": "disabled"},
+                ]
+            },
+            ["-m"],
+            "hydra._internal.core_plugins.process_pool_launcher",
+        )
+    ],
+)
+class TestProcessPoolLauncherIntegration(IntegrationTestSuite):
+    """
+    Run this launcher through the integration test suite.
+    """
+
+    pass
+
+
+def test_jobs_run_in_workers_and_failures_are_per_job(tmpdir: Path) -> None:
+    def task_function(cfg: DictConfig) -> Any:
+        if cfg.foo == 2:
+            raise ValueError("bad foo")
+        return os.getpid(), cfg.foo
+
+    hydra_ = Hydra.create_main_hydra_file_or_module(
+        calling_file=None,
+        calling_module="hydra.test_utils.a_module",
+        config_dir="configs",
+        strict=False,
+    )
+    try:
+        returns = hydra_.multirun(
+            config_file="compose.yaml",
+            task_function=task_function,
+            overrides=[
+                "hydra/launcher=process_pool",
+                "hydra.launcher.params.n_jobs=2",
+                "hydra.launcher.jobs_per_task=2",
+                f"hydra.sweep.dir={tmpdir}",
+                "foo=1,2,3",
+            ],
+        )
+    finally:
+        GlobalHydra().clear()
+
+    results: List[Any] = returns[0]
+    assert [r.status for r in results] == [
+        JobStatus.COMPLETED,
+        JobStatus.FAILED,
+        JobStatus.COMPLETED,
+    ]
+    assert [r.overrides for r in results] == [["foo=1"], ["foo=2"], ["foo=3"]]
+    assert "bad foo" in results[1].error
+    assert results[0].return_value[1] == 1 and results[2].return_value[1] == 3
+    assert results[0].return_value[0] != os.getpid()
+    assert [r.hydra_cfg.hydra.job.num for r in (results[0], results[2])] == [0, 2]
+
+
+def test_job_calling_sys_exit_fails_without_killing_the_worker(tmpdir: Path) -> None:
+    def task_function(cfg: DictConfig) -> Any:
+        if cfg.foo == 1:
+            sys.exit(3)
+        return cfg.foo
+
+    hydra_ = Hydra.create_main_hydra_file_or_module(
+        calling_file=None,
+        calling_module="hydra.test_utils.a_module",
+        config_dir="configs",
+        strict=False,
+    )
+    try:
+        returns = hydra_.multirun(
+            config_file="compose.yaml",
+            task_function=task_function,
+            overrides=[
+                "hydra/launcher=process_pool",
+                "hydra.launcher.params.n_jobs=1",
+                "hydra.launcher.jobs_per_task=2",
+                f"hydra.sweep.dir={tmpdir}",
+                "foo=1,2",
+            ],
+        )
+    finally:
+        GlobalHydra().clear()
+
+    results: List[Any] = returns[0]
+    # the next job of the pack still runs in the same worker
+    assert [r.status for r in results] == [JobStatus.FAILED, JobStatus.COMPLETED]
+    assert "SystemExit" in results[0].error
+    assert results[1].return_value == 2
+
+
+def test_job_killing_its_worker_fails_without_hanging(tmpdir: Path) -> None:
+    def task_function(cfg: DictConfig) -> Any:
+        if cfg.foo == 1:
+            os._exit(1)
+        return cfg.foo
+
+    hydra_ = Hydra.create_main_hydra_file_or_module(
+        calling_file=None,
+        calling_module="hydra.test_utils.a_module",
+        config_dir="configs",
+        strict=False,
+    )
+    try:
+        returns = hydra_.multirun(
+            config_file="compose.yaml",
+            task_function=task_function,
+            overrides=[
+                "hydra/launcher=process_pool",
+                "hydra.launcher.params.n_jobs=1",
+                f"hydra.sweep.dir={tmpdir}",
+                "foo=1,2",
+            ],
+        )
+    finally:
+        GlobalHydra().clear()
+
+    results: List[Any] = returns[0]
+    # the pool is broken, the jobs that did not complete are failed
+    assert [r.status for r in results] == [JobStatus.FAILED, JobStatus.FAILED]
+    assert [r.overrides for r in results] == [["foo=1"], ["foo=2"]]
+    assert "worker process died" in results[0].error
@@ -0,0 +1,165 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+import itertools
+import math
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+from omegaconf import DictConfig, OmegaConf
+
+from hydra._internal.core_plugins.basic_sweeper import BasicSweeper, SweepGrid
+from hydra._internal.reducers import BestK, RunningStats
+from hydra.core.utils import JobReturn, JobStatus
+from hydra.plugins.reducer import instantiate_reducer, job_metric
+from hydra.test_utils.test_utils import chdir_hydra_root, run_multirun
+
+chdir_hydra_root()
+
+
+def job_return(value: Any, status: JobStatus = JobStatus.COMPLETED) -> JobReturn:
+    ret = JobReturn()
+    ret.status = status
+    ret.return_value = value
+    return ret
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "return_value, metric, expected",
+    [
+        (1, None, 1.0),
+        (0.5, None, 0.5),
+        ("abc", None, None),
+        (True, None, None),
+        (float("nan"), None, None),
+        ({"loss": 2.0}, "loss", 2.0),
+        (OmegaConf.create({"loss": 2.0}), "loss", 2.0),
+        ({"acc": 2.0}, "loss", None),
+    ],
+)
+def test_job_metric(return_value: Any, metric: Any, expected: Any) -> None:
+    ret = JobReturn()
+    ret.status = JobStatus.COMPLETED
+    ret.return_value = return_value
+    assert job_metric(ret, metric) == expected
+    ret.status = JobStatus.FAILED
+    assert job_metric(ret, metric) is None
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "k, mode, expected",
+    [(1, "min", [1]), (3, "min", [1, 2, 3]), (2, "max", [5, 4]), (10, "min", None)],
+)
+def test_best_k(k: int, mode: str, expected: Any) -> None:
+    values = [3, 5, 1, float("nan"), 4, 2]
+    reducer = BestK(k=k, mode=mode)
+    for value in values:
+        reducer.add(job_return(value))
+    reducer.add(job_return(None, JobStatus.FAILED))
+    if expected is None:
+        expected = sorted(v for v in values if not math.isnan(v))
+    assert [r.return_value for r in reducer.result()] == expected
+
+
+def test_best_k_ties() -> None:
+    reducer = BestK(k=2, metric="loss")
+    for name in ["a", "b", "c"]:
+        reducer.add(job_return({"loss": 1, "name": name}))
+    assert [r.return_value["name"] for r in reducer.result()] == ["a", "b"]
+
+
+def test_running_stats() -> None:
+    reducer = RunningStats(metric="loss")
+    for value in [2.0, 4.0, 4.0, 4.0, 5.0, 5.0, 7.0, 9.0]:
+        reducer.add(job_return({"loss": value}))
+    reducer.add(job_return(None, JobStatus.FAILED))
+    result = reducer.result()
+    assert result["count"] == 8
+    assert result["failed"] == 1
+    assert result["mean"] == pytest.approx(5.0)
+    assert result["std"] == pytest.approx(math.sqrt(32 / 7))
+    assert (result["min"], result["max"]) == (2.0, 9.0)
+    assert RunningStats().result()["mean"] is None
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "reducer_cfg, expected",
+    [
+        (None, None),
+        ("hydra._internal.reducers.RunningStats", RunningStats),
+        ({"class": "hydra._internal.reducers.BestK", "params": {"k": 3}}, BestK,),
+    ],
+)
+def test_instantiate_reducer(reducer_cfg: Any, expected: Any) -> None:
+    config = OmegaConf.create({"hydra": {"sweeper": {"reducer": reducer_cfg}}})
+    reducer = instantiate_reducer(config)
+    if expected is None:
+        assert reducer is None
+    else:
+        assert isinstance(reducer, expected)
+
+
+def test_instantiate_reducer_type_error() -> None:
+    config = OmegaConf.create(
+        {"hydra": {"sweeper": {"reducer": "hydra.core.utils.JobReturn"}}}
+    )
+    with pytest.raises(TypeError):
+        instantiate_reducer(config)
+
+
+def test_sweep_with_reducer(tmpdir: Path) -> None:
+    def task_function(cfg: DictConfig) -> Any:
+        return cfg.foo
+
+    result = run_multirun(
+        task_function,
+        [
+            "foo=range(10)",
+            "hydra.sweeper.params.max_batch_size=3",
+            "hydra.sweeper.reducer=hydra._internal.reducers.RunningStats",
+            f"hydra.sweep.dir={tmpdir}",
+        ],
+    )
+    assert result["count"] == 10
+    assert result["mean"] == pytest.approx(4.5)
+    assert (result["min"], result["max"]) == (0, 9)
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "max_batch_size, reducer, expected",
+    [
+        (None, None, [250]),
+        (None, RunningStats(), [100, 100, 50]),
+        (200, RunningStats(), [200, 50]),
+    ],
+)
+def test_batch_size_with_reducer(
+    max_batch_size: Any, reducer: Any, expected: List[int]
+) -> None:
+    sweeper = BasicSweeper(max_batch_size=max_batch_size)
+    sweeper.reducer = reducer
+    sweeper.grid = SweepGrid(["foo=range(250)"])
+    sweeper.end_job_idx = len(sweeper.grid)
+    sizes = []
+    while sweeper.next_job_idx < sweeper.end_job_idx:
+        sizes.append(len(sweeper.get_job_batch()))
+    assert sizes == expected
+
+
+@pytest.mark.parametrize("return_configs", [True, False])  # type: ignore
+def test_return_configs(tmpdir: Path, return_configs: bool) -> None:
+    overrides = [
+        "foo=1,2",
+        f"hydra.return_configs={str(return_configs).lower()}",
+        f"hydra.sweep.dir={tmpdir}",
+    ]
+    returns = run_multirun(lambda cfg: cfg.foo, overrides)
+    # resumed jobs are loaded from their output dir
+    returns += run_multirun(
+        lambda cfg: cfg.foo, overrides + ["hydra.sweeper.params.resume=true"]
+    )
+    results = list(itertools.chain(*returns))
+    assert [r.return_value for r in results] == [1, 2, 1, 2]
+    for r in results:
+        assert (r.cfg is not None) == return_configs
+        assert (r.hydra_cfg is not None) == return_configs
+        assert r.working_dir is not None
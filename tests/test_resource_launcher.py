@@ -0,0 +1,167 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+import os
+from pathlib import Path
+from typing import Any, List
+from unittest import mock
+
+import pytest
+from omegaconf import DictConfig, OmegaConf
+
+from hydra._internal.core_plugins import resource_launcher
+from hydra._internal.core_plugins.resource_launcher import (
+    LOAD_AVERAGE_PERIOD,
+    ResourceLauncher,
+    ResourcePool,
+    available_cpus,
+    get_job_resources,
+)
+from hydra._internal.hydra import Hydra
+from hydra.core.global_hydra import GlobalHydra
+from hydra.core.utils import JobStatus
+from hydra.test_utils.launcher_common_tests import (
+    IntegrationTestSuite,
+    LauncherTestSuite,
+)
+
+# noinspection PyUnresolvedReferences
+from hydra.test_utils.test_utils import chdir_hydra_root, sweep_runner  # noqa: F401
+
+chdir_hydra_root()
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "launcher_name, overrides",
+    [("resources", []), ("resources", ["hydra.launcher.params.pin_cpus=false"]),],
+)
+class TestResourceLauncher(LauncherTestSuite):
+    pass
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "task_launcher_cfg, extra_flags, plugin_module",
+    [
+        (
+            {
+                "defaults": [
+                    {"hydra/launcher": "resources"},
+                    {"hydra/hydra_logging": "hydra_debug"},
+                    {"hydra/job_logging": "disabled"},
+                ]
+            },
+            ["-m"],
+            "hydra._internal.core_plugins.resource_launcher",
+        )
+    ],
+)
+class TestResourceLauncherIntegration(IntegrationTestSuite):
+    """
+    Run this launcher through the integration test suite.
+    """
+
+    pass
+
+
+def test_resource_pool() -> None:
+    pool = ResourcePool(cpus=[0, 1, 2, 3], mem_gb=8)
+    assert pool.allocate(1, 2) == [0]
+    assert pool.allocate(2, None) == [1, 2]
+    assert pool.used_cpus == 3
+    assert not pool.fits(2, None)
+    assert pool.fits(1, 6)
+    assert not pool.fits(1, 7)
+    # the last free CPU is busy with another process
+    assert not pool.fits(1, None, reserved_cpus=1)
+    pool.release([0], 2)
+    assert pool.free_cpus == [0, 3]
+    assert pool.free_mem_gb == 8
+    assert pool.can_ever_fit(4, 8)
+    assert not pool.can_ever_fit(5, None)
+    assert not pool.can_ever_fit(1, 9)
+
+
+def test_external_load_excludes_completed_jobs() -> None:
+    launcher = ResourceLauncher()
+    pool = ResourcePool(cpus=list(range(8)), mem_gb=None)
+    now = [1000.0]
+    with mock.patch.object(
+        resource_launcher.time, "monotonic", lambda: now[0]
+    ), mock.patch.object(resource_launcher, "load_average") as load_average:
+        # 2 CPUs busy with other processes before the sweep
+        load_average.return_value = 2.5
+        assert launcher._external_load(pool) == 2
+
+        # 4 jobs ran for a long time
+        allocated = pool.allocate(4, None)
+        launcher._update_own_load(pool.used_cpus)
+        load_average.return_value = 6.5
+        now[0] += 10 * LOAD_AVERAGE_PERIOD
+        assert launcher._external_load(pool) == 2
+
+        # the jobs just completed, the load average still counts them
+        pool.release(allocated, None)
+        launcher._update_own_load(pool.used_cpus)
+        now[0] += 1.0
+        assert launcher._external_load(pool) == 2
+
+        # after a while the load average has caught up
+        load_average.return_value = 2.5
+        now[0] += 10 * LOAD_AVERAGE_PERIOD
+        assert launcher._external_load(pool) == 2
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "resources, expected",
+    [
+        ({}, (1, None)),
+        ({"cpus": 4}, (4, None)),
+        ({"cpus": 2, "mem_gb": 1.5}, (2, 1.5)),
+    ],
+)
+def test_get_job_resources(resources: Any, expected: Any) -> None:
+    cfg = OmegaConf.create({"hydra": {"job": {"resources": resources}}})
+    assert isinstance(cfg, DictConfig)
+    assert get_job_resources(cfg) == expected
+
+
+def test_jobs_are_pinned_and_oversized_jobs_fail(tmpdir: Path) -> None:
+    num_cpus = len(available_cpus())
+
+    def task_function(cfg: DictConfig) -> Any:
+        if hasattr(os, "sched_getaffinity"):
+            return sorted(os.sched_getaffinity(0))
+        return None
+
+    hydra_ = Hydra.create_main_hydra_file_or_module(
+        calling_file=None,
+        calling_module="hydra.test_utils.a_module",
+        config_dir="configs",
+        strict=False,
+    )
+    try:
+        returns = hydra_.multirun(
+            config_file="compose.yaml",
+            task_function=task_function,
+            overrides=[
+                "hydra/launcher=resources",
+                "hydra.launcher.params.respect_load=false",
+                f"hydra.sweep.dir={tmpdir}",
+                "hydra.job.resources.cpus=${cpus}",
+                f"cpus=1,{num_cpus + 1}",
+                "foo=1,2",
+            ],
+        )
+    finally:
+        GlobalHydra().clear()
+
+    results: List[Any] = returns[0]
+    assert [r.status for r in results] == [
+        JobStatus.COMPLETED,
+        JobStatus.COMPLETED,
+        JobStatus.FAILED,
+        JobStatus.FAILED,
+    ]
+    assert "more than the capacity" in results[2].error
+    if hasattr(os, "sched_getaffinity"):
+        for ret in results[:2]:
+            assert len(ret.return_value) == 1
+            assert ret.return_value[0] in available_cpus()
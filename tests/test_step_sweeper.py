@@ -0,0 +1,143 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+import threading
+from pathlib import Path
+from typing import Any, List, Optional, Sequence
+
+import pytest
+from omegaconf import DictConfig
+
+from hydra.core.config_loader import ConfigLoader
+from hydra.core.hydra_config import HydraConfig
+from hydra.core.utils import JobReturn, JobStatus
+from hydra.plugins.launcher import Launcher
+from hydra.plugins.step_sweeper import AsyncStepSweeper
+from hydra.test_utils.test_utils import chdir_hydra_root, hydra_app
+from hydra.types import TaskFunction
+
+chdir_hydra_root()
+
+
+class ListLauncher(Launcher):
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+
+    def setup(
+        self,
+        config: DictConfig,
+        config_loader: ConfigLoader,
+        task_function: TaskFunction,
+    ) -> None:
+        pass
+
+    def launch(
+        self, job_overrides: Sequence[Sequence[str]], initial_job_idx: int
+    ) -> Sequence[JobReturn]:
+        if self.fail:
+            raise ValueError("launch failed")
+        runs = []
+        for idx, overrides in enumerate(job_overrides):
+            ret = JobReturn()
+            ret.overrides = list(overrides)
+            ret.return_value = initial_job_idx + idx
+            runs.append(ret)
+        return runs
+
+
+def test_default_launch_async() -> None:
+    launcher = ListLauncher()
+    futures = launcher.launch_async([["a=1"], ["a=2"]], initial_job_idx=3)
+    assert [f.result(timeout=10).return_value for f in futures] == [3, 4]
+    assert [f.result().overrides for f in futures] == [["a=1"], ["a=2"]]
+    executor = launcher._launch_executor
+    assert executor is not None
+    launcher.close()
+    assert launcher._launch_executor is None
+    with pytest.raises(RuntimeError):
+        executor.submit(print)
+
+    futures = ListLauncher(fail=True).launch_async([["a=1"], ["a=2"]], 0)
+    for future in futures:
+        with pytest.raises(ValueError, match="launch failed"):
+            future.result(timeout=10)
+
+
+class OneJobAtATimeSweeper(AsyncStepSweeper):
+    def __init__(self, num_jobs: int, max_in_flight: Optional[int]) -> None:
+        super().__init__(max_in_flight=max_in_flight)
+        self.num_jobs = num_jobs
+        self.max_num_in_flight = 0
+        self.completed: List[int] = []
+        self.updates = 0
+        self.straggler_released = threading.Event()
+
+    def get_job_batch(self) -> Sequence[Sequence[str]]:
+        return [[f"num={self.launched_jobs}"]]
+
+    def is_done(self) -> bool:
+        self.max_num_in_flight = max(self.max_num_in_flight, self.num_in_flight)
+        return self.launched_jobs >= self.num_jobs
+
+    def update_results(self, job_results: Sequence[JobReturn]) -> None:
+        self.updates += 1
+        for ret in job_results:
+            assert ret.status == JobStatus.COMPLETED
+            self.completed.append(ret.return_value)
+        if len(self.completed) >= 3:
+            self.straggler_released.set()
+
+
+def run_sweeper(
+    tmpdir: Path, sweeper: AsyncStepSweeper, task_function: TaskFunction, launcher: str
+) -> Any:
+    with hydra_app(strict=False) as hydra_:
+        cfg = hydra_.compose_config(
+            config_file="compose.yaml",
+            overrides=[
+                f"hydra/launcher={launcher}",
+                "hydra/job_logging=disabled",
+                f"hydra.sweep.dir={tmpdir}",
+            ],
+            strict=False,
+            with_log_configuration=True,
+        )
+        HydraConfig.instance().set_config(cfg)
+        sweeper.setup(
+            config=cfg, config_loader=hydra_.config_loader, task_function=task_function
+        )
+        return sweeper.sweep(arguments=[])
+
+
+@pytest.mark.parametrize("launcher", ["basic", "thread_pool"])  # type: ignore
+def test_async_step_sweeper(tmpdir: Path, launcher: str) -> None:
+    def task_function(cfg: DictConfig) -> Any:
+        return cfg.num
+
+    sweeper = OneJobAtATimeSweeper(num_jobs=4, max_in_flight=2)
+    returns = run_sweeper(tmpdir, sweeper, task_function, launcher)
+    assert sorted(sweeper.completed) == [0, 1, 2, 3]
+    assert [r.return_value for results in returns for r in results] == sweeper.completed
+    assert sweeper.max_num_in_flight == 2
+    # the threads of the launcher are stopped at the end of the sweep
+    assert sweeper.launcher is not None
+    assert sweeper.launcher._launch_executor is None
+    assert getattr(sweeper.launcher, "executor", None) is None
+
+
+def test_async_step_sweeper_does_not_wait_for_stragglers(tmpdir: Path) -> None:
+    sweeper = OneJobAtATimeSweeper(num_jobs=5, max_in_flight=2)
+
+    def task_function(cfg: DictConfig) -> Any:
+        if cfg.num == 0:
+            # completes only once the sweeper received the results of 3 other jobs
+            assert sweeper.straggler_released.wait(timeout=30)
+        return cfg.num
+
+    run_sweeper(tmpdir, sweeper, task_function, "thread_pool")
+    assert sweeper.completed[:3] == [1, 2, 3]
+    assert sorted(sweeper.completed) == [0, 1, 2, 3, 4]
+    assert sweeper.updates >= 4
+
+
+def test_async_step_sweeper_max_in_flight() -> None:
+    with pytest.raises(ValueError):
+        OneJobAtATimeSweeper(num_jobs=1, max_in_flight=0)
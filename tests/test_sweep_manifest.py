@@ -0,0 +1,118 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+from omegaconf import DictConfig
+
+from hydra.core.sweep_manifest import (
+    MANIFEST_FILE,
+    append_manifest_records,
+    summarize_return_value,
+)
+from hydra.test_utils.test_utils import chdir_hydra_root, run_multirun
+from hydra.utils import load_sweep_manifest
+
+chdir_hydra_root()
+
+
+def test_manifest(tmpdir: Path) -> None:
+    def task_function(cfg: DictConfig) -> Any:
+        if cfg.foo == 2:
+            raise RuntimeError("failed")
+        return {"loss": cfg.foo / 10, "model": "resnet", "weights": [1, 2]}
+
+    run_multirun(
+        task_function,
+        [
+            "foo=range(4)",
+            "hydra/launcher=thread_pool",
+            "hydra.launcher.params.n_jobs=1",
+            f"hydra.sweep.dir={tmpdir}",
+            "hydra.manifest.enabled=true",
+        ],
+    )
+    jobs = load_sweep_manifest(tmpdir)
+    assert [job["num"] for job in jobs] == [0, 1, 2, 3]
+    assert [job["overrides"] for job in jobs] == [[f"foo={i}"] for i in range(4)]
+    assert [job["status"] for job in jobs] == [
+        "COMPLETED",
+        "COMPLETED",
+        "FAILED",
+        "COMPLETED",
+    ]
+    assert [job["working_dir"] for job in jobs] == [
+        os.path.join(str(tmpdir), str(i)) for i in range(4)
+    ]
+    # recorded relative to the sweep dir
+    with open(os.path.join(str(tmpdir), MANIFEST_FILE)) as f:
+        records = [json.loads(line) for line in f]
+    assert {r["working_dir"] for r in records if "working_dir" in r} == {
+        str(i) for i in range(4)
+    }
+    assert jobs[1]["return_value"] == {"loss": 0.1, "model": "resnet"}
+    assert "RuntimeError: failed" in jobs[2]["error"]
+    for job in jobs:
+        assert len(job["config_hash"]) > 0
+        assert job["submit_time"] <= job["start_time"] <= job["end_time"]
+
+    assert [job["num"] for job in load_sweep_manifest(tmpdir, "FAILED")] == [2]
+
+
+def test_manifest_relative_sweep_dir(tmpdir: Path, monkeypatch: Any) -> None:
+    # the jobs change their working dir to their output dir
+    monkeypatch.chdir(str(tmpdir))
+    run_multirun(
+        lambda cfg: cfg.foo,
+        ["foo=1,2", "hydra.sweep.dir=multirun/sweep", "hydra.manifest.enabled=true"],
+    )
+    sweep_dir = Path(str(tmpdir)) / "multirun" / "sweep"
+    jobs = load_sweep_manifest(sweep_dir)
+    assert [job["status"] for job in jobs] == ["COMPLETED", "COMPLETED"]
+    assert [job["return_value"] for job in jobs] == [1, 2]
+    assert [job["working_dir"] for job in jobs] == [
+        str(sweep_dir / "0"),
+        str(sweep_dir / "1"),
+    ]
+    assert list(sweep_dir.glob(f"**/{MANIFEST_FILE}")) == [sweep_dir / MANIFEST_FILE]
+
+
+def test_manifest_disabled_by_default(tmpdir: Path) -> None:
+    run_multirun(lambda cfg: 0, ["foo=1,2", f"hydra.sweep.dir={tmpdir}"])
+    assert not (Path(str(tmpdir)) / MANIFEST_FILE).exists()
+
+
+def test_manifest_merges_records(tmpdir: Path) -> None:
+    append_manifest_records(
+        tmpdir,
+        [
+            {"num": 1, "overrides": ["a=1"], "status": "SUBMITTED"},
+            {"num": 0, "overrides": ["a=0"], "status": "SUBMITTED"},
+            {"num": 1, "status": "COMPLETED", "return_value": 1},
+        ],
+    )
+    with open(str(Path(str(tmpdir)) / MANIFEST_FILE), "a") as f:
+        # truncated record of a killed sweep
+        f.write('{"num": 0, "sta')
+    assert load_sweep_manifest(tmpdir) == [
+        {"num": 0, "overrides": ["a=0"], "status": "SUBMITTED"},
+        {"num": 1, "overrides": ["a=1"], "status": "COMPLETED", "return_value": 1},
+    ]
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "value, expected",
+    [
+        (1, 1),
+        ("abc", "abc"),
+        (None, None),
+        (float("nan"), "nan"),
+        ([1, 2], None),
+        ({"a": 1, "b": [1], "c": {"d": 1}}, {"a": 1}),
+        (DictConfig({"a": 0.5}), {"a": 0.5}),
+    ],
+)
+def test_summarize_return_value(value: Any, expected: Any) -> None:
+    assert summarize_return_value(value) == expected
@@ -0,0 +1,152 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+import os
+import shutil
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+import pytest
+from omegaconf import DictConfig
+
+from hydra.core import sweep_results
+from hydra.core.sweep_manifest import append_manifest_records
+from hydra.core.utils import RETURN_VALUE_FILES, load_job_return, load_return_value
+from hydra.test_utils.test_utils import chdir_hydra_root, run_multirun
+from hydra.utils import load_sweep_results
+
+chdir_hydra_root()
+
+
+class Point:
+    def __init__(self, x: int) -> None:
+        self.x = x
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "fmt, value, expected_file",
+    [
+        ("json", {"loss": 0.5, "history": [1, 2]}, "json"),
+        ("json", 3, "json"),
+        ("json", None, "json"),
+        ("json", Point(1), "pickle"),
+        ("pickle", {"loss": 0.5}, "pickle"),
+    ],
+)
+def test_save_return_value(
+    tmpdir: Path, fmt: str, value: Any, expected_file: str
+) -> None:
+    run_multirun(
+        lambda cfg: value,
+        ["foo=1", f"hydra.save_return_value={fmt}", f"hydra.sweep.dir={tmpdir}"],
+    )
+    hydra_output = Path(str(tmpdir)) / "0" / ".hydra"
+    assert os.listdir(str(hydra_output)).count(RETURN_VALUE_FILES[expected_file]) == 1
+    loaded = load_return_value(hydra_output)
+    if isinstance(value, Point):
+        assert loaded.x == value.x
+    else:
+        assert loaded == value
+    job_return = load_job_return(Path(str(tmpdir)) / "0", ".hydra")
+    assert job_return is not None
+    assert type(job_return.return_value) is type(loaded)
+
+
+def test_return_value_not_saved_by_default(tmpdir: Path) -> None:
+    run_multirun(lambda cfg: 1, ["foo=1", f"hydra.sweep.dir={tmpdir}"])
+    with pytest.raises(FileNotFoundError):
+        load_return_value(Path(str(tmpdir)) / "0" / ".hydra")
+
+
+@pytest.mark.parametrize("manifest", [True, False])  # type: ignore
+def test_load_sweep_results(tmpdir: Path, manifest: bool) -> None:
+    def task_function(cfg: DictConfig) -> Any:
+        if cfg.foo == 2:
+            raise RuntimeError("failed")
+        if cfg.foo == 3:
+            return cfg.foo * 10
+        return {"loss": cfg.foo / 10, "model": f"m{cfg.foo}"}
+
+    run_multirun(
+        task_function,
+        [
+            "foo=range(4)",
+            "hydra/output=sharded",
+            "hydra/launcher=thread_pool",
+            "hydra.save_return_value=json",
+            f"hydra.manifest.enabled={str(manifest).lower()}",
+            f"hydra.sweep.dir={tmpdir}",
+        ],
+    )
+    results = load_sweep_results(tmpdir, max_workers=2)
+    assert list(results.keys()) == [
+        "working_dir",
+        "foo",
+        "return_value.loss",
+        "return_value.model",
+        "return_value",
+    ]
+    assert results["working_dir"] == [
+        os.path.join(str(tmpdir), "000", f"00000{i}") for i in [0, 1, 3]
+    ]
+    assert results["foo"] == ["0", "1", "3"]
+    assert results["return_value.loss"] == [0.0, 0.1, None]
+    assert results["return_value.model"] == ["m0", "m1", None]
+    assert results["return_value"] == [None, None, 30]
+
+
+@pytest.mark.parametrize("manifest", [True, False])  # type: ignore
+def test_load_sweep_results_of_moved_sweep_dir(tmpdir: Path, manifest: bool) -> None:
+    sweep_dir = Path(str(tmpdir)) / "sweep"
+    run_multirun(
+        lambda cfg: cfg.foo,
+        [
+            "foo=1,2",
+            "hydra.save_return_value=json",
+            f"hydra.manifest.enabled={str(manifest).lower()}",
+            f"hydra.sweep.dir={sweep_dir}",
+        ],
+    )
+    moved = Path(str(tmpdir)) / "moved"
+    shutil.move(str(sweep_dir), str(moved))
+    results = load_sweep_results(moved)
+    assert results["working_dir"] == [str(moved / "0"), str(moved / "1")]
+    assert results["return_value"] == [1, 2]
+
+
+def test_load_sweep_results_with_stale_manifest(tmpdir: Path) -> None:
+    run_multirun(
+        lambda cfg: cfg.foo,
+        [
+            "foo=1,2",
+            "hydra.save_return_value=json",
+            "hydra.manifest.enabled=true",
+            f"hydra.sweep.dir={tmpdir}",
+        ],
+    )
+    # e.g. written by an older version, with absolute paths of another location
+    append_manifest_records(tmpdir, [{"num": 0, "working_dir": "/not/a/sweep/0"}])
+    with mock.patch.object(sweep_results.log, "warning") as warning:
+        results = load_sweep_results(tmpdir)
+    assert results["return_value"] == [1, 2]
+    assert "does not match the job dirs" in warning.call_args[0][0]
+
+
+def test_load_sweep_results_skipped_jobs_are_logged(tmpdir: Path) -> None:
+    run_multirun(lambda cfg: cfg.foo, ["foo=1,2", f"hydra.sweep.dir={tmpdir}"])
+    with mock.patch.object(sweep_results.log, "warning") as warning:
+        results = load_sweep_results(tmpdir)
+    assert results == {"working_dir": []}
+    assert "Skipped 2 of the 2 jobs" in warning.call_args[0][0]
+
+
+def test_load_job_return_without_configs(tmpdir: Path) -> None:
+    run_multirun(lambda cfg: cfg.foo, ["foo=1", f"hydra.sweep.dir={tmpdir}"])
+    job_dir = Path(str(tmpdir)) / "0"
+    # the configs are not read
+    os.remove(str(job_dir / ".hydra" / "hydra.yaml"))
+    os.remove(str(job_dir / ".hydra" / "config.yaml"))
+    job_return = load_job_return(job_dir, ".hydra", load_configs=False)
+    assert job_return is not None
+    assert job_return.task_name == "a_module"
+    assert job_return.return_value == 1
+    assert job_return.cfg is None and job_return.hydra_cfg is None
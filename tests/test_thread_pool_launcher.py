@@ -0,0 +1,110 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+from omegaconf import DictConfig
+
+from hydra._internal.hydra import Hydra
+from hydra.core.global_hydra import GlobalHydra
+from hydra.core.hydra_config import HydraConfig
+from hydra.core.utils import JobStatus
+from hydra.test_utils.launcher_common_tests import (
+    IntegrationTestSuite,
+    LauncherTestSuite,
+)
+
+# noinspection PyUnresolvedReferences
+from hydra.test_utils.test_utils import chdir_hydra_root, sweep_runner  # noqa: F401
+from hydra.utils import get_output_dir, to_absolute_path
+
+chdir_hydra_root()
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "launcher_name, overrides",
+    [("thread_pool", []), ("thread_pool", ["hydra.launcher.params.n_jobs=1"])],
+)
+class TestThreadPoolLauncher(LauncherTestSuite):
+    pass
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "task_launcher_cfg, extra_flags, plugin_module",
+    [
+        (
+            {
+                "defaults": [
+                    {"hydra/launcher": "thread_pool"},
+                    {"hydra/hydra_logging": "hydra_debug"},
+                    {"hydra/job_logging": "disabled"},
+                ]
+            },
+            ["-m"],
+            "hydra._internal.core_plugins.thread_pool_launcher",
+        )
+    ],
+)
+class TestThreadPoolLauncherIntegration(IntegrationTestSuite):
+    """
+    Run this launcher through the integration test suite.
+    """
+
+    # the jobs run without changing the working dir
+    workdir_prints = "hydra.utils.get_output_dir()"
+
+
+def test_jobs_run_concurrently_with_context_local_state(tmpdir: Path) -> None:
+    barrier = threading.Barrier(3, timeout=10)
+
+    def task_function(cfg: DictConfig) -> Any:
+        # all the jobs are running at the same time
+        barrier.wait()
+        if cfg.foo == 2:
+            raise ValueError("bad foo")
+        time.sleep(0.01 * cfg.foo)
+        return (
+            os.getcwd(),
+            get_output_dir(),
+            HydraConfig.instance().hydra.job.num,
+            to_absolute_path("data"),
+        )
+
+    hydra_ = Hydra.create_main_hydra_file_or_module(
+        calling_file=None,
+        calling_module="hydra.test_utils.a_module",
+        config_dir="configs",
+        strict=False,
+    )
+    try:
+        returns = hydra_.multirun(
+            config_file="compose.yaml",
+            task_function=task_function,
+            overrides=[
+                "hydra/launcher=thread_pool",
+                "hydra.launcher.params.n_jobs=3",
+                f"hydra.sweep.dir={tmpdir}",
+                "foo=1,2,3",
+            ],
+        )
+    finally:
+        GlobalHydra().clear()
+
+    results: List[Any] = returns[0]
+    assert [r.status for r in results] == [
+        JobStatus.COMPLETED,
+        JobStatus.FAILED,
+        JobStatus.COMPLETED,
+    ]
+    assert "bad foo" in results[1].error
+    for ret, num in zip((results[0], results[2]), (0, 2)):
+        cwd, output_dir, job_num, data = ret.return_value
+        assert cwd == os.getcwd()
+        assert output_dir == str(Path(str(tmpdir)) / str(num))
+        assert job_num == num
+        assert data == os.path.join(os.getcwd(), "data")
+        assert ret.hydra_cfg.hydra.runtime.output_dir == output_dir
+        assert (Path(output_dir) / "a_module.log").exists()
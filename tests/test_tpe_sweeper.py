@@ -0,0 +1,191 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+import math
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import pytest
+from omegaconf import DictConfig, OmegaConf
+
+from hydra._internal.core_plugins.basic_sweeper import parse_sweep_values
+from hydra._internal.core_plugins.tpe_sweeper import (
+    Dimension,
+    ParzenEstimator,
+    TPESweeper,
+    launcher_parallelism,
+)
+from hydra._internal.hydra import Hydra
+from hydra.core.global_hydra import GlobalHydra
+from hydra.core.utils import JobReturn, JobStatus
+from hydra.test_utils.test_utils import chdir_hydra_root
+
+chdir_hydra_root()
+
+SPACE = ["x=range(100)", "model=a,b,c", "y=1"]
+
+
+def objective(overrides: Sequence[str]) -> float:
+    values = dict(o.split("=", 1) for o in overrides)
+    penalty = {"a": 50, "b": 0, "c": 100}[values["model"]]
+    return (int(values["x"]) - 30) ** 2 + penalty
+
+
+def run_offline(sweeper: TPESweeper, arguments: List[str]) -> List[List[str]]:
+    """
+    Runs the sweep loop of the sweeper with the objective, without launching jobs
+    """
+    sweeper.set_search_space(arguments)
+    sweeper.launched_jobs = 0
+    batches = []
+    while not sweeper.is_done():
+        batch = [list(overrides) for overrides in sweeper.get_job_batch()]
+        results = []
+        for overrides in batch:
+            ret = JobReturn()
+            ret.status = JobStatus.COMPLETED
+            ret.overrides = overrides
+            ret.return_value = objective(overrides)
+            results.append(ret)
+        sweeper.launched_jobs += len(batch)
+        sweeper.update_results(results)
+        batches.append(batch)
+    return batches
+
+
+def test_parzen_estimator() -> None:
+    dim = Dimension("x", ["a", "b", "c"])
+    est = ParzenEstimator(dim, [0, 0, 1])
+    assert [math.exp(est.log_pdf(i)) for i in range(3)] == pytest.approx(
+        [3 / 6, 2 / 6, 1 / 6]
+    )
+    dim = Dimension("x", parse_sweep_values("range(20)"))
+    assert dim.numeric
+    est = ParzenEstimator(dim, [5, 6])
+    masses = [math.exp(est.log_pdf(i)) for i in range(20)]
+    assert sum(masses) == pytest.approx(1)
+    assert max(range(20), key=lambda i: masses[i]) in (5, 6)
+
+
+def test_same_suggestions_with_the_same_seed() -> None:
+    def suggestions(seed: int) -> List[List[str]]:
+        sweeper = TPESweeper(num_trials=30, batch_size=4, seed=seed)
+        return [o for batch in run_offline(sweeper, SPACE) for o in batch]
+
+    assert suggestions(1) == suggestions(1)
+    assert suggestions(1) != suggestions(2)
+
+
+def test_finds_better_configurations_than_random() -> None:
+    def best(num_startup_trials: int) -> float:
+        values = []
+        for seed in range(5):
+            sweeper = TPESweeper(
+                num_trials=40,
+                batch_size=4,
+                num_startup_trials=num_startup_trials,
+                seed=seed,
+            )
+            run_offline(sweeper, SPACE)
+            ret = sweeper.get_best()
+            assert ret is not None
+            values.append(ret[0])
+        return sum(values) / len(values)
+
+    tpe = best(num_startup_trials=8)
+    random_search = best(num_startup_trials=40)
+    assert tpe < random_search
+    assert tpe < 10
+
+
+def test_batches_are_diverse() -> None:
+    sweeper = TPESweeper(num_trials=48, batch_size=8, num_startup_trials=8)
+    batches = run_offline(sweeper, SPACE)
+    assert [len(batch) for batch in batches] == [8] * 6
+    for batch in batches:
+        assert len(set(tuple(o) for o in batch)) == len(batch)
+    assert all(o[2] == "y=1" for batch in batches for o in batch)
+
+
+def test_mode_max_and_metric() -> None:
+    sweeper = TPESweeper(num_trials=3, batch_size=3, metric="acc", mode="max")
+    sweeper.set_search_space(["x=1,2,3"])
+    batch = sweeper.get_job_batch()
+    results = []
+    for overrides in batch:
+        ret = JobReturn()
+        ret.status = JobStatus.COMPLETED
+        ret.return_value = {"acc": int(overrides[0][2:])}
+        results.append(ret)
+    sweeper.update_results(results)
+    assert sweeper.get_best() == (3, ["x=3"])
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "launcher, params, expected",
+    [
+        ("basic", {}, 1),
+        ("thread_pool", {"n_jobs": 3}, 3),
+        ("asyncio", {"max_concurrency": 5}, 5),
+        # the number of CPUs of the machine
+        ("process_pool", {"n_jobs": None}, None),
+    ],
+)
+def test_launcher_parallelism(
+    launcher: str, params: Dict[str, Any], expected: Optional[int]
+) -> None:
+    cfg = OmegaConf.create({"hydra": {"launcher": {"class": launcher}}})
+    if params:
+        cfg.hydra.launcher.params = params
+    assert launcher_parallelism(cfg) == expected
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "params",
+    [
+        {"num_trials": 0},
+        {"batch_size": 0},
+        {"gamma": 1.0},
+        {"num_candidates": 0},
+        {"mode": "best"},
+    ],
+)
+def test_invalid_params(params: Dict[str, Any]) -> None:
+    with pytest.raises(ValueError):
+        TPESweeper(**params)
+
+
+def test_tpe_sweep(tmpdir: Path) -> None:
+    def task_function(cfg: DictConfig) -> Any:
+        return objective([f"x={cfg.x}", f"model={cfg.model}"])
+
+    hydra_ = Hydra.create_main_hydra_file_or_module(
+        calling_file=None,
+        calling_module="hydra.test_utils.a_module",
+        config_dir="configs",
+        strict=False,
+    )
+    try:
+        returns = hydra_.multirun(
+            config_file="compose.yaml",
+            task_function=task_function,
+            overrides=[
+                "hydra/sweeper=tpe",
+                "hydra/launcher=thread_pool",
+                "hydra.launcher.params.n_jobs=4",
+                "hydra.sweeper.params.num_trials=10",
+                "hydra.sweeper.params.num_startup_trials=4",
+                "hydra/job_logging=disabled",
+                f"hydra.sweep.dir={tmpdir}",
+                "x=range(100)",
+                "model=a,b,c",
+            ],
+        )
+    finally:
+        GlobalHydra().clear()
+    # batches are sized to the launcher
+    assert [len(batch) for batch in returns] == [4, 4, 2]
+    assert [r.hydra_cfg.hydra.job.num for batch in returns for r in batch] == list(
+        range(10)
+    )
+    best = min(r.return_value for batch in returns for r in batch)
+    results = OmegaConf.load(str(Path(str(tmpdir)) / "optimization_results.yaml"))
+    assert results.best_evaluated_result == best
@@ -130,3 +130,16 @@ def test_to_absolute_path(orig_cwd: str, path: str, expected: str) -> None:
     assert isinstance(cfg, DictConfig)
     HydraConfig().set_config(cfg)
     assert utils.to_absolute_path(path) == expected
+
+
+def test_context_config_overrides_process_config() -> None:
+    HydraConfig().set_config(
+        OmegaConf.create({"hydra": {"runtime": {"cwd": "/process"}}})
+    )
+    job_cfg = OmegaConf.create({"hydra": {"runtime": {"cwd": "/job"}}})
+    token = HydraConfig.instance().set_context_config(job_cfg)
+    try:
+        assert utils.get_original_cwd() == "/job"
+    finally:
+        HydraConfig.instance().reset_context_config(token)
+    assert utils.get_original_cwd() == "/process"
@@ -0,0 +1,203 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+from omegaconf import DictConfig, OmegaConf
+
+from hydra._internal.hydra import Hydra
+from hydra._internal.work_queue import (
+    PENDING,
+    WorkQueue,
+    load_task_function,
+    task_reference,
+)
+from hydra.core.global_hydra import GlobalHydra
+from hydra.core.utils import JobReturn, JobStatus
+from hydra.test_utils.launcher_common_tests import (
+    IntegrationTestSuite,
+    LauncherTestSuite,
+)
+
+# noinspection PyUnresolvedReferences
+from hydra.test_utils.test_utils import chdir_hydra_root, sweep_runner  # noqa: F401
+from hydra.types import TaskFunction
+from tests.test_apps.work_queue_app.my_app import my_app
+
+chdir_hydra_root()
+
+local_workers = [
+    "hydra.launcher.params.local_workers=2",
+    "hydra.launcher.params.poll_interval=0.05",
+]
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "launcher_name, overrides", [("work_queue", local_workers)]
+)
+class TestWorkQueueLauncher(LauncherTestSuite):
+    pass
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "task_launcher_cfg, extra_flags, plugin_module",
+    [
+        (
+            {
+                "defaults": [
+                    {"hydra/launcher": "work_queue"},
+                    {"hydra/hydra_logging": "hydra_debug"},
+                    {"hydra/job_logging": "disabled"},
+                ]
+            },
+            ["-m"] + local_workers,
+            "hydra._internal.core_plugins.work_queue_launcher",
+        )
+    ],
+)
+class TestWorkQueueLauncherIntegration(IntegrationTestSuite):
+    """
+    Run this launcher through the integration test suite.
+    """
+
+    pass
+
+
+def test_expired_jobs_are_requeued(tmpdir: Path) -> None:
+    queue = WorkQueue(str(Path(str(tmpdir)) / "queue.sqlite"))
+    configs = [(i, OmegaConf.create({"foo": i})) for i in range(2)]
+    batch = queue.submit(my_app, configs)
+    claimed = queue.claim("worker1")
+    assert claimed is not None
+    job_id, reference, config = claimed
+    assert config == {"foo": 0}
+    assert load_task_function(reference)(config) == (os.getpid(), 0)
+    assert queue.requeue_expired(batch, timeout=60) == []
+    # worker1 stops sending heartbeats
+    assert queue.requeue_expired(batch, timeout=-1) == [(0, "worker1", False)]
+    rows = queue.conn.execute("SELECT status FROM jobs ORDER BY id").fetchall()
+    assert rows == [(PENDING,), (PENDING,)]
+
+    claimed = queue.claim("worker2")
+    assert claimed is not None and claimed[0] == job_id
+    ret = JobReturn()
+    ret.return_value = 42
+    # worker1 was too slow, the job is running on worker2 now
+    stale = JobReturn()
+    stale.return_value = 0
+    assert not queue.complete(job_id, "worker1", stale)
+    assert queue.complete(job_id, "worker2", ret)
+    assert {idx: r.return_value for idx, r in queue.results(batch).items()} == {0: 42}
+    queue.remove(batch)
+    queue.close()
+
+
+def _multirun_work_queue(
+    tmpdir: Path, task_function: TaskFunction, overrides: List[str]
+) -> Any:
+    hydra_ = Hydra.create_main_hydra_file_or_module(
+        calling_file=None,
+        calling_module="hydra.test_utils.a_module",
+        config_dir="configs",
+        strict=False,
+    )
+    try:
+        return hydra_.multirun(
+            config_file="compose.yaml",
+            task_function=task_function,
+            overrides=[
+                "hydra/launcher=work_queue",
+                "hydra.launcher.params.poll_interval=0.05",
+                "hydra.launcher.params.heartbeat_timeout=0.5",
+                f"hydra.sweep.dir={tmpdir}",
+            ]
+            + overrides,
+        )
+    finally:
+        GlobalHydra().clear()
+
+
+def test_job_killing_its_worker_fails_after_max_attempts(tmpdir: Path) -> None:
+    def task_function(cfg: DictConfig) -> Any:
+        if cfg.foo == 1:
+            os._exit(1)
+        return cfg.foo
+
+    returns = _multirun_work_queue(
+        tmpdir,
+        task_function,
+        [
+            "hydra.launcher.params.local_workers=2",
+            "hydra.launcher.params.max_attempts=1",
+            "foo=1,2",
+        ],
+    )
+    results: List[Any] = returns[0]
+    assert [r.status for r in results] == [JobStatus.FAILED, JobStatus.COMPLETED]
+    assert "lost its worker 1 times" in results[0].error
+    assert results[1].return_value == 2
+
+
+def test_launcher_fails_when_all_local_workers_died(tmpdir: Path) -> None:
+    def task_function(cfg: DictConfig) -> Any:
+        os._exit(1)
+
+    with pytest.raises(RuntimeError, match="local workers died"):
+        _multirun_work_queue(
+            tmpdir, task_function, ["hydra.launcher.params.local_workers=1", "foo=1,2"],
+        )
+
+
+def test_task_reference() -> None:
+    reference = task_reference(my_app)
+    assert reference["module"] == "tests.test_apps.work_queue_app.my_app"
+    assert reference["qualname"] == "my_app"
+    with pytest.raises(ValueError):
+
+        def local_function() -> None:
+            pass
+
+        load_task_function(task_reference(local_function))
+
+
+def test_external_worker(tmpdir: Path) -> None:
+    queue_file = str(Path(str(tmpdir)) / "queue.sqlite")
+    worker = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "hydra._internal.work_queue",
+            queue_file,
+            "--poll-interval=0.05",
+            "--idle-timeout=2",
+        ]
+    )
+    hydra_ = Hydra.create_main_hydra_file_or_module(
+        calling_file=None,
+        calling_module="hydra.test_utils.a_module",
+        config_dir="configs",
+        strict=False,
+    )
+    try:
+        returns = hydra_.multirun(
+            config_file="compose.yaml",
+            task_function=my_app,
+            overrides=[
+                "hydra/launcher=work_queue",
+                f"hydra.launcher.params.queue_file={queue_file}",
+                "hydra.launcher.params.poll_interval=0.05",
+                f"hydra.sweep.dir={tmpdir}",
+                "foo=1,2",
+            ],
+        )
+    finally:
+        GlobalHydra().clear()
+        assert worker.wait(timeout=60) == 0
+
+    results: List[Any] = returns[0]
+    assert [r.status for r in results] == [JobStatus.COMPLETED] * 2
+    assert [r.return_value for r in results] == [(worker.pid, 1), (worker.pid, 2)]
+    assert [r.hydra_cfg.hydra.job.num for r in results] == [0, 1]